@@ -6,6 +6,7 @@ import astropy.units as u
 import numpy as np
 import pytest
 from astropy.coordinates import SkyCoord
+from astropy.nddata import StdDevUncertainty
 from astropy.time import Time, TimeDelta
 from astropy.wcs import WCS
 
@@ -296,6 +297,17 @@ def ndcube_4d_mask(wcs_4d_t_l_lt_ln):
     return NDCube(data_cube, wcs=wcs_4d_t_l_lt_ln, uncertainty=uncertainty, mask=mask)
 
 
+@pytest.fixture
+def ndcube_4d_dask(wcs_4d_t_l_lt_ln):
+    da = pytest.importorskip("dask.array")
+    shape = (5, 8, 10, 12)
+    data_cube = da.from_array(data_nd(shape) + 1., chunks=(1, 8, 10, 12))
+    uncertainty = StdDevUncertainty(da.sqrt(data_cube))
+    mask = data_cube > 100
+    return NDCube(data_cube, wcs=wcs_4d_t_l_lt_ln, uncertainty=uncertainty, mask=mask,
+                  unit=u.ct)
+
+
 @pytest.fixture
 def ndcube_4d_extra_coords(wcs_4d_t_l_lt_ln, simple_extra_coords_3d):
     shape = (5, 8, 10, 12)
@@ -4,17 +4,80 @@ from numbers import Integral
 from functools import reduce
 
 import astropy.units as u
+import numpy as np
 from astropy.coordinates import SkyCoord
 from astropy.time import Time
 from astropy.wcs.wcsapi import BaseHighLevelWCS, BaseLowLevelWCS
 from astropy.wcs.wcsapi.wrappers.sliced_wcs import SlicedLowLevelWCS, sanitize_slices
 
+from ndcube.wcs.wrappers import ResampledLowLevelWCS
+
 from .lookup_table_coord import (BaseTableCoordinate, MultipleTableCoordinate, QuantityTableCoordinate,
                                  SkyCoordTableCoordinate, TimeTableCoordinate)
 
 __all__ = ['ExtraCoords']
 
 
+def _slice_lookup_tables(lookup_tables, item):
+    """
+    Apply an array slice to a list of ``(array_dimension, table_coordinate)`` pairs.
+
+    Returns the sliced lookup tables and the tables which were sliced to scalars.
+    """
+    dropped_tables = set()
+    new_lookup_tables = set()
+    for lut_axis, lut in lookup_tables:
+        lut_axes = (lut_axis,) if not isinstance(lut_axis, tuple) else lut_axis
+        lut_slice = tuple(item[i] for i in lut_axes) if isinstance(item, tuple) else item
+        if isinstance(lut_slice, tuple) and len(lut_slice) == 1:
+            lut_slice = lut_slice[0]
+
+        sliced_lut = lut[lut_slice]
+
+        if sliced_lut.is_scalar():
+            dropped_tables.add(sliced_lut)
+        else:
+            new_lookup_tables.add((lut_axis, sliced_lut))
+
+    return list(new_lookup_tables), list(dropped_tables)
+
+
+def _compose_slices(lookup_tables, first, second):
+    """
+    Combine two array slices of some lookup tables into one.
+
+    Returns an item which, applied to ``lookup_tables``, gives the same tables
+    as applying ``first`` and then ``second``, or `None` if the slices can not
+    be combined. This is only possible if ``first`` slices, rather than indexes,
+    all the array axes of the tables, as indexing drops axes of the tables.
+    """
+    if not (isinstance(first, tuple) and isinstance(second, tuple)):
+        return None
+
+    lengths = {}
+    for lut_axis, lut in lookup_tables:
+        lut_axes = (lut_axis,) if not isinstance(lut_axis, tuple) else lut_axis
+        shape = lut._table_shape
+        if len(shape) != len(lut_axes):
+            return None
+        for axis, length in zip(lut_axes, shape):
+            if lengths.setdefault(axis, length) != length:
+                return None
+
+    composed = list(second)
+    for axis, length in lengths.items():
+        if axis >= len(first) or axis >= len(second):
+            return None
+        if not (isinstance(first[axis], slice) and isinstance(second[axis], (slice, Integral))):
+            return None
+        indices = range(length)[first[axis]][second[axis]]
+        if isinstance(indices, range):
+            # A negative stop of a range means it runs to the start of the axis.
+            indices = slice(indices.start, indices.stop if indices.stop >= 0 else None, indices.step)
+        composed[axis] = indices
+    return tuple(composed)
+
+
 class ExtraCoordsABC(abc.ABC):
     """
     A representation of additional world coordinates associated with pixel axes.
@@ -136,8 +199,11 @@ class ExtraCoords(ExtraCoordsABC):
         self._mapping = None
         # Lookup tables is a list of (pixel_dim, LookupTableCoord) to allow for
         # one pixel dimension having more than one lookup coord.
-        self._lookup_tables = list()
-        self._dropped_tables = list()
+        self._tables = list()
+        self._dropped = list()
+        # The unsliced lookup tables and the array slice still to be applied to them.
+        self._pending_slice = None
+        self._cached_table_coordinate = None
 
         # Set values using the setters for validation
         self.wcs = wcs
@@ -209,6 +275,62 @@ class ExtraCoords(ExtraCoordsABC):
         self._lookup_tables = list(sorted(self._lookup_tables,
                                           key=lambda x: x[0] if isinstance(x[0], int) else x[0][0]))
 
+    def _apply_pending_slice(self):
+        pending_slice = self._pending_slice
+        if pending_slice is not None:
+            # Only clear the pending slice once the sliced tables are set, so that
+            # a concurrent reader always sees one or the other.
+            self._tables, self._dropped = _slice_lookup_tables(*pending_slice)
+            self._pending_slice = None
+
+    def _pending_world_axes(self):
+        """
+        The world axes of the lookup tables once the pending slice is applied, found without applying it.
+
+        Returns the physical type of each world axis and the pixel dimensions it
+        is correlated with, or `None` if this can not be found without slicing
+        the tables, i.e. if a multi-dimensional table is indexed along some but
+        not all of its axes.
+        """
+        lookup_tables, item = self._pending_slice
+        if not isinstance(item, tuple):
+            return None
+        world_axes = []
+        for lut_axis, lut in lookup_tables:
+            lut_axes = (lut_axis,) if not isinstance(lut_axis, tuple) else lut_axis
+            indexed = [i < len(item) and isinstance(item[i], Integral) for i in lut_axes]
+            if all(indexed):
+                # The table is sliced to a scalar, so is dropped.
+                continue
+            if any(indexed):
+                return None
+            wcs = lut.wcs
+            for physical_type, correlation in zip(wcs.world_axis_physical_types,
+                                                  wcs.axis_correlation_matrix):
+                world_axes.append((physical_type,
+                                   tuple(lut_axes[j] for j in np.nonzero(correlation)[0])))
+        return world_axes
+
+    @property
+    def _lookup_tables(self):
+        self._apply_pending_slice()
+        return self._tables
+
+    @_lookup_tables.setter
+    def _lookup_tables(self, lookup_tables):
+        self._apply_pending_slice()
+        self._tables = lookup_tables
+
+    @property
+    def _dropped_tables(self):
+        self._apply_pending_slice()
+        return self._dropped
+
+    @_dropped_tables.setter
+    def _dropped_tables(self, dropped_tables):
+        self._apply_pending_slice()
+        self._dropped = dropped_tables
+
     @property
     def _name_lut_map(self):
         """
@@ -264,11 +386,28 @@ class ExtraCoords(ExtraCoordsABC):
         if not self._lookup_tables:
             return None
 
-        tcoords = set(lt[1] for lt in self._lookup_tables)
+        return self._table_coordinate.wcs
+
+    @property
+    def _table_coordinate(self):
+        """
+        The `.MultipleTableCoordinate` combining the lookup tables.
+
+        This is cached until a lookup table is added or replaced, so its model
+        and WCS are only generated once.
+        """
         # created a sorted list of unique items
         _tmp = set()  # a temporary set
         tcoords = [x[1] for x in self._lookup_tables if x[1] not in _tmp and _tmp.add(x[1]) is None]
-        return MultipleTableCoordinate(*tcoords).wcs
+
+        cached = self._cached_table_coordinate
+        if (cached is not None and len(cached[0]) == len(tcoords)
+                and all(old is new for old, new in zip(cached[0], tcoords))):
+            return cached[1]
+
+        table_coordinate = MultipleTableCoordinate(*tcoords)
+        self._cached_table_coordinate = (tcoords, table_coordinate)
+        return table_coordinate
 
     @wcs.setter
     def wcs(self, wcs):
@@ -307,26 +446,24 @@ class ExtraCoords(ExtraCoordsABC):
         """
         Apply an array slice to the lookup tables.
 
-        Returns a new ExtraCoords object with modified lookup tables.
+        Returns a new ExtraCoords object which slices the lookup tables the
+        first time they are used, so slicing an NDCube does not create new
+        tables unless their coordinates are needed. Slicing such an object
+        combines the two slices where possible, so the tables are only sliced once.
         """
-        dropped_tables = set()
-        new_lookup_tables = set()
-        for lut_axis, lut in self._lookup_tables:
-            lut_axes = (lut_axis,) if not isinstance(lut_axis, tuple) else lut_axis
-            lut_slice = tuple(item[i] for i in lut_axes) if isinstance(item, tuple) else item
-            if isinstance(lut_slice, tuple) and len(lut_slice) == 1:
-                lut_slice = lut_slice[0]
+        new_extra_coords = type(self)()
 
-            sliced_lut = lut[lut_slice]
+        if self._pending_slice is not None:
+            lookup_tables, pending_item = self._pending_slice
+            composed = _compose_slices(lookup_tables, pending_item, item)
+            if composed is not None:
+                new_extra_coords._pending_slice = (lookup_tables, composed)
+                return new_extra_coords
 
-            if sliced_lut.is_scalar():
-                dropped_tables.add(sliced_lut)
-            else:
-                new_lookup_tables.add((lut_axis, sliced_lut))
+        if not self._lookup_tables:
+            return self
 
-        new_extra_coords = type(self)()
-        new_extra_coords._lookup_tables = list(new_lookup_tables)
-        new_extra_coords._dropped_tables = list(dropped_tables)
+        new_extra_coords._pending_slice = (list(self._lookup_tables), item)
         return new_extra_coords
 
     def _getitem_wcs(self, item):
@@ -351,13 +488,41 @@ class ExtraCoords(ExtraCoordsABC):
         if self._wcs:
             return self._getitem_wcs(item)
 
-        elif self._lookup_tables:
+        elif self._pending_slice is not None or self._tables:
             return self._getitem_lookup_tables(item)
 
         # If we get here this object is empty, so just return an empty extra coords
         # This is done to simplify the slicing in NDCube
         return self
 
+    def resample(self, factor):
+        """
+        Resample the extra coords as if the array pixels were combined in blocks.
+
+        Parameters
+        ----------
+        factor: `tuple` of `int`
+            The number of array elements in a block along each array axis.
+
+        Returns
+        -------
+        `ndcube.extra_coords.ExtraCoords`
+            The extra coords evaluated at the centres of the blocks.
+        """
+        if self._wcs is not None:
+            factors = [factor[i] for i in self.mapping]
+            wcs = ResampledLowLevelWCS(getattr(self._wcs, "low_level_wcs", self._wcs), factors,
+                                       offset=[(f - 1) / 2 for f in factors])
+            return type(self)(wcs=wcs, mapping=self.mapping)
+
+        new_extra_coords = type(self)()
+        for lut_axis, lut in self._lookup_tables:
+            lut_axes = (lut_axis,) if not isinstance(lut_axis, tuple) else lut_axis
+            new_extra_coords._lookup_tables.append(
+                (lut_axis, lut.resample(tuple(factor[i] for i in lut_axes))))
+        new_extra_coords._dropped_tables = list(self._dropped_tables)
+        return new_extra_coords
+
     @property
     def dropped_world_dimensions(self):
         """
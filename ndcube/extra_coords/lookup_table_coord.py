@@ -1,5 +1,6 @@
 import abc
 import copy
+import itertools
 from numbers import Integral
 from collections import defaultdict
 
@@ -8,7 +9,7 @@ import gwcs
 import gwcs.coordinate_frames as cf
 import numpy as np
 from astropy.coordinates import SkyCoord
-from astropy.modeling import models
+from astropy.modeling import Model, models
 from astropy.modeling.models import tabular_model
 from astropy.time import Time
 
@@ -40,15 +41,179 @@ def _generate_generic_frame(naxes, unit, names=None, physical_types=None):
                               axes_names=names, name=name, axis_physical_types=physical_types)
 
 
-def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, **kwargs):
+def _interpolate_grid(points, table, coords, fill_value):
+    """
+    Linearly interpolate a table defined on a regular grid.
+
+    Parameters
+    ----------
+    points: `list` of `numpy.ndarray`
+        The ascending coordinates of the grid along each axis of ``table``.
+    table: `numpy.ndarray`
+        The values on the grid.
+    coords: `list` of `numpy.ndarray`
+        The broadcast coordinates, one array per axis of ``table``, at which to interpolate.
+    fill_value: `float`
+        The value of coordinates outside the grid.
+    """
+    dtype = np.result_type(table.dtype, float)
+    valid = np.ones(coords[0].shape, dtype=bool)
+    for axis_points, coord in zip(points, coords):
+        valid &= (coord >= axis_points[0]) & (coord <= axis_points[-1])
+    # Move coordinates outside the grid, including NaNs, onto it so they can be
+    # evaluated like the others before being replaced by the fill value.
+    coords = [np.where(valid, coord, axis_points[0]) for axis_points, coord in zip(points, coords)]
+    # Whether the grid points along each axis are the array indices, as for pixel grids.
+    index_grid = [np.array_equal(axis_points, np.arange(len(axis_points))) for axis_points in points]
+
+    if all(index_grid) and all(np.array_equal(coord, np.floor(coord)) for coord in coords):
+        # The coordinates are grid points so no interpolation is needed.
+        result = table[tuple(coord.astype(int) for coord in coords)]
+
+    elif table.ndim == 1 and not index_grid[0]:
+        result = np.interp(coords[0], points[0], table)
+
+    else:
+        lower, weights = [], []
+        for axis_points, coord, is_index in zip(points, coords, index_grid):
+            # Find the grid cell containing each coordinate. Coordinates on the last
+            # grid point belong to the last cell.
+            last_cell = max(len(axis_points) - 2, 0)
+            if is_index:
+                index = np.minimum(coord.astype(int), last_cell)
+            else:
+                index = np.clip(np.searchsorted(axis_points, coord, side="right") - 1, 0, last_cell)
+            upper = np.minimum(index + 1, len(axis_points) - 1)
+            spacing = axis_points[upper] - axis_points[index]
+            lower.append(index)
+            weights.append(np.divide(coord - axis_points[index], spacing,
+                                     out=np.zeros(coord.shape), where=spacing != 0))
+        result = np.zeros(coords[0].shape, dtype=dtype)
+        for corner in itertools.product((0, 1), repeat=table.ndim):
+            corner_index = tuple(np.minimum(index + offset, n - 1)
+                                 for index, offset, n in zip(lower, corner, table.shape))
+            corner_weight = 1
+            for weight, offset in zip(weights, corner):
+                corner_weight = corner_weight * (weight if offset else 1 - weight)
+            result += corner_weight * table[corner_index]
+
+    result = result.astype(dtype, copy=False)
+    if not valid.all():
+        result = np.where(valid, result, fill_value)
+    return result
+
+
+class _FastTabularMixin:
+    """
+    Evaluate linearly interpolated tabular models without `scipy.interpolate.interpn`.
+
+    Coordinates which fall on the grid points are looked up directly, 1-D tables
+    are interpolated with `numpy.interp` and N-D tables by multilinear interpolation
+    on the regular grid. The same evaluator is used by the inverse of 1-D models.
+    Other interpolation methods, extrapolation and ``bounds_error=True``
+    are delegated to `~astropy.modeling.tabular.Tabular1D` and friends.
+    """
+    def evaluate(self, *inputs):
+        if self.method != 'linear' or self.bounds_error or self.fill_value is None:
+            return super().evaluate(*inputs)
+
+        points = [np.asarray(getattr(p, "value", p)) for p in self.points]
+        points_unit = getattr(self.points[0], "unit", None)
+        inputs = np.broadcast_arrays(*[inp.to_value(points_unit)
+                                       if points_unit is not None and isinstance(inp, u.Quantity)
+                                       else np.asarray(inp) for inp in inputs[:self.n_inputs]])
+        result = _interpolate_grid(points, np.asarray(getattr(self.lookup_table, "value",
+                                                              self.lookup_table)),
+                                   inputs, self.fill_value)
+
+        # As for the astropy models, the table unit is only applied when the points have none.
+        if isinstance(self.lookup_table, u.Quantity) and points_unit is None:
+            result = result * self.lookup_table.unit
+        return result
+
+    # The sorted table values and their pixel coordinates used to invert a 1-D model,
+    # see `_inverse_index`. None if the model cannot be inverted.
+    _inverse_index = None
+
+    # Astropy models wrap their default inverse as ``_inverse`` so that ``model.inverse``
+    # can still be assigned a user-supplied inverse.
+    def _inverse(self):
+        if self.n_inputs != 1:
+            return super()._inverse()
+        if self._inverse_index is None:
+            raise NotImplementedError("This lookup table cannot be inverted because its values "
+                                      "are not strictly increasing or decreasing.")
+        values, pixels = self._inverse_index
+        inverse = _Tabular1D(points=(values,), lookup_table=pixels, method=self.method,
+                             bounds_error=self.bounds_error, fill_value=self.fill_value)
+        inverse._inverse_index = (self.points[0], self.lookup_table)
+        return inverse
+
+
+class _Tabular1D(_FastTabularMixin, models.Tabular1D):
+    pass
+
+
+class _Tabular2D(_FastTabularMixin, models.Tabular2D):
+    pass
+
+
+_TABULAR_CLASSES = {1: _Tabular1D, 2: _Tabular2D}
+
+
+def _tabular_class(ndim):
+    # Classes of higher dimensions are created once and looked up by name through the
+    # module ``__getattr__`` so that, like the ones defined above, they can be pickled.
+    if ndim not in _TABULAR_CLASSES:
+        _TABULAR_CLASSES[ndim] = type(f"_Tabular{ndim}D",
+                                      (_FastTabularMixin, tabular_model(ndim, name=f"Tabular{ndim}D")),
+                                      {"__module__": __name__})
+    return _TABULAR_CLASSES[ndim]
+
+
+def __getattr__(name):
+    ndim = name[len("_Tabular"):-len("D")]
+    if name.startswith("_Tabular") and name.endswith("D") and ndim.isdigit():
+        return _tabular_class(int(ndim))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _inverse_index(lookup_table, points_unit=u.pix):
+    """
+    Sort a 1-D lookup table so that world coordinates can be converted to pixel coordinates.
+
+    Returns
+    -------
+    index: `tuple` or `None`
+        The table values in ascending order and the pixel coordinate of each,
+        so that the pixel coordinate of any world value can be found by a binary search.
+        None if the table is not 1-D or its values are not strictly increasing or decreasing,
+        in which case a world value can correspond to more than one pixel.
+    """
+    if lookup_table.ndim != 1:
+        return None
+    pixels = np.arange(lookup_table.size) * points_unit
+    steps = np.diff(lookup_table)
+    if np.all(steps > 0):
+        return lookup_table, pixels
+    if np.all(steps < 0):
+        return lookup_table[::-1], pixels[::-1]
+    return None
+
+
+def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, inverse_index=None,
+                      **kwargs):
     """
     Generate a Tabular model class and instance.
+
+    ``inverse_index`` is the output of `_inverse_index` for ``lookup_table``,
+    which is computed if not given.
     """
     if not isinstance(lookup_table, u.Quantity):
         raise TypeError("lookup_table must be a Quantity.")  # pragma: no cover
 
     ndim = lookup_table.ndim
-    TabularND = tabular_model(ndim, name=f"Tabular{ndim}D")
+    TabularND = _tabular_class(ndim)
 
     # The integer location is at the centre of the pixel.
     points = [(np.arange(size) - 0) * points_unit for size in lookup_table.shape]
@@ -63,6 +228,8 @@ def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, *
     }
 
     t = TabularND(points, lookup_table, **kwargs)
+    if ndim == 1:
+        t._inverse_index = inverse_index or _inverse_index(lookup_table, points_unit)
 
     # TODO: Remove this when there is a new gWCS release
     # Work around https://github.com/spacetelescope/gwcs/pull/331
@@ -71,13 +238,14 @@ def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, *
     return t
 
 
-def _generate_compound_model(*lookup_tables, mesh=True):
+def _generate_compound_model(*lookup_tables, mesh=True, inverse_indices=None):
     """
     Takes a set of quantities and returns a ND compound model.
     """
-    model = _generate_tabular(lookup_tables[0])
-    for lt in lookup_tables[1:]:
-        model = model & _generate_tabular(lt)
+    inverse_indices = inverse_indices or [None] * len(lookup_tables)
+    model = _generate_tabular(lookup_tables[0], inverse_index=inverse_indices[0])
+    for lt, inverse_index in zip(lookup_tables[1:], inverse_indices[1:]):
+        model = model & _generate_tabular(lt, inverse_index=inverse_index)
 
     if mesh:
         return model
@@ -87,11 +255,63 @@ def _generate_compound_model(*lookup_tables, mesh=True):
     return models.Mapping(mapping) | model
 
 
-def _model_from_quantity(lookup_tables, mesh=False):
+def _model_from_quantity(lookup_tables, mesh=False, inverse_indices=None):
     if len(lookup_tables) > 1:
-        return _generate_compound_model(*lookup_tables, mesh=mesh)
+        return _generate_compound_model(*lookup_tables, mesh=mesh, inverse_indices=inverse_indices)
+
+    return _generate_tabular(lookup_tables[0],
+                             inverse_index=inverse_indices[0] if inverse_indices else None)
+
+
+class _CoupleNaN(Model):
+    """
+    Return the inputs, set to NaN wherever any one of them is NaN.
+
+    The components of a mesh are evaluated by independent 1D models, so this is
+    used to give NaN for all of them outside the table, as the full grid would.
+    """
+    def __init__(self, n_inputs, name=None, meta=None):
+        self._n_inputs = n_inputs
+        super().__init__(name=name, meta=meta)
+
+    @property
+    def n_inputs(self):
+        return self._n_inputs
+
+    @property
+    def n_outputs(self):
+        return self._n_inputs
+
+    def evaluate(self, *inputs):
+        invalid = np.logical_or.reduce([np.isnan(inp) for inp in inputs])
+        if not invalid.any():
+            return inputs
+        return tuple(np.where(invalid, np.nan, inp) for inp in inputs)
 
-    return _generate_tabular(lookup_tables[0])
+    @property
+    def inverse(self):
+        return type(self)(self.n_inputs)
+
+
+def _resample_table(table, factors):
+    """
+    Linearly interpolate an array to the centres of blocks of pixels.
+
+    Blocks are ``factors[i]`` pixels long along axis ``i``. Trailing pixels which
+    do not fill a block are discarded. The interpolation is done one axis at a time,
+    which for points on a grid is equivalent to multilinear interpolation.
+    """
+    for axis, factor in enumerate(factors):
+        if factor == 1:
+            continue
+        n_pixels = table.shape[axis]
+        positions = np.arange(n_pixels // factor) * factor + (factor - 1) / 2
+        lower = np.floor(positions).astype(int)
+        upper = np.minimum(lower + 1, n_pixels - 1)
+        weights = (positions - lower).reshape([-1 if i == axis else 1 for i in range(table.ndim)])
+        lower_values = np.take(table, lower, axis=axis)
+        table = lower_values + (np.take(table, upper, axis=axis) - lower_values) * weights
+    return table
 
 
 class BaseTableCoordinate(abc.ABC):
@@ -113,6 +333,34 @@ class BaseTableCoordinate(abc.ABC):
         self.physical_types = physical_types if not isinstance(physical_types, str) else [physical_types]
         self._dropped_world_dimensions = defaultdict(list)
         self._dropped_world_dimensions["world_axis_object_classes"] = dict()
+        self._cache = {}
+
+    def __getstate__(self):
+        # The cached models may be instances of classes which can not be pickled.
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+    def _cache_state(self):
+        # The objects which determine the model, frame and wcs.
+        return (self.table, self.mesh, self.names, self.physical_types)
+
+    def _get_cached(self, name, compute):
+        """
+        Return the model, frame or wcs, generating it only if the table has changed.
+
+        The value is regenerated whenever the table, names, physical types or
+        mesh of this coordinate are replaced. Changes made in place to these
+        objects are not detected.
+        """
+        state = self._cache_state()
+        cached = self._cache.get(name)
+        if (cached is not None and len(cached[0]) == len(state)
+                and all(old is new for old, new in zip(cached[0], state))):
+            return cached[1]
+        value = compute()
+        self._cache[name] = (state, value)
+        return value
 
     @abc.abstractmethod
     def __getitem__(self, item):
@@ -143,6 +391,13 @@ class BaseTableCoordinate(abc.ABC):
         Number of pixel dimensions in this table.
         """
 
+    @property
+    @abc.abstractmethod
+    def _table_shape(self):
+        """
+        The length of each of the dimensions indexed by ``__getitem__``.
+        """
+
     @abc.abstractmethod
     def is_scalar(self):
         """
@@ -153,24 +408,51 @@ class BaseTableCoordinate(abc.ABC):
         """
 
     @property
-    @abc.abstractmethod
     def frame(self):
         """
-        Generate the Frame for this LookupTable.
+        The gWCS Frame for this LookupTable.
         """
+        return self._get_cached("frame", self._generate_frame)
 
     @property
-    @abc.abstractmethod
     def model(self):
         """
-        Generate the Astropy Model for this LookupTable.
+        The Astropy Model for this LookupTable.
         """
+        return self._get_cached("model", self._generate_model)
 
     @property
     def wcs(self):
         """
         A gWCS object representing all the coordinates.
         """
+        return self._get_cached("wcs", self._generate_wcs)
+
+    @abc.abstractmethod
+    def _generate_frame(self):
+        """
+        Generate the Frame for this LookupTable.
+        """
+
+    @abc.abstractmethod
+    def _generate_model(self):
+        """
+        Generate the Astropy Model for this LookupTable.
+        """
+
+    @property
+    def _inverse_indices(self):
+        """
+        The sorted tables used to invert each 1-D table, see `_inverse_index`.
+
+        These are computed once per table and shared by every model generated from it.
+        """
+        return self._get_cached("inverse_indices", self._generate_inverse_indices)
+
+    def _generate_inverse_indices(self):
+        return None
+
+    def _generate_wcs(self):
         model = self.model
         return gwcs.WCS(forward_transform=model,
                         input_frame=_generate_generic_frame(model.n_inputs, u.pix),
@@ -180,6 +462,25 @@ class BaseTableCoordinate(abc.ABC):
     def dropped_world_dimensions(self):
         return self._dropped_world_dimensions
 
+    def resample(self, factors):
+        """
+        Resample the table as if its pixels were combined in blocks.
+
+        The new table holds the coordinates at the centres of the blocks,
+        linearly interpolated from the original table, consistent with a
+        `~ndcube.wcs.wrappers.ResampledLowLevelWCS` wrapping the table's WCS.
+
+        Parameters
+        ----------
+        factors: `tuple` of `int`
+            The number of pixels in a block along each axis of the table.
+
+        Returns
+        -------
+        `BaseTableCoordinate`
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support resampling.")
+
 
 class QuantityTableCoordinate(BaseTableCoordinate):
     """
@@ -214,6 +515,9 @@ class QuantityTableCoordinate(BaseTableCoordinate):
 
         super().__init__(*tables, mesh=mesh, names=names, physical_types=physical_types)
 
+    def _generate_inverse_indices(self):
+        return [_inverse_index(t) for t in self.table]
+
     def _slice_table(self, i, table, item, new_components, whole_slice):
         """
         Apply a slice, or part of a slice to one of the quantity arrays.
@@ -269,35 +573,52 @@ class QuantityTableCoordinate(BaseTableCoordinate):
         ret_table._dropped_world_dimensions = new_components["dropped_world_dimensions"]
         return ret_table
 
+    def resample(self, factors):
+        # docstring in base class
+        if self.mesh:
+            tables = [_resample_table(table, (factor,)) for table, factor in zip(self.table, factors)]
+        else:
+            tables = [_resample_table(table, factors) for table in self.table]
+        new_table = type(self)(*tables, mesh=self.mesh, names=self.names,
+                               physical_types=self.physical_types)
+        new_table._dropped_world_dimensions = copy.deepcopy(self._dropped_world_dimensions)
+        return new_table
+
     @property
     def n_inputs(self):
         return len(self.table)
 
+    @property
+    def _table_shape(self):
+        if self.mesh:
+            return tuple(len(t) for t in self.table)
+        return self.table[0].shape
+
     def is_scalar(self):
         return all(t.shape == tuple() for t in self.table)
 
-    @property
-    def frame(self):
+    def _generate_frame(self):
         """
         Generate the Frame for this LookupTable.
         """
         return _generate_generic_frame(len(self.table), self.unit, self.names, self.physical_types)
 
-    @property
-    def model(self):
+    def _generate_model(self):
         """
         Generate the Astropy Model for this LookupTable.
         """
-        return _model_from_quantity(self.table, self.mesh)
+        return _model_from_quantity(self.table, self.mesh, self._inverse_indices)
 
 
 class SkyCoordTableCoordinate(BaseTableCoordinate):
     """
     A lookup table created from a `~astropy.coordinates.SkyCoord`.
 
-    If mesh is `True` in this class then `numpy.meshgrid` *is* called when the
-    class is constructed, this is to allow slicing operations on the tables
-    which make the length of the dimensions different.
+    If mesh is `True` in this class the 1D components of the SkyCoord are
+    treated as the input to `numpy.meshgrid`, so the first pixel axis
+    corresponds to the second component and the second pixel axis to the first.
+    The components are kept as 1D arrays, which are sliced separately, and
+    the grid is only created if ``table`` is accessed.
     """
     def __init__(self, *tables, mesh=False, names=None, physical_types=None):
         if not len(tables) == 1 and isinstance(tables[0], SkyCoord):
@@ -310,45 +631,147 @@ class SkyCoordTableCoordinate(BaseTableCoordinate):
         if physical_types is not None and len(physical_types) != 2:
             raise ValueError("The number of physical types must equal two for a SkyCoord table.")
 
-        self._was_meshed = False
         sc = tables[0]
+        super().__init__(sc, mesh=False, names=names, physical_types=physical_types)
+        self.table = sc
 
         if mesh:
-            components = tuple(getattr(sc.data, comp) for comp in sc.data.components)
-            units = [c.unit for c in components]
-            coords = [u.Quantity(mesh, unit=unit) for mesh, unit in zip(np.meshgrid(*components), units)]
-            sc = SkyCoord(*coords, frame=sc)
-            mesh = False
-            self._was_meshed = True  # An internal flag to know if we meshed the input
-
-        super().__init__(sc, mesh=mesh, names=names, physical_types=physical_types)
-        self.table = self.table[0]
+            self._set_mesh(tuple(getattr(sc.data, comp) for comp in sc.data.components),
+                           sc.frame.replicate_without_data())
+
+    @classmethod
+    def _from_mesh(cls, components, sky_frame, names=None, physical_types=None):
+        """
+        Create a meshed table from 1D components without creating a SkyCoord.
+        """
+        new = cls.__new__(cls)
+        BaseTableCoordinate.__init__(new, None, names=names, physical_types=physical_types)
+        new._set_mesh(components, sky_frame)
+        return new
+
+    def _set_mesh(self, components, sky_frame):
+        self._table = None
+        self._mesh_components = tuple(components)
+        self._sky_frame = sky_frame
+        self.mesh = True
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = self._mesh_grid((slice(None),) * self.n_inputs)
+        return self._table
+
+    @table.setter
+    def table(self, table):
+        self._table = table
+        self._mesh_components = None
+        self.mesh = False
+
+    @property
+    def _mesh_axes(self):
+        # The pixel axis of each meshed component, which is also the component on each pixel axis.
+        return (1, 0) + tuple(range(2, len(self._mesh_components)))
+
+    def _mesh_grid(self, item):
+        """
+        Create the SkyCoord of the meshed components sliced by ``item``.
+
+        ``item`` has one element per pixel axis. Only the pixel axes which are
+        not indexed by an integer are in the grid.
+        """
+        axes = self._mesh_axes
+        components = [c[item[axis]] for axis, c in zip(axes, self._mesh_components)]
+        grid_axes = [axis for axis in range(len(axes)) if not isinstance(item[axis], Integral)]
+        shape = tuple(len(components[axes[axis]]) for axis in grid_axes)
+
+        grids = []
+        for axis, component in zip(axes, components):
+            if component.ndim:
+                component = component.reshape([-1 if grid_axis == axis else 1 for grid_axis in grid_axes])
+            grids.append(np.broadcast_to(component, shape, subok=True))
+        return SkyCoord(*grids, frame=self._sky_frame)
+
+    def __str__(self):
+        if self.mesh:
+            # Avoid creating the grid just to print the table.
+            return f"mesh of {', '.join(str(c) for c in self._mesh_components)}"
+        return super().__str__()
+
+    def _cache_state(self):
+        if self.mesh:
+            return self._mesh_components + (self._sky_frame, self.names, self.physical_types)
+        return super()._cache_state()
+
+    def _components(self):
+        if self.mesh:
+            return self._mesh_components
+        sc = self.table
+        return tuple(getattr(sc.data, comp) for comp in sc.data.components)
+
+    def _generate_inverse_indices(self):
+        return [_inverse_index(c) for c in self._components()]
 
     @property
     def n_inputs(self):
+        if self.mesh:
+            return len(self._mesh_components)
         return self.table.ndim
 
+    @property
+    def _table_shape(self):
+        if self.mesh:
+            return tuple(len(self._mesh_components[axis]) for axis in self._mesh_axes)
+        return self.table.shape
+
     def is_scalar(self):
+        if self.mesh:
+            return False
         return self.table.shape == tuple()
 
     def __getitem__(self, item):
-        if not (isinstance(item, (slice, Integral)) or len(item) == self.table.ndim):
+        if not (isinstance(item, (slice, Integral)) or len(item) == self.n_inputs):
             raise ValueError("Can not slice with incorrect length")
 
-        return type(self)(self.table[item],
+        if not self.mesh:
+            return type(self)(self.table[item],
+                              mesh=False,
+                              names=self.names,
+                              physical_types=self.physical_types)
+
+        item = item if isinstance(item, tuple) else (item,)
+        item = item + (slice(None),) * (self.n_inputs - len(item))
+        if any(isinstance(i, Integral) for i in item):
+            # Dropping a pixel axis couples the components, so create the (smaller) grid.
+            return type(self)(self._mesh_grid(item),
+                              mesh=False,
+                              names=self.names,
+                              physical_types=self.physical_types)
+
+        components = [c[item[axis]] for axis, c in zip(self._mesh_axes, self._mesh_components)]
+        return self._from_mesh(components, self._sky_frame,
+                               names=self.names, physical_types=self.physical_types)
+
+    def resample(self, factors):
+        # docstring in base class
+        if self.mesh:
+            components = [_resample_table(c, (factors[axis],))
+                          for axis, c in zip(self._mesh_axes, self._mesh_components)]
+            return self._from_mesh(components, self._sky_frame,
+                                   names=self.names, physical_types=self.physical_types)
+
+        # Interpolate the components, as the model built from this table does.
+        components = [_resample_table(c, factors) for c in self._components()]
+        return type(self)(SkyCoord(*components, frame=self.table),
                           mesh=False,
                           names=self.names,
                           physical_types=self.physical_types)
 
-    @property
-    def frame(self):
+    def _generate_frame(self):
         """
         Generate the Frame for this LookupTable.
         """
-        sc = self.table
-        components = tuple(getattr(sc.data, comp) for comp in sc.data.components)
-        ref_frame = sc.frame.replicate_without_data()
-        units = list(c.unit for c in components)
+        ref_frame = self._sky_frame if self.mesh else self.table.frame.replicate_without_data()
+        units = list(c.unit for c in self._components())
 
         # TODO: Currently this limits you to 2D due to gwcs#120
         return cf.CelestialFrame(reference_frame=ref_frame,
@@ -357,19 +780,25 @@ class SkyCoordTableCoordinate(BaseTableCoordinate):
                                  axis_physical_types=self.physical_types,
                                  name="CelestialFrame")
 
-    @property
-    def model(self):
+    def _generate_model(self):
         """
         Generate the Astropy Model for this LookupTable.
         """
-        sc = self.table
-        components = tuple(getattr(sc.data, comp) for comp in sc.data.components)
-        return _model_from_quantity(components, mesh=self.mesh)
+        model = _model_from_quantity(self._components(), mesh=self.mesh,
+                                     inverse_indices=self._inverse_indices)
+        if self.mesh:
+            # Each component is evaluated along its own pixel axis.
+            return models.Mapping(self._mesh_axes) | model | _CoupleNaN(len(self._mesh_axes))
+        return model
 
 
 class TimeTableCoordinate(BaseTableCoordinate):
     """
     A lookup table based on a `~astropy.time.Time`, will always be one dimensional.
+
+    The model and the inverse index operate on the times in the table as seconds
+    since ``reference_time``. These are computed once for each table and reference time,
+    and carried over to the tables made by slicing this one.
     """
     def __init__(self, *tables, names=None, physical_types=None, reference_time=None):
         if not len(tables) == 1 and isinstance(tables[0], Time):
@@ -388,25 +817,63 @@ class TimeTableCoordinate(BaseTableCoordinate):
         super().__init__(*tables, mesh=False, names=names, physical_types=physical_types)
         self.table = self.table[0]
         self.reference_time = reference_time or self.table[0]
+        self._deltas = None
+
+    @property
+    def _delta_seconds(self):
+        """
+        The times in the table as seconds since ``reference_time``.
+        """
+        if (self._deltas is None or self._deltas[0] is not self.table
+                or self._deltas[1] is not self.reference_time):
+            self._deltas = (self.table, self.reference_time,
+                            (self.table - self.reference_time).to(u.s))
+        return self._deltas[2]
+
+    def _generate_inverse_indices(self):
+        return [_inverse_index(self._delta_seconds)]
+
+    def _cache_state(self):
+        return super()._cache_state() + (self.reference_time,)
 
     def __getitem__(self, item):
         if not (isinstance(item, (slice, Integral)) or len(item) == 1):
             raise ValueError("Can not slice with incorrect length")
 
-        return type(self)(self.table[item],
-                          names=self.names,
-                          physical_types=self.physical_types,
-                          reference_time=self.reference_time)
+        new = type(self)(self.table[item],
+                         names=self.names,
+                         physical_types=self.physical_types,
+                         reference_time=self.reference_time)
+        if self._deltas is not None:
+            new._deltas = (new.table, new.reference_time, self._delta_seconds[item])
+        return new
+
+    def resample(self, factors):
+        # docstring in base class
+        deltas = _resample_table(self._delta_seconds, factors)
+        # Offset the resampled times from a time in the table, rather than from the
+        # reference time, to keep the scale, format and location of the table.
+        table = self.table[0] + (deltas - self._delta_seconds[0])
+        table.format = self.table.format
+        new = type(self)(table,
+                         names=self.names,
+                         physical_types=self.physical_types,
+                         reference_time=self.reference_time)
+        new._deltas = (new.table, new.reference_time, deltas)
+        return new
 
     @property
     def n_inputs(self):
         return 1  # The time table has to be one dimensional
 
+    @property
+    def _table_shape(self):
+        return self._delta_seconds.shape
+
     def is_scalar(self):
-        return self.table.shape == tuple()
+        return self._delta_seconds.shape == tuple()
 
-    @property
-    def frame(self):
+    def _generate_frame(self):
         """
         Generate the Frame for this LookupTable.
         """
@@ -415,15 +882,12 @@ class TimeTableCoordinate(BaseTableCoordinate):
                                 axes_names=self.names,
                                 name="TemporalFrame")
 
-    @property
-    def model(self):
+    def _generate_model(self):
         """
         Generate the Astropy Model for this LookupTable.
         """
-        time = self.table
-        deltas = (time - self.reference_time).to(u.s)
-
-        return _model_from_quantity((deltas,), mesh=False)
+        return _model_from_quantity((self._delta_seconds,), mesh=False,
+                                    inverse_indices=self._inverse_indices)
 
 
 class MultipleTableCoordinate(BaseTableCoordinate):
@@ -452,6 +916,11 @@ class MultipleTableCoordinate(BaseTableCoordinate):
                             "and not instances of MultipleTableCoordinate.")
         self._table_coords = list(table_coordinates)
         self._dropped_coords = list()
+        self._cache = {}
+
+    def _cache_state(self):
+        # The combined model and frame change if any of the tables change.
+        return sum((t._cache_state() for t in self._table_coords), tuple(self._table_coords))
 
     def __str__(self):
         return f"MultipleTableCoordinate(tables=[{', '.join([str(t) for t in self._table_coords])}])"
@@ -502,11 +971,14 @@ class MultipleTableCoordinate(BaseTableCoordinate):
     def n_inputs(self):
         return sum(t.n_inputs for t in self._table_coords)
 
+    @property
+    def _table_shape(self):
+        return sum((t._table_shape for t in self._table_coords), tuple())
+
     def is_scalar(self):
         return False
 
-    @property
-    def model(self):
+    def _generate_model(self):
         """
         The combined astropy model for all the lookup tables.
         """
@@ -515,15 +987,15 @@ class MultipleTableCoordinate(BaseTableCoordinate):
             model = model & m2.model
         return model
 
-    @property
-    def frame(self):
+    def _generate_frame(self):
         """
         The gWCS coordinate frame for all the lookup tables.
         """
         if len(self._table_coords) == 1:
             return self._table_coords[0].frame
         else:
-            frames = [t.frame for t in self._table_coords]
+            # Copy the frames as they are cached by the tables.
+            frames = [copy.copy(t.frame) for t in self._table_coords]
 
             # We now have to set the axes_order of all the frames so that we
             # have one consistent WCS with the correct number of pixel
@@ -0,0 +1,3 @@
+from .store import ChunkedArray, load, save
+
+__all__ = ['ChunkedArray', 'load', 'save']
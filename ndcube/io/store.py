@@ -0,0 +1,671 @@
+"""
+A chunked, on-disk storage format for NDCube, NDCubeSequence and NDCollection objects.
+
+An object is stored in a directory. Each array held by a cube (data, mask and uncertainty)
+is split into chunks, each stored in its own ``.npy`` file, so that parts of
+the array can be read without reading the rest. The coordinate information of each cube
+(WCS, extra coords and global coords), its metadata and its unit are stored in
+a separate ASDF file. FITS WCSes are stored as FITS headers. Sequences and
+collections are stored as a directory holding one sub-directory per member.
+
+Objects which ASDF cannot serialise, e.g. arbitrary Python objects in the metadata,
+are only stored if pickling is explicitly allowed, and such stores can then
+only be loaded if pickling is explicitly allowed too.
+
+Saving and loading require the optional ``asdf`` and ``asdf-astropy`` packages,
+which can be installed with ``pip install ndcube[io]``.
+"""
+import json
+import pickle
+import shutil
+import numbers
+import importlib
+import itertools
+from pathlib import Path
+from collections import OrderedDict
+
+import numpy as np
+from astropy.io import fits
+from astropy.nddata import NDUncertainty
+from astropy.wcs import WCS
+from astropy.wcs.wcsapi import HighLevelWCSWrapper
+from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
+
+from ndcube.extra_coords import ExtraCoords
+from ndcube.extra_coords.lookup_table_coord import (MultipleTableCoordinate,
+                                                    QuantityTableCoordinate,
+                                                    SkyCoordTableCoordinate,
+                                                    TimeTableCoordinate)
+from ndcube.wcs.wrappers import (CompoundLowLevelWCS, ReorderedLowLevelWCS,
+                                 ResampledLowLevelWCS)
+
+__all__ = ['ChunkedArray', 'save', 'load']
+
+FORMAT_NAME = "ndcube-chunked-store"
+FORMAT_VERSION = 3
+MANIFEST_FILE = "manifest.json"
+METADATA_FILE = "metadata.asdf"
+PICKLE_KEY = "ndcube_pickle"
+DEFAULT_CHUNK_BYTES = 8 * 1024**2
+
+
+def _auto_chunks(shape, itemsize, max_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Choose a chunk shape for an array by halving its longest axis until a chunk is small enough.
+    """
+    chunks = [max(int(n), 1) for n in shape]
+    while np.prod(chunks, dtype=int) * itemsize > max_bytes and max(chunks) > 1:
+        longest = int(np.argmax(chunks))
+        chunks[longest] = -(-chunks[longest] // 2)
+    return tuple(chunks)
+
+
+def _chunk_slices(shape, chunks):
+    """
+    Yield the index of each chunk along each axis and the slices selecting it from the array.
+    """
+    starts = [range(0, n, c) for n, c in zip(shape, chunks)]
+    for start in itertools.product(*starts):
+        index = tuple(i // c for i, c in zip(start, chunks))
+        yield index, tuple(slice(i, min(i + c, n)) for i, c, n in zip(start, chunks, shape))
+
+
+def _chunk_filename(index):
+    return ".".join(str(i) for i in index) + ".npy" if index else "0.npy"
+
+
+class ChunkedArray:
+    """
+    An array-like view of an array stored in chunks on disk.
+
+    Basic slicing returns another `ChunkedArray` without reading any data.
+    Data is only read, chunk by chunk, when the array is converted to a
+    `numpy.ndarray`, e.g. by `numpy.asarray`, and then only the chunks
+    overlapping the view are read. Indexing with arrays reads the view into memory
+    and then applies the index.
+
+    Parameters
+    ----------
+    path: `str` or `pathlib.Path`
+        The directory holding the chunk files.
+
+    shape: `tuple` of `int`
+        The shape of the stored array.
+
+    dtype: data-type
+        The data type of the stored array.
+
+    chunks: `tuple` of `int`
+        The shape of each chunk.
+    """
+    def __init__(self, path, shape, dtype, chunks, _index=None):
+        self.path = Path(path)
+        self.chunks = tuple(int(c) for c in chunks)
+        self._stored_shape = tuple(int(n) for n in shape)
+        self._dtype = np.dtype(dtype)
+        # For each stored axis, either an int if the axis has been indexed away
+        # or a range giving the stored indices selected along that axis.
+        if _index is None:
+            _index = tuple(range(n) for n in self._stored_shape)
+        self._index = _index
+
+    @property
+    def shape(self):
+        return tuple(len(i) for i in self._index if isinstance(i, range))
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape, dtype=int))
+
+    @property
+    def nbytes(self):
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __repr__(self):
+        return (f"<{type(self).__name__} shape={self.shape} dtype={self.dtype} "
+                f"chunks={self.chunks} path='{self.path}'>")
+
+    def __getitem__(self, item):
+        if not isinstance(item, tuple):
+            item = (item,)
+        if any(not (isinstance(i, (numbers.Integral, slice)) or i is Ellipsis) for i in item):
+            # Advanced indexing is delegated to numpy.
+            return np.asarray(self)[item]
+        if sum(i is Ellipsis for i in item) > 1:
+            raise IndexError("an index can only have a single ellipsis ('...')")
+        if Ellipsis in item:
+            position = item.index(Ellipsis)
+            n_missing = self.ndim - (len(item) - 1)
+            item = item[:position] + (slice(None),) * n_missing + item[position + 1:]
+        if len(item) > self.ndim:
+            raise IndexError(f"too many indices for array: array is {self.ndim}-dimensional, "
+                             f"but {len(item)} were indexed")
+        item = item + (slice(None),) * (self.ndim - len(item))
+
+        new_index = []
+        view_items = iter(item)
+        for axis_index in self._index:
+            if isinstance(axis_index, range):
+                # Indexing ranges applies the same rules, including errors, as numpy.
+                axis_index = axis_index[next(view_items)]
+            new_index.append(axis_index)
+        return type(self)(self.path, self._stored_shape, self._dtype, self.chunks,
+                          _index=tuple(new_index))
+
+    def __array__(self, dtype=None):
+        out = np.empty(self.shape, dtype=self.dtype)
+        if out.size:
+            # Find which stored indices along each axis are selected and where they go
+            # in the output. Axes which have been indexed away have no output position.
+            stored = [np.atleast_1d(np.asarray(i)) for i in self._index]
+            chunk_numbers = [np.unique(s // c) for s, c in zip(stored, self.chunks)]
+            kept_axes = [isinstance(i, range) for i in self._index]
+            for chunk_index in itertools.product(*chunk_numbers):
+                local, positions = [], []
+                for s, c, n, kept in zip(stored, self.chunks, chunk_index, kept_axes):
+                    in_chunk = np.nonzero(s // c == n)[0]
+                    local.append(s[in_chunk] - n * c)
+                    if kept:
+                        positions.append(in_chunk)
+                chunk = np.load(self.path / _chunk_filename(chunk_index), mmap_mode="r",
+                                allow_pickle=False)
+                block = chunk[np.ix_(*local)] if local else chunk[()]
+                out[np.ix_(*positions) if positions else ()] = block.reshape(
+                    [len(p) for p in positions])
+        if dtype is not None:
+            out = out.astype(dtype, copy=False)
+        return out
+
+
+def _save_array(array, path, chunks):
+    shape = tuple(int(n) for n in np.shape(array))
+    dtype = np.dtype(getattr(array, "dtype", None) or np.asarray(array).dtype)
+    if chunks is None:
+        chunks = _auto_chunks(shape, dtype.itemsize)
+    elif isinstance(chunks, numbers.Integral):
+        chunks = (chunks,) * len(shape)
+    chunks = tuple(min(int(c), max(n, 1)) for c, n in zip(chunks, shape))
+    if len(chunks) != len(shape) or any(c < 1 for c in chunks):
+        raise ValueError(f"chunks must be a positive int or have one positive entry per "
+                         f"array axis ({len(shape)}), got {chunks}.")
+    path.mkdir()
+    # Convert each chunk separately so that only one chunk of the source array,
+    # e.g. a memory-mapped or dask array, is in memory at a time.
+    for index, item in _chunk_slices(shape, chunks):
+        np.save(path / _chunk_filename(index), np.asarray(array[item], dtype=dtype),
+                allow_pickle=False)
+    return {"shape": shape, "dtype": dtype.str, "chunks": chunks}
+
+
+def _load_array(path, description, lazy):
+    array = ChunkedArray(path, description["shape"], np.dtype(description["dtype"]),
+                         description["chunks"])
+    return array if lazy else np.asarray(array)
+
+
+def _class_path(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _subclasses(base):
+    yield base
+    for cls in base.__subclasses__():
+        yield from _subclasses(cls)
+
+
+def _import_class(class_path, base, allow_pickle):
+    """
+    Find a class stored by `_class_path`, checking it is a subclass of ``base``.
+
+    Only subclasses of ``base`` which have already been defined are found,
+    unless ``allow_pickle`` is True, as importing a module named in the store
+    can run arbitrary code.
+    """
+    for cls in _subclasses(base):
+        if _class_path(cls) == class_path:
+            return cls
+    if not allow_pickle:
+        raise ValueError(f"{class_path} is not a known subclass of {base.__name__}. "
+                         "Import it before loading the store, or set allow_pickle=True "
+                         "to import it, but only if you trust the source of the store.")
+    module_name, _, name = class_path.rpartition(".")
+    cls = getattr(importlib.import_module(module_name), name, None)
+    if not (isinstance(cls, type) and issubclass(cls, base)):
+        raise TypeError(f"{class_path} is not a subclass of {base.__name__}.")
+    return cls
+
+
+class _TreeObject:
+    """
+    An object to be written to the ASDF metadata file, which is pickled if ASDF cannot serialise it.
+    """
+    def __init__(self, obj, description):
+        self.obj = obj
+        self.description = description
+
+
+def _resolve_tree(tree, pickled=()):
+    """
+    Replace the `_TreeObject` instances in a tree by their objects, or their pickles if in ``pickled``.
+    """
+    if isinstance(tree, _TreeObject):
+        if tree in pickled:
+            return {PICKLE_KEY: np.frombuffer(pickle.dumps(tree.obj,
+                                                           protocol=pickle.HIGHEST_PROTOCOL),
+                                              dtype=np.uint8)}
+        return tree.obj
+    if isinstance(tree, dict):
+        return {key: _resolve_tree(value, pickled) for key, value in tree.items()}
+    if isinstance(tree, list):
+        return [_resolve_tree(value, pickled) for value in tree]
+    return tree
+
+
+def _tree_objects(tree):
+    if isinstance(tree, _TreeObject):
+        yield tree
+    elif isinstance(tree, dict):
+        for value in tree.values():
+            yield from _tree_objects(value)
+    elif isinstance(tree, list):
+        for value in tree:
+            yield from _tree_objects(value)
+
+
+def _from_tree(value, description, allow_pickle):
+    """
+    Return an object read from the ASDF metadata file, unpickling it if it was pickled.
+    """
+    if isinstance(value, dict) and set(value) == {PICKLE_KEY}:
+        if not allow_pickle:
+            raise ValueError(f"The {description} in this store was saved with pickle. "
+                             "Set allow_pickle=True to load it, but only if you trust "
+                             "the source of the store as unpickling can run arbitrary code.")
+        return pickle.loads(np.asarray(value[PICKLE_KEY]).tobytes())
+    return value
+
+
+def _encode_slice(item):
+    if isinstance(item, slice):
+        return {"start": item.start, "stop": item.stop, "step": item.step}
+    return int(item)
+
+
+def _decode_slice(item):
+    if isinstance(item, dict):
+        return slice(item["start"], item["stop"], item["step"])
+    return item
+
+
+def _encode_wcs(wcs):
+    """
+    Describe a WCS in terms ASDF can serialise.
+
+    FITS WCSes are stored as a FITS header, alongside their exact parameters
+    which the header rounds. The WCS wrappers of astropy and ndcube are stored
+    as the WCSes they wrap and their arguments. Other WCSes, e.g. gWCSes, are
+    stored by ASDF itself.
+    """
+    if isinstance(wcs, HighLevelWCSWrapper):
+        return {"type": "high_level_wrapper",
+                "wcs": _encode_wcs(wcs.low_level_wcs)}
+    if isinstance(wcs, SlicedLowLevelWCS):
+        return {"type": "sliced", "wcs": _encode_wcs(wcs._wcs),
+                "slices": [_encode_slice(item) for item in wcs._slices_array]}
+    if isinstance(wcs, ResampledLowLevelWCS):
+        return {"type": "resampled", "wcs": _encode_wcs(wcs._wcs),
+                "factor": np.asarray(wcs._factor).tolist(),
+                "offset": np.asarray(wcs._offset).tolist()}
+    if isinstance(wcs, ReorderedLowLevelWCS):
+        return {"type": "reordered", "wcs": _encode_wcs(wcs._wcs),
+                "pixel_order": [int(i) for i in wcs._pixel_order],
+                "world_order": [int(i) for i in wcs._world_order]}
+    if isinstance(wcs, CompoundLowLevelWCS):
+        return {"type": "compound", "wcs": [_encode_wcs(w) for w in wcs._wcs],
+                "mapping": [int(i) for i in wcs.mapping.mapping],
+                "pixel_atol": wcs.atol, "validation": wcs.validation}
+    if isinstance(wcs, WCS) and not any((wcs.cpdis1, wcs.cpdis2, wcs.det2im1, wcs.det2im2)):
+        parameters = {"crpix": wcs.wcs.crpix, "crval": wcs.wcs.crval, "cdelt": wcs.wcs.cdelt}
+        if wcs.wcs.has_cd():
+            parameters["cd"] = wcs.wcs.cd
+        elif wcs.wcs.has_pc():
+            parameters["pc"] = wcs.wcs.pc
+        return {"type": "fits", "header": wcs.to_header_string(relax=True),
+                "parameters": parameters,
+                "pixel_shape": None if wcs.pixel_shape is None else list(wcs.pixel_shape)}
+    return {"type": "asdf", "wcs": _TreeObject(wcs, "WCS")}
+
+
+def _decode_wcs(tree, allow_pickle):
+    wcs_type = tree["type"]
+    if wcs_type == "high_level_wrapper":
+        return HighLevelWCSWrapper(_decode_wcs(tree["wcs"], allow_pickle))
+    if wcs_type == "sliced":
+        return SlicedLowLevelWCS(_decode_wcs(tree["wcs"], allow_pickle),
+                                 [_decode_slice(item) for item in tree["slices"]])
+    if wcs_type == "resampled":
+        return ResampledLowLevelWCS(_decode_wcs(tree["wcs"], allow_pickle),
+                                    tree["factor"], offset=tree["offset"])
+    if wcs_type == "reordered":
+        return ReorderedLowLevelWCS(_decode_wcs(tree["wcs"], allow_pickle),
+                                    tree["pixel_order"], tree["world_order"])
+    if wcs_type == "compound":
+        return CompoundLowLevelWCS(*[_decode_wcs(w, allow_pickle) for w in tree["wcs"]],
+                                   mapping=tuple(tree["mapping"]),
+                                   pixel_atol=tree["pixel_atol"], validation=tree["validation"])
+    if wcs_type == "fits":
+        wcs = WCS(fits.Header.fromstring(tree["header"]))
+        for name, value in tree["parameters"].items():
+            setattr(wcs.wcs, name, np.array(value))
+        wcs.wcs.set()
+        if tree["pixel_shape"] is not None:
+            wcs.pixel_shape = tuple(tree["pixel_shape"])
+        return wcs
+    if wcs_type == "asdf":
+        return _from_tree(tree["wcs"], "WCS", allow_pickle)
+    raise ValueError(f"Unknown WCS type in ndcube store: {wcs_type}")
+
+
+def _encode_table_coordinate(coord):
+    common = {"names": None if coord.names is None else list(coord.names),
+              "physical_types": (None if coord.physical_types is None
+                                 else list(coord.physical_types))}
+    if isinstance(coord, MultipleTableCoordinate):
+        return {"type": "multiple",
+                "tables": [_encode_table_coordinate(t) for t in coord._table_coords]}
+    if isinstance(coord, TimeTableCoordinate):
+        return {"type": "time", "table": coord.table,
+                "reference_time": coord.reference_time, **common}
+    if isinstance(coord, SkyCoordTableCoordinate):
+        if coord.mesh:
+            return {"type": "skycoord_mesh", "components": list(coord._mesh_components),
+                    "frame": coord._sky_frame, **common}
+        return {"type": "skycoord", "table": coord.table, **common}
+    if isinstance(coord, QuantityTableCoordinate):
+        return {"type": "quantity", "tables": list(coord.table), "mesh": coord.mesh, **common}
+    raise TypeError(f"Unknown lookup table coordinate type: {type(coord).__name__}")
+
+
+def _decode_table_coordinate(tree):
+    coord_type = tree["type"]
+    if coord_type == "multiple":
+        return MultipleTableCoordinate(*[_decode_table_coordinate(t) for t in tree["tables"]])
+    common = {"names": tree["names"], "physical_types": tree["physical_types"]}
+    if coord_type == "time":
+        return TimeTableCoordinate(tree["table"], reference_time=tree["reference_time"], **common)
+    if coord_type == "skycoord_mesh":
+        return SkyCoordTableCoordinate._from_mesh(tree["components"], tree["frame"], **common)
+    if coord_type == "skycoord":
+        return SkyCoordTableCoordinate(tree["table"], **common)
+    if coord_type == "quantity":
+        return QuantityTableCoordinate(*tree["tables"], mesh=tree["mesh"], **common)
+    raise ValueError(f"Unknown lookup table coordinate type in ndcube store: {coord_type}")
+
+
+def _encode_extra_coords(extra_coords):
+    if extra_coords._wcs is not None:
+        return {"wcs": _encode_wcs(extra_coords._wcs),
+                "mapping": [int(i) for i in extra_coords.mapping]}
+    return {"lookup_tables": [{"array_dimension": (dim if isinstance(dim, numbers.Integral)
+                                                   else list(dim)),
+                               "table": _encode_table_coordinate(coord)}
+                              for dim, coord in extra_coords._lookup_tables],
+            "dropped_tables": [_encode_table_coordinate(coord)
+                               for coord in extra_coords._dropped_tables]}
+
+
+def _decode_extra_coords(tree, allow_pickle):
+    if "wcs" in tree:
+        return ExtraCoords(wcs=_decode_wcs(tree["wcs"], allow_pickle), mapping=tree["mapping"])
+    extra_coords = ExtraCoords()
+    extra_coords._lookup_tables = [(lut["array_dimension"] if isinstance(lut["array_dimension"], int)
+                                    else tuple(lut["array_dimension"]),
+                                    _decode_table_coordinate(lut["table"]))
+                                   for lut in tree["lookup_tables"]]
+    extra_coords._dropped_tables = [_decode_table_coordinate(coord)
+                                    for coord in tree["dropped_tables"]]
+    return extra_coords
+
+
+def _encode_meta(meta):
+    if isinstance(meta, fits.Header):
+        return {"fits_header": meta.tostring()}
+    return {"meta": _TreeObject(meta, "meta")}
+
+
+def _decode_meta(tree, allow_pickle):
+    if "fits_header" in tree:
+        return fits.Header.fromstring(tree["fits_header"])
+    return _from_tree(tree["meta"], "meta", allow_pickle)
+
+
+def _write_node(path, manifest, metadata, allow_pickle):
+    import asdf
+
+    try:
+        asdf.AsdfFile(_resolve_tree(metadata)).write_to(path / METADATA_FILE)
+    except Exception as err:
+        # Only now find which objects ASDF cannot serialise, so that they can be pickled.
+        pickled = {}
+        for tree_object in _tree_objects(metadata):
+            try:
+                asdf.AsdfFile({"obj": tree_object.obj}).write_to(path / METADATA_FILE)
+            except Exception as object_err:
+                pickled[tree_object] = object_err
+        if not pickled:
+            raise
+        if not allow_pickle:
+            tree_object, object_err = next(iter(pickled.items()))
+            raise TypeError(f"Could not serialise the {tree_object.description} to ASDF: "
+                            f"{object_err}. Set allow_pickle=True to store it with pickle "
+                            "instead.") from err
+        asdf.AsdfFile(_resolve_tree(metadata, pickled)).write_to(path / METADATA_FILE)
+    manifest = dict(format=FORMAT_NAME, version=FORMAT_VERSION, **manifest)
+    with open(path / MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def _read_node(path):
+    path = Path(path)
+    manifest_path = path / MANIFEST_FILE
+    if not manifest_path.is_file():
+        raise FileNotFoundError(f"{path} is not an ndcube store: {MANIFEST_FILE} not found.")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path} is not an ndcube store.")
+    if manifest["version"] != FORMAT_VERSION:
+        raise ValueError(f"{path} was written with store version {manifest['version']}, "
+                         f"but only version {FORMAT_VERSION} can be read.")
+    import asdf
+
+    with asdf.open(path / METADATA_FILE, lazy_load=False, copy_arrays=True) as f:
+        metadata = dict(f.tree)
+    return manifest, metadata
+
+
+def _save_cube(cube, path, chunks, allow_pickle):
+    arrays = {}
+    mask = cube.mask
+    uncertainty = cube.uncertainty
+    metadata = {"class": _class_path(type(cube)),
+                "wcs": _encode_wcs(cube.wcs),
+                "extra_coords": _encode_extra_coords(cube.extra_coords),
+                "global_coords": [[list(name) if isinstance(name, tuple) else name,
+                                   physical_type,
+                                   _TreeObject(coord, f"global coord {name}")]
+                                  for name, (physical_type, coord)
+                                  in cube.global_coords._internal_coords.items()],
+                "meta": _encode_meta(cube.meta),
+                "unit": cube.unit,
+                "uncertainty_class": (None if uncertainty is None
+                                      else _class_path(type(uncertainty))),
+                "uncertainty_unit": None if uncertainty is None else uncertainty._unit,
+                "mask": None}
+    arrays["data"] = _save_array(cube.data, path / "data", chunks)
+    if mask is not None:
+        if np.ndim(mask) == 0:
+            metadata["mask"] = bool(mask)
+        else:
+            arrays["mask"] = _save_array(mask, path / "mask", chunks)
+    if uncertainty is not None and uncertainty.array is not None:
+        arrays["uncertainty"] = _save_array(uncertainty.array, path / "uncertainty", chunks)
+    _write_node(path, {"type": "NDCube", "arrays": arrays}, metadata, allow_pickle)
+
+
+def _load_cube(path, manifest, metadata, lazy, allow_pickle):
+    from ndcube.ndcube import NDCubeBase
+
+    arrays = {name: _load_array(path / name, description, lazy)
+              for name, description in manifest["arrays"].items()}
+    uncertainty = None
+    if metadata["uncertainty_class"] is not None:
+        uncertainty_class = _import_class(metadata["uncertainty_class"], NDUncertainty,
+                                          allow_pickle)
+        uncertainty = uncertainty_class(arrays.get("uncertainty"),
+                                        unit=metadata["uncertainty_unit"], copy=False)
+    cube_class = _import_class(metadata["class"], NDCubeBase, allow_pickle)
+    cube = cube_class(arrays["data"], wcs=_decode_wcs(metadata["wcs"], allow_pickle),
+                      uncertainty=uncertainty, mask=arrays.get("mask", metadata["mask"]),
+                      meta=_decode_meta(metadata["meta"], allow_pickle), unit=metadata["unit"],
+                      extra_coords=_decode_extra_coords(metadata["extra_coords"], allow_pickle))
+    cube._global_coords._internal_coords = OrderedDict(
+        (tuple(name) if isinstance(name, list) else name,
+         (physical_type, _from_tree(coord, f"global coord {name}", allow_pickle)))
+        for name, physical_type, coord in metadata["global_coords"])
+    return cube
+
+
+def _save(obj, path, chunks, allow_pickle):
+    from ndcube.ndcollection import NDCollection
+    from ndcube.ndcube import NDCubeBase
+    from ndcube.ndcube_sequence import NDCubeSequenceBase
+
+    path.mkdir()
+    if isinstance(obj, NDCubeBase):
+        _save_cube(obj, path, chunks, allow_pickle)
+    elif isinstance(obj, NDCubeSequenceBase):
+        for i, cube in enumerate(obj.data):
+            _save(cube, path / f"cube_{i}", chunks, allow_pickle)
+        _write_node(path, {"type": "NDCubeSequence", "n_members": len(obj.data)},
+                    {"class": _class_path(type(obj)), "meta": _encode_meta(obj.meta),
+                     "common_axis": obj._common_axis}, allow_pickle)
+    elif isinstance(obj, NDCollection):
+        keys = list(obj.keys())
+        for i, key in enumerate(keys):
+            _save(obj[key], path / f"member_{i}", chunks, allow_pickle)
+        aligned_axes = (None if obj.aligned_axes is None
+                        else [[int(axis) for axis in obj.aligned_axes[key]] for key in keys])
+        _write_node(path, {"type": "NDCollection", "n_members": len(keys)},
+                    {"class": _class_path(type(obj)), "meta": _encode_meta(obj.meta),
+                     "keys": _TreeObject(keys, "collection keys"),
+                     "aligned_axes": aligned_axes}, allow_pickle)
+    else:
+        raise TypeError("Only NDCube, NDCubeSequence and NDCollection objects can be saved, "
+                        f"not {type(obj).__name__}.")
+
+
+def _load(path, lazy, allow_pickle):
+    from ndcube.ndcollection import NDCollection
+    from ndcube.ndcube_sequence import NDCubeSequenceBase
+
+    manifest, metadata = _read_node(path)
+    if manifest["type"] == "NDCube":
+        return _load_cube(path, manifest, metadata, lazy, allow_pickle)
+    if manifest["type"] == "NDCubeSequence":
+        cubes = [_load(path / f"cube_{i}", lazy, allow_pickle)
+                 for i in range(manifest["n_members"])]
+        return _import_class(metadata["class"], NDCubeSequenceBase, allow_pickle)(
+            cubes, meta=_decode_meta(metadata["meta"], allow_pickle),
+            common_axis=metadata["common_axis"])
+    if manifest["type"] == "NDCollection":
+        members = [_load(path / f"member_{i}", lazy, allow_pickle)
+                   for i in range(manifest["n_members"])]
+        keys = _from_tree(metadata["keys"], "collection keys", allow_pickle)
+        aligned_axes = metadata["aligned_axes"]
+        if aligned_axes is not None:
+            aligned_axes = tuple(tuple(axes) for axes in aligned_axes)
+        return _import_class(metadata["class"], NDCollection, allow_pickle)(
+            list(zip(keys, members)), aligned_axes=aligned_axes,
+            meta=_decode_meta(metadata["meta"], allow_pickle), sanitize_inputs=False)
+    raise ValueError(f"Unknown object type in ndcube store {path}: {manifest['type']}")
+
+
+def save(obj, path, chunks=None, overwrite=False, allow_pickle=False):
+    """
+    Save an NDCube, NDCubeSequence or NDCollection to a chunked store on disk.
+
+    Parameters
+    ----------
+    obj: `ndcube.NDCube`, `ndcube.NDCubeSequence` or `ndcube.NDCollection`
+        The object to save.
+
+    path: `str` or `pathlib.Path`
+        The directory in which to create the store. It must not already exist
+        unless ``overwrite`` is True.
+
+    chunks: `int` or `tuple` of `int`, optional
+        The shape of the chunks in which each array is stored.
+        A single `int` applies to all array axes.
+        Default=None, i.e. chunks of up to 8 MiB, split along the longest axes.
+
+    overwrite: `bool`, optional
+        If True and ``path`` is an existing ndcube store, it is replaced. Default=False
+
+    allow_pickle: `bool`, optional
+        If True, coordinate information and metadata which cannot be stored in
+        a native format are pickled. Otherwise they raise a `TypeError`. Default=False
+    """
+    path = Path(path)
+    if path.exists():
+        if not overwrite:
+            raise FileExistsError(f"{path} already exists. Set overwrite=True to replace it.")
+        if not (path / MANIFEST_FILE).is_file():
+            raise FileExistsError(f"{path} exists and is not an ndcube store "
+                                  "so will not be overwritten.")
+        shutil.rmtree(path)
+    try:
+        _save(obj, path, chunks, allow_pickle)
+    except Exception:
+        shutil.rmtree(path, ignore_errors=True)
+        raise
+
+
+def load(path, lazy=True, allow_pickle=False):
+    """
+    Load an NDCube, NDCubeSequence or NDCollection from a chunked store on disk.
+
+    Parameters
+    ----------
+    path: `str` or `pathlib.Path`
+        The directory holding the store.
+
+    lazy: `bool`, optional
+        If True, the arrays of each cube are `ChunkedArray` objects which only
+        read the chunks they need from disk when accessed. Slicing and cropping
+        such cubes reads no data at all. If False, all arrays are read into memory.
+        Default=True
+
+    allow_pickle: `bool`, optional
+        If True, load coordinate information and metadata which were pickled
+        when the store was saved. Unpickling can run arbitrary code, so only
+        set this for stores from trusted sources. Default=False
+
+    Returns
+    -------
+    result: `ndcube.NDCube`, `ndcube.NDCubeSequence` or `ndcube.NDCollection`
+    """
+    return _load(Path(path), lazy, allow_pickle)
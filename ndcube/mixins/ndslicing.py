@@ -1,7 +1,10 @@
 
 from astropy.nddata.mixins.ndslicing import NDSlicingMixin
+from astropy.wcs.wcsapi import HighLevelWCSWrapper
 from astropy.wcs.wcsapi.wrappers.sliced_wcs import sanitize_slices
 
+from ndcube.wcs.wrappers import normalize_wrappers
+
 __all__ = ['NDCubeSlicingMixin']
 
 
@@ -21,6 +24,10 @@ class NDCubeSlicingMixin(NDSlicingMixin):
 
         sliced_cube = super().__getitem__(item)
         sliced_cube._global_coords._internal_coords = self._global_coords._internal_coords
+        # Allow the sliced cube to derive its coordinate grids from those cached by this cube.
+        sliced_cube._coordinate_cache.link_to_parent(
+            self._coordinate_cache, self.wcs, sliced_cube.wcs,
+            sanitize_slices(item, len(self.dimensions)))
         return sliced_cube
 
     def _slice(self, item):
@@ -55,3 +62,10 @@ class NDCubeSlicingMixin(NDSlicingMixin):
         kwargs['extra_coords'] = self.extra_coords[item]
 
         return kwargs
+
+    def _slice_wcs(self, item):
+        wcs = super()._slice_wcs(item)
+        if wcs is None:
+            return None
+        # Collapse nested wrappers so repeated slicing does not deepen the WCS.
+        return HighLevelWCSWrapper(normalize_wrappers(wcs.low_level_wcs))
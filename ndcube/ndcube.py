@@ -1,7 +1,13 @@
+import os
 import abc
+import numbers
 import textwrap
+import itertools
+import contextlib
 from copy import deepcopy
+from types import SimpleNamespace
 from collections import namedtuple
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 import astropy.nddata
 import astropy.units as u
@@ -21,7 +27,7 @@ from ndcube.extra_coords import ExtraCoords
 from ndcube.global_coords import GlobalCoords
 from ndcube.mixins import NDCubePlotMixin, NDCubeSlicingMixin
 from ndcube.ndcube_sequence import NDCubeSequence
-from ndcube.wcs.wrappers import CompoundLowLevelWCS
+from ndcube.wcs.wrappers import CompoundLowLevelWCS, ResampledLowLevelWCS, normalize_wrappers
 
 __all__ = ['NDCubeABC', 'NDCubeBase', 'NDCube']
 
@@ -208,6 +214,83 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
 
         self._extra_coords = extra_coords
         self._global_coords = global_coords
+        self._coordinate_cache = utils.cache.WorldCoordinateCache()
+        self._wcs_derived = {}
+
+    @classmethod
+    def from_memmap(cls, path, dtype, shape, wcs, offset=0, order='C', mode='r', **kwargs):
+        """
+        Create a cube whose data is memory-mapped from a raw binary file.
+
+        The data are not read into memory. Instead they are read from disk
+        as they are accessed. Slicing, cropping and exploding the cube
+        return views of the memory-mapped data, as long as ``copy`` is False.
+        To memory-map the mask or uncertainty as well, pass `numpy.memmap`
+        objects as the ``mask`` or ``uncertainty`` keyword arguments.
+
+        Parameters
+        ----------
+        path: `str` or `pathlib.Path`
+            The file containing the data.
+
+        dtype: data-type
+            The data type of the array in the file.
+
+        shape: `tuple` of `int`
+            The shape of the array in the file.
+
+        wcs: `astropy.wcs.wcsapi.BaseLowLevelWCS`, `astropy.wcs.wcsapi.BaseHighLevelWCS`
+            The WCS object describing the data.
+
+        offset: `int`, optional
+            The position in the file, in bytes, at which the array starts. Default=0
+
+        order: {'C', 'F'}, optional
+            The memory layout of the array in the file. Default='C'
+
+        mode: `str`, optional
+            The mode with which to open the file, see `numpy.memmap`.
+            Default='r', i.e. read only.
+
+        kwargs:
+            Passed to the class constructor, e.g. ``mask``, ``uncertainty``, ``unit``.
+
+        Returns
+        -------
+        result: `ndcube.NDCube`
+        """
+        data = np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=tuple(shape),
+                         order=order)
+        return cls(data, wcs=wcs, **kwargs)
+
+    @classmethod
+    def from_npy(cls, path, wcs, mmap_mode='r', **kwargs):
+        """
+        Create a cube whose data is memory-mapped from a NumPy ``.npy`` file.
+
+        See `from_memmap` for the behaviour of memory-mapped cubes.
+
+        Parameters
+        ----------
+        path: `str` or `pathlib.Path`
+            The ``.npy`` file containing the data.
+
+        wcs: `astropy.wcs.wcsapi.BaseLowLevelWCS`, `astropy.wcs.wcsapi.BaseHighLevelWCS`
+            The WCS object describing the data.
+
+        mmap_mode: `str` or None, optional
+            The mode with which to memory-map the file, see `numpy.load`.
+            If None, the data are read into memory. Default='r'
+
+        kwargs:
+            Passed to the class constructor, e.g. ``mask``, ``uncertainty``, ``unit``.
+
+        Returns
+        -------
+        result: `ndcube.NDCube`
+        """
+        data = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+        return cls(data, wcs=wcs, **kwargs)
 
     @property
     def extra_coords(self):
@@ -223,11 +306,27 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         """
         return self._global_coords
 
+    @property
+    def coordinate_cache(self):
+        """
+        A `~ndcube.utils.cache.WorldCoordinateCache` of the coordinate grids computed by this cube.
+
+        Grids are cached by `axis_world_coords` and `axis_world_coords_values`
+        so that repeated calls with the same WCS and ``edges`` do not recompute them.
+        The cached grids are read-only; the coordinates returned to the user are copies.
+        Use ``coordinate_cache.info()`` to inspect the cache and
+        ``coordinate_cache.clear()`` to empty it, e.g. after modifying the WCS in place.
+        """
+        return self._coordinate_cache
+
     @property
     def combined_wcs(self):
         """
         A `~astropy.wcs.wcsapi.BaseHighLevelWCS` object which combines ``.wcs`` with ``.extra_coords``.
         """
+        return self._get_wcs_derived("combined_wcs", self._combined_wcs)
+
+    def _combined_wcs(self):
         if not self.extra_coords.wcs:
             return self.wcs
 
@@ -236,6 +335,30 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
             CompoundLowLevelWCS(self.wcs.low_level_wcs, self._extra_coords.wcs, mapping=mapping)
         )
 
+    def _wcs_state(self):
+        # The objects which determine combined_wcs and array_axis_physical_types.
+        # The lookup tables are read without applying a pending slice to them.
+        extra_coords = self._extra_coords
+        return (self.wcs, extra_coords, extra_coords._wcs, extra_coords._mapping,
+                extra_coords._pending_slice, extra_coords._tables)
+
+    def _get_wcs_derived(self, name, compute):
+        """
+        Return a value derived from the WCS and extra coords, computing it only if they have changed.
+
+        The value is recomputed whenever ``wcs`` or ``extra_coords`` is replaced or a
+        coordinate is added to ``extra_coords``. Changes made in place to the WCS or
+        lookup table objects themselves are not detected.
+        """
+        state = self._wcs_state()
+        cached = self._wcs_derived.get(name)
+        if (cached is not None and len(cached[0]) == len(state)
+                and all(old is new for old, new in zip(cached[0], state))):
+            return cached[1]
+        value = compute()
+        self._wcs_derived[name] = (state, value)
+        return value
+
     @property
     def dimensions(self):
         return u.Quantity(self.data.shape, unit=u.pix)
@@ -253,14 +376,44 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
 
         The physical types are drawn from the WCS ExtraCoords objects.
         """
+        return list(self._get_wcs_derived("array_axis_physical_types",
+                                          self._array_axis_physical_types))
+
+    def _array_axis_physical_types(self):
+        extra_coords = self._extra_coords
+        if extra_coords._pending_slice is not None:
+            # Avoid slicing the lookup tables just to find their physical types.
+            table_world_axes = extra_coords._pending_world_axes()
+            if table_world_axes is not None:
+                return self._physical_types_with_tables(table_world_axes)
+
         wcs = self.combined_wcs
         world_axis_physical_types = np.array(wcs.world_axis_physical_types)
         axis_correlation_matrix = wcs.axis_correlation_matrix
         return [tuple(world_axis_physical_types[axis_correlation_matrix[:, i]])
                 for i in range(axis_correlation_matrix.shape[1])][::-1]
 
-    def _generate_pixel_grid(self, edges, wcs):
-        # Create meshgrid of all pixel coordinates.
+    def _physical_types_with_tables(self, table_world_axes):
+        """
+        The physical types of each array axis from the WCS and the world axes of lookup tables.
+
+        The same as those found from `combined_wcs`, given the physical type of
+        each world axis of the tables and the pixel dimensions it is correlated with.
+        """
+        wcs = self.wcs.low_level_wcs
+        world_axes = [(physical_type, np.nonzero(correlation)[0])
+                      for physical_type, correlation in zip(wcs.world_axis_physical_types,
+                                                            wcs.axis_correlation_matrix)]
+        world_axes += table_world_axes
+        pixel_n_dim = max([wcs.pixel_n_dim] + [max(axes) + 1 for _, axes in table_world_axes])
+        physical_types = [[] for _ in range(pixel_n_dim)]
+        for physical_type, axes in world_axes:
+            for axis in axes:
+                physical_types[axis].append(physical_type)
+        return [tuple(types) for types in physical_types][::-1]
+
+    def _pixel_ranges(self, edges, wcs):
+        # Create the pixel coordinates along each pixel axis.
         # If user, wants edges, set pixel values to pixel edges.
         # Else make pixel centers.
         wcs_shape = self.data.shape[::-1]
@@ -274,6 +427,48 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         if isinstance(wcs, ExtraCoords):
             ranges = [ranges[i] for i in wcs.mapping]
 
+        return ranges
+
+    def _pixel_chunks(self, chunks, wcs):
+        # Convert chunk sizes given in array order to one size per pixel axis of the WCS.
+        # A chunk size of None or -1 means the axis is not split.
+        if isinstance(chunks, numbers.Integral):
+            chunks = (chunks,) * self.data.ndim
+        chunks = tuple(chunks)
+        if len(chunks) != self.data.ndim:
+            raise ValueError("chunks must be an int or have the same length as the "
+                             f"number of array axes ({self.data.ndim}).")
+        chunks = [None if chunk in (None, -1) else int(chunk) for chunk in chunks[::-1]]
+        if any(chunk is not None and chunk < 1 for chunk in chunks):
+            raise ValueError("chunk sizes must be positive.")
+
+        # Limit the pixel dimensions to the ones present in the ExtraCoords
+        if isinstance(wcs, ExtraCoords):
+            chunks = [chunks[i] for i in wcs.mapping]
+
+        return chunks
+
+    @staticmethod
+    def _pixel_tiles(shape, chunks):
+        # Yield tuples of slices, in pixel order, which tile a grid of the given shape.
+        chunks = [chunk or n for chunk, n in zip(chunks, shape)]
+        starts = [range(0, n, chunk) for chunk, n in zip(chunks, shape)]
+        for start in itertools.product(*starts):
+            yield tuple(slice(i, i + chunk) for i, chunk in zip(start, chunks))
+
+    def _generate_pixel_grid(self, edges, wcs, pixel_axes=None, tile=None):
+        # Create meshgrid of pixel coordinates.
+        # If pixel_axes is given, only those pixel axes are spanned by the grid.
+        # All other pixel axes are held at their first pixel so that the
+        # grid has length 1 along them.
+        # If tile is given, it is a tuple of slices in pixel order
+        # selecting the part of the grid to create.
+        ranges = self._pixel_ranges(edges, wcs)
+        if pixel_axes is not None:
+            ranges = [r if i in pixel_axes else r[:1] for i, r in enumerate(ranges)]
+        if tile is not None:
+            ranges = [r[t] for r, t in zip(ranges, tile)]
+
         # Astropy modeling seems unable to handle the output with sparse=True,
         # so we try and detect all possible uses of gwcs.
         # https://github.com/astropy/astropy/issues/11060
@@ -288,11 +483,214 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
 
         return np.meshgrid(*ranges, indexing='ij', sparse=sparse)
 
+    @staticmethod
+    def _world_axes(low_level_wcs, high_level):
+        # Return the world axes represented by each coordinate.
+        # If high_level, there is one coordinate per high level object,
+        # else one per world axis.
+        if not high_level:
+            return [(i,) for i in range(low_level_wcs.world_n_dim)]
+        object_names = np.array([wao_comp[0] for wao_comp
+                                 in low_level_wcs.world_axis_object_components])
+        return [tuple(np.where(object_names == name)[0])
+                for name in utils.misc.unique_sorted(object_names)]
+
+    @staticmethod
+    def _object_indices(world_axes, wcs, axes):
+        # Return the indices of the high level objects corresponding to the requested axes.
+        # Create a mapping from world index in the WCS to object index
+        world_index_to_object_index = {}
+        for object_index, waxes in enumerate(world_axes):
+            for world_index in waxes:
+                world_index_to_object_index[world_index] = object_index
+
+        world_indices = utils.wcs.calculate_world_indices_from_axes(wcs, axes)
+        return utils.misc.unique_sorted(
+            [world_index_to_object_index[world_index] for world_index in world_indices]
+        )
+
+    def _world_coords(self, wcs, edges, high_level, chunks=None, workers=None,
+                      fast_linear=False):
+        """
+        Compute, or retrieve from the coordinate cache, the world coordinates of all pixels.
+
+        Coordinates are reduced to the pixel axes on which they depend,
+        but are not transposed to array order.
+        Each coordinate is only evaluated over the pixel axes with which it is
+        correlated, so the full N-D pixel grid is never created unless a
+        coordinate depends on all pixel axes.
+        If ``chunks`` is given, the grids are evaluated tile by tile.
+        If ``workers`` is given, the tiles are evaluated concurrently.
+        If ``fast_linear`` is True and ``high_level`` is False, world axes which are
+        a linear function of a single pixel axis are computed directly.
+
+        Returns
+        -------
+        entry: `ndcube.utils.cache.CacheEntry`
+            Holds the coordinate objects and the world and pixel axes associated with each.
+            If ``high_level`` is True, there is one coordinate per high level object.
+            Otherwise there is one `~astropy.units.Quantity` per world axis.
+        """
+        is_extra_coords = isinstance(wcs, ExtraCoords)
+        resolved_wcs = wcs.wcs if is_extra_coords else wcs
+        fast_linear = fast_linear and not high_level
+        key = (high_level, is_extra_coords, edges, fast_linear)
+        derivable = resolved_wcs is self.wcs and not edges
+        entry = self._coordinate_cache.get(key, resolved_wcs, derivable=derivable)
+        if entry is not None:
+            return entry
+
+        low_level_wcs = resolved_wcs.low_level_wcs
+        axis_correlation_matrix = low_level_wcs.axis_correlation_matrix
+        world_axes = self._world_axes(low_level_wcs, high_level)
+
+        # Group the coordinates by the pixel axes on which they depend so that
+        # each group can be evaluated over a grid spanning only those axes.
+        groups = {}
+        for i, waxes in enumerate(world_axes):
+            depends = tuple(np.nonzero(axis_correlation_matrix[list(waxes)].any(axis=0))[0])
+            groups.setdefault(depends, []).append(i)
+
+        if workers is None or isinstance(workers, Executor):
+            executor_context = contextlib.nullcontext(workers)
+        else:
+            if not isinstance(workers, numbers.Integral) or workers < 1:
+                raise ValueError("workers must be a positive int or a concurrent.futures.Executor.")
+            executor_context = ThreadPoolExecutor(max_workers=workers)
+
+        linear_axes = {}
+        if fast_linear:
+            linear_axes = utils.wcs.linear_world_axes(low_level_wcs)
+
+        coords = [None] * len(world_axes)
+        with executor_context as executor:
+            for depends, indices in groups.items():
+                if len(depends) == 1 and all(linear_axes.get(i, (None,))[0] == depends[0]
+                                             for i in indices):
+                    group_coords = self._linear_world_coords(low_level_wcs, linear_axes,
+                                                             indices, edges, wcs)
+                elif chunks is None and executor is None:
+                    pixel_inputs = self._generate_pixel_grid(edges, wcs, pixel_axes=depends)
+                    group_coords = self._evaluate_world_coords(resolved_wcs, pixel_inputs,
+                                                               high_level)
+                else:
+                    group_coords = self._evaluate_world_coords_chunked(
+                        wcs, edges, depends, chunks, high_level, executor=executor,
+                        n_workers=None if isinstance(workers, Executor) else workers)
+                for i in indices:
+                    coords[i] = group_coords[i]
+
+        # Reduce duplication across independent dimensions for each coord.
+        # This assumes all the high level objects are array-like, which seems
+        # to be the case for all the astropy ones, but it's not actually
+        # mandated by APE 14
+        pixel_axes = []
+        for i, (coord, waxes) in enumerate(zip(coords, world_axes)):
+            keep = axis_correlation_matrix[list(waxes)].all(axis=0)
+            pixel_axes.append(tuple(np.nonzero(keep)[0]))
+            if not keep.all():
+                # Copy so the cache does not hold on to the full grid.
+                coords[i] = coord[tuple(slice(None) if k else 0 for k in keep)].copy()
+
+        return self._coordinate_cache.put(key, resolved_wcs, coords, world_axes, pixel_axes,
+                                          axis_correlation_matrix)
+
+    @staticmethod
+    def _evaluate_world_coords(wcs, pixel_inputs, high_level):
+        """
+        Convert a pixel grid to a list of world coordinates.
+
+        If ``high_level`` is True, there is one coordinate per high level object.
+        Otherwise there is one `~astropy.units.Quantity` per world axis.
+        """
+        low_level_wcs = wcs.low_level_wcs
+        if high_level:
+            coords = wcs.pixel_to_world(*pixel_inputs)
+            # TODO: this isinstance check is to mitigate https://github.com/spacetelescope/gwcs/pull/332
+            if low_level_wcs.world_n_dim == 1 and not isinstance(coords, tuple):
+                coords = [coords]
+            # Ensure it's a list, not a tuple or bare SkyCoords object
+            if not isinstance(coords, list):
+                if isinstance(coords, tuple):
+                    coords = list(coords)
+                else:
+                    coords = [coords]
+            return coords
+
+        coords = low_level_wcs.pixel_to_world_values(*pixel_inputs)
+        if low_level_wcs.world_n_dim == 1:
+            coords = [coords]
+        return [u.Quantity(coord, unit=unit, copy=False)
+                for coord, unit in zip(coords, low_level_wcs.world_axis_units)]
+
+    def _linear_world_coords(self, low_level_wcs, linear_axes, world_indices, edges, wcs):
+        """
+        Compute world axes which are a linear function of a single pixel axis directly.
+
+        Each coordinate is shaped as if evaluated over the grid from `_generate_pixel_grid`
+        spanning only that pixel axis.
+        """
+        ranges = self._pixel_ranges(edges, wcs)
+        coords = {}
+        for i in world_indices:
+            pixel_axis, crval, scale, reference = linear_axes[i]
+            shape = [1] * len(ranges)
+            shape[pixel_axis] = len(ranges[pixel_axis])
+            values = crval + scale * (ranges[pixel_axis] - reference)
+            coords[i] = u.Quantity(values.reshape(shape), unit=low_level_wcs.world_axis_units[i],
+                                   copy=False)
+        return coords
+
+    def _evaluate_world_coords_chunked(self, wcs, edges, pixel_axes, chunks, high_level,
+                                       executor=None, n_workers=None):
+        """
+        Convert a pixel grid to a list of world coordinates tile by tile.
+
+        The grid spans ``pixel_axes`` as in `_generate_pixel_grid`.
+        The coordinates of each tile are written into preallocated outputs so
+        only one tile's intermediate arrays are held at any one time.
+        If ``executor`` is given, all tiles but the first are evaluated by it
+        concurrently. If ``chunks`` is None, the longest axis of the grid is
+        split into ``n_workers`` tiles, or one per CPU if ``n_workers`` is None.
+        """
+        resolved_wcs = wcs.wcs if isinstance(wcs, ExtraCoords) else wcs
+        shape = tuple(len(r) if i in pixel_axes else 1
+                      for i, r in enumerate(self._pixel_ranges(edges, wcs)))
+        if chunks is None:
+            n_workers = n_workers or os.cpu_count() or 1
+            longest = int(np.argmax(shape))
+            pixel_chunks = [None] * len(shape)
+            pixel_chunks[longest] = -(-shape[longest] // n_workers)
+        else:
+            pixel_chunks = self._pixel_chunks(chunks, wcs)
+        tiles = list(self._pixel_tiles(shape, pixel_chunks))
+
+        def evaluate(tile):
+            pixel_inputs = self._generate_pixel_grid(edges, wcs, pixel_axes=pixel_axes, tile=tile)
+            return self._evaluate_world_coords(resolved_wcs, pixel_inputs, high_level)
+
+        # Evaluate the first tile serially. This allocates the outputs and
+        # ensures any lazy set up of the WCS, e.g. wcsset, is done before
+        # the WCS is shared between threads.
+        first_coords = evaluate(tiles[0])
+        # Allocate full size outputs of the same type as the first tile's coords.
+        coords = [np.broadcast_to(coord[(0,) * len(shape)], shape, subok=True).copy()
+                  for coord in first_coords]
+
+        results = map(evaluate, tiles[1:]) if executor is None else executor.map(evaluate, tiles[1:])
+        for tile, tile_coords in zip(tiles, itertools.chain([first_coords], results)):
+            for coord, tile_coord in zip(coords, tile_coords):
+                coord[tile] = tile_coord
+
+        return coords
+
     @utils.misc.sanitise_wcs
-    def axis_world_coords(self, *axes, edges=False, wcs=None):
+    def axis_world_coords(self, *axes, edges=False, wcs=None, chunks=None, workers=None):
         """
         Returns WCS coordinate values of all pixels for all axes.
 
+        The computed coordinates are cached, see `coordinate_cache`.
+
         Parameters
         ----------
         axes: `int` or `str`, or multiple `int` or `str`
@@ -313,6 +711,21 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
             the WCS and extra coords.
             Default=self.wcs
 
+        chunks: `int` or `tuple` of `int`, optional
+            If given, the pixel grid is converted to world coordinates in tiles
+            of at most this many pixels along each array axis, bounding the memory
+            used by intermediate arrays.
+            A single `int` applies to all array axes. An entry of None or -1
+            means the corresponding axis is not split.
+            Default=None, i.e. each grid is converted in one go.
+
+        workers: `int` or `concurrent.futures.Executor`, optional
+            If given, the pixel grid is split into tiles which are converted
+            to world coordinates concurrently, either by a thread pool with this
+            many threads or by the given executor.
+            If ``chunks`` is not given, the grid is split into one tile per worker.
+            Default=None, i.e. the grid is converted in the calling thread.
+
         Returns
         -------
         axes_coords: `list`
@@ -325,61 +738,94 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         >>> NDCube.all_world_coords(2) # doctest: +SKIP
 
         """
-        pixel_inputs = self._generate_pixel_grid(edges, wcs)
+        entry = self._world_coords(wcs, edges, high_level=True, chunks=chunks,
+                                   workers=workers)
+        # Transpose to make dimensions mimic numpy array order rather than WCS order.
+        axes_coords = [coord.T for coord in entry.coords]
 
-        if isinstance(wcs, ExtraCoords):
-            wcs = wcs.wcs
+        if axes:
+            if isinstance(wcs, ExtraCoords):
+                wcs = wcs.wcs
+            object_indices = self._object_indices(entry.world_axes, wcs, axes)
+            axes_coords = [axes_coords[i] for i in object_indices]
+        # The cached grids are read-only, so return copies which the user can modify.
+        return tuple(coord.copy() for coord in axes_coords)
 
-        # Get world coords for all axes and all pixels.
-        axes_coords = wcs.pixel_to_world(*pixel_inputs)
+    @utils.misc.sanitise_wcs
+    def iter_axis_world_coords(self, *axes, chunks, edges=False, wcs=None):
+        """
+        Iterate over the WCS coordinate values of all pixels, one tile of pixels at a time.
 
-        # TODO: this isinstance check is to mitigate https://github.com/spacetelescope/gwcs/pull/332
-        if wcs.world_n_dim == 1 and not isinstance(axes_coords, tuple):
-            axes_coords = [axes_coords]
-        # Ensure it's a list, not a tuple or bare SkyCoords object
-        if not isinstance(axes_coords, list):
-            if isinstance(axes_coords, tuple):
-                axes_coords = list(axes_coords)
-            else:
-                axes_coords = [axes_coords]
+        Unlike `axis_world_coords`, the coordinates are neither cached nor reduced
+        to the array axes on which they depend. Instead each coordinate
+        spans the whole tile, so the memory required is bounded by the tile size.
 
-        object_names = np.array([wao_comp[0] for wao_comp in wcs.low_level_wcs.world_axis_object_components])
-        unique_obj_names = utils.misc.unique_sorted(object_names)
-        world_axes_for_obj = [np.where(object_names == name)[0] for name in unique_obj_names]
+        Parameters
+        ----------
+        axes: `int` or `str`, or multiple `int` or `str`
+            Axis number in numpy ordering or unique substring of
+            `~ndcube.NDCube.world_axis_physical_types`
+            of axes for which real world coordinates are desired.
+            axes=None implies all axes will be returned.
 
-        # Reduce duplication across independent dimensions for each coord
-        # and transpose to make dimensions mimic numpy array order rather than WCS order.
-        # This assumes all the high level objects are array-like, which seems
-        # to be the case for all the astropy ones, but it's not actually
-        # mandated by APE 14
-        for i, axis_coord in enumerate(axes_coords):
-            world_axes = world_axes_for_obj[i]
-            slices = np.array([slice(None)] * wcs.pixel_n_dim)
-            for k in world_axes:
-                slices[np.invert(wcs.axis_correlation_matrix[k])] = 0
-            axes_coords[i] = axis_coord[tuple(slices)].T
+        chunks: `int` or `tuple` of `int`
+            The maximum size of the tiles along each array axis.
+            A single `int` applies to all array axes. An entry of None or -1
+            means the corresponding axis is not split.
 
-        if not axes:
-            return tuple(axes_coords)
+        edges: `bool`
+            If True, the coords at the edges of the pixels are returned
+            rather than the coords at the center of the pixels.
+            Default=False
 
-        # Create a mapping from world index in the WCS to object index in axes_coords
-        world_index_to_object_index = {}
-        for object_index, world_axes in enumerate(world_axes_for_obj):
-            for world_index in world_axes:
-                world_index_to_object_index[world_index] = object_index
+        wcs: `astropy.wcs.wcsapi.BaseHighLevelWCS`
+            The WCS object to used to convert the world values to array indices.
+            Although technically this can be any valid WCS, it will typically be
+            self.wcs, self.extra_coords.wcs, or self.combined_wcs, combing both
+            the WCS and extra coords.
+            Default=self.wcs
 
-        world_indices = utils.wcs.calculate_world_indices_from_axes(wcs, axes)
-        object_indices = utils.misc.unique_sorted(
-            [world_index_to_object_index[world_index] for world_index in world_indices]
-        )
+        Yields
+        ------
+        item: `tuple` of `slice`
+            The location of the tile in the array of coordinates
+            which would be returned by `axis_world_coords` before reduction,
+            i.e. the pixel grid of ``wcs`` in array order.
 
-        return tuple(axes_coords[i] for i in object_indices)
+        axes_coords: `tuple`
+            High level objects giving the real world coords of the pixels in the tile
+            for the axes requested by user.
+
+        Example
+        -------
+        >>> for item, coords in cube.iter_axis_world_coords(chunks=256): # doctest: +SKIP
+        ...     output[item] = process(coords) # doctest: +SKIP
+
+        """
+        resolved_wcs = wcs.wcs if isinstance(wcs, ExtraCoords) else wcs
+        object_indices = None
+        if axes:
+            world_axes = self._world_axes(resolved_wcs.low_level_wcs, True)
+            object_indices = self._object_indices(world_axes, resolved_wcs, axes)
+
+        shape = tuple(len(r) for r in self._pixel_ranges(edges, wcs))
+        for tile in self._pixel_tiles(shape, self._pixel_chunks(chunks, wcs)):
+            pixel_inputs = self._generate_pixel_grid(edges, wcs, tile=tile)
+            # Transpose to make dimensions mimic numpy array order rather than WCS order.
+            axes_coords = [coord.T for coord in
+                           self._evaluate_world_coords(resolved_wcs, pixel_inputs, True)]
+            if object_indices is not None:
+                axes_coords = [axes_coords[i] for i in object_indices]
+            yield tile[::-1], tuple(axes_coords)
 
     @utils.misc.sanitise_wcs
-    def axis_world_coords_values(self, *axes, edges=False, wcs=None):
+    def axis_world_coords_values(self, *axes, edges=False, wcs=None, chunks=None,
+                                 workers=None, fast_linear=True):
         """
         Returns WCS coordinate values of all pixels for desired axes.
 
+        The computed coordinates are cached, see `coordinate_cache`.
+
         Parameters
         ----------
         axes: `int` or `str`, or multiple `int` or `str`
@@ -402,6 +848,29 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
             the WCS and extra coords.
             Default=self.wcs
 
+        chunks: `int` or `tuple` of `int`, optional
+            If given, the pixel grid is converted to world coordinates in tiles
+            of at most this many pixels along each array axis, bounding the memory
+            used by intermediate arrays.
+            A single `int` applies to all array axes. An entry of None or -1
+            means the corresponding axis is not split.
+            Default=None, i.e. each grid is converted in one go.
+
+        workers: `int` or `concurrent.futures.Executor`, optional
+            If given, the pixel grid is split into tiles which are converted
+            to world coordinates concurrently, either by a thread pool with this
+            many threads or by the given executor.
+            If ``chunks`` is not given, the grid is split into one tile per worker.
+            Default=None, i.e. the grid is converted in the calling thread.
+
+        fast_linear: `bool`, optional
+            If True, world axes of a FITS WCS which are a linear function of a
+            single pixel axis, e.g. most spectral and time axes, are computed directly as
+            ``crval + cdelt * (pixel - crpix)`` rather than by evaluating the WCS
+            transformation over the pixel grid.
+            The results agree with the transformation to within floating point precision.
+            See `ndcube.utils.wcs.linear_world_axes`. Default=True
+
         Returns
         -------
         coord_values: `collections.namedtuple`
@@ -415,33 +884,21 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         >>> NDCube.all_world_coords_values(2) # doctest: +SKIP
 
         """
-        pixel_inputs = self._generate_pixel_grid(edges, wcs)
+        entry = self._world_coords(wcs, edges, high_level=False, chunks=chunks,
+                                   workers=workers, fast_linear=fast_linear)
+        # Transpose to make dimensions mimic numpy array order rather than WCS order.
+        axes_coords = [coord.T for coord in entry.coords]
 
         if isinstance(wcs, ExtraCoords):
             wcs = wcs.wcs
-
         wcs = wcs.low_level_wcs
 
-        # Get world coords for all axes and all pixels.
-        axes_coords = wcs.pixel_to_world_values(*pixel_inputs)
-        if wcs.world_n_dim == 1:
-            axes_coords = [axes_coords]
-        # Ensure it's a list not a tuple
-        axes_coords = list(axes_coords)
-
-        # Reduce duplication across independent dimensions for each coord
-        # and transpose to make dimensions mimic numpy array order rather than WCS order.
-        for i, axis_coord in enumerate(axes_coords):
-            slices = np.array([slice(None)] * wcs.pixel_n_dim)
-            slices[np.invert(wcs.axis_correlation_matrix[i])] = 0
-            axes_coords[i] = axis_coord[tuple(slices)].T * u.Unit(wcs.world_axis_units[i])
-
         world_axis_physical_types = wcs.world_axis_physical_types
         # If user has supplied axes, extract only the
         # world coords that correspond to those axes.
         if axes:
             world_indices = utils.wcs.calculate_world_indices_from_axes(wcs, axes)
-            axes_coords = np.array(axes_coords)[world_indices]
+            axes_coords = [axes_coords[i] for i in world_indices]
             world_axis_physical_types = tuple(np.array(world_axis_physical_types)[world_indices])
 
         # Return in array order.
@@ -453,7 +910,8 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
             identifier = identifier.replace("-", "__")
             identifiers.append(identifier)
         CoordValues = namedtuple("CoordValues", identifiers)
-        return CoordValues(*axes_coords[::-1])
+        # The cached grids are read-only, so return copies which the user can modify.
+        return CoordValues(*[coord.copy() for coord in axes_coords[::-1]])
 
     @utils.misc.sanitise_wcs
     def crop(self, lower_corner, upper_corner, wcs=None):
@@ -466,6 +924,106 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         # The docstring is defined in NDCubeBase
         # Sanitize inputs.
         lower_corner, upper_corner = utils.misc.sanitize_corners(lower_corner, upper_corner)
+        lower_corner, upper_corner = self._corner_values_to_quantities(lower_corner,
+                                                                       upper_corner, units)
+        return self._crop(lower_corner, upper_corner, wcs, True)
+
+    @utils.misc.sanitise_wcs
+    def crop_many(self, lower_corners, upper_corners, wcs=None):
+        """
+        Crops many regions of interest out of an NDCube given the real world coords of their corners.
+
+        This is equivalent to calling `crop` for each pair of corners but converts
+        all the corners to array indices in a single call to the WCS, which is
+        much faster when cropping many regions.
+
+        Parameters
+        ----------
+        lower_corners: iterable of lower corners
+            The lower corner of each region of interest.
+            Each is of the form accepted by the ``lower_corner`` argument of `crop`.
+
+        upper_corners: iterable of upper corners
+            The upper corner of each region of interest.
+            Each is of the form accepted by the ``upper_corner`` argument of `crop`.
+            Must be the same length as ``lower_corners``.
+
+        wcs: `astropy.wcs.wcsapi.BaseHighLevelWCS`
+            The WCS object to used to convert the world values to array indices.
+            Although technically this can be any valid WCS, it will typically be
+            self.wcs, self.extra_coords.wcs, or self.combined_wcs, combing both
+            the WCS and extra coords.
+            Default=self.wcs
+
+        Returns
+        -------
+        result: `list` of `ndcube.NDCube`
+            The cropped cube for each region, in the order of the input corners.
+
+        """
+        lower_corners, upper_corners = self._sanitize_many_corners(lower_corners, upper_corners)
+        return self._crop_many(lower_corners, upper_corners, wcs, False)
+
+    @utils.misc.sanitise_wcs
+    def crop_by_values_many(self, lower_corners, upper_corners, units=None, wcs=None):
+        """
+        Crops many regions of interest out of an NDCube given real world bounds for each real world axis.
+
+        This is equivalent to calling `crop_by_values` for each pair of corners
+        but converts all the corners to array indices in a single call to the WCS,
+        which is much faster when cropping many regions.
+
+        Parameters
+        ----------
+        lower_corners: iterable of lower corners
+            The lower corner of each region of interest.
+            Each is of the form accepted by the ``lower_corner`` argument of `crop_by_values`.
+
+        upper_corners: iterable of upper corners
+            The upper corner of each region of interest.
+            Each is of the form accepted by the ``upper_corner`` argument of `crop_by_values`.
+            Must be the same length as ``lower_corners``.
+
+        units: iterable of `astropy.units.Unit`
+            The unit of the corresponding entries in each corner.
+            Only used if the corresponding type is not a `astropy.units.Quantity`.
+
+        wcs: `astropy.wcs.wcsapi.BaseLowLevelWCS`
+            The WCS object to used to convert the world values to array indices.
+            Although technically this can be any valid WCS, it will typically be
+            self.wcs, self.extra_coords.wcs, or self.combined_wcs, combing both
+            the WCS and extra coords.
+            Default=self.wcs
+
+        Returns
+        -------
+        result: `list` of `ndcube.NDCube`
+            The cropped cube for each region, in the order of the input corners.
+
+        """
+        lower_corners, upper_corners = self._sanitize_many_corners(lower_corners, upper_corners)
+        for j, (lower_corner, upper_corner) in enumerate(zip(lower_corners, upper_corners)):
+            lower_corners[j], upper_corners[j] = self._corner_values_to_quantities(
+                lower_corner, upper_corner, units)
+        return self._crop_many(lower_corners, upper_corners, wcs, True)
+
+    @staticmethod
+    def _sanitize_many_corners(lower_corners, upper_corners):
+        lower_corners = list(lower_corners)
+        upper_corners = list(upper_corners)
+        if len(lower_corners) != len(upper_corners):
+            raise ValueError("lower_corners and upper_corners must have the same length. "
+                             f"Lengths: {len(lower_corners)}, {len(upper_corners)}")
+        corners = [utils.misc.sanitize_corners(lower_corner, upper_corner)
+                   for lower_corner, upper_corner in zip(lower_corners, upper_corners)]
+        n_coords = set(len(lower_corner) for lower_corner, _ in corners)
+        if len(n_coords) > 1:
+            raise ValueError("All corner inputs must have same number of coordinate objects. "
+                             f"Lengths of corner objects: {n_coords}")
+        return [corner[0] for corner in corners], [corner[1] for corner in corners]
+
+    @staticmethod
+    def _corner_values_to_quantities(lower_corner, upper_corner, units):
         n_coords = len(lower_corner)
         if units is None:
             units = [None] * n_coords
@@ -488,8 +1046,39 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
             # Convert each corner value to the same unit.
             if lower_corner[i] is not None and upper_corner[i] is not None:
                 upper_corner[i] = upper_corner[i].to(lower_corner[i].unit)
+        return lower_corner, upper_corner
 
-        return self._crop(lower_corner, upper_corner, wcs, True)
+    def _crop_transforms(self, wcs, crop_by_values):
+        # Define functions to be used in converting between array indices and world coords
+        # based in input kwarg.
+        if crop_by_values:
+            try:
+                return wcs.world_to_array_index_values, wcs.array_index_to_world_values
+            except AttributeError:
+                return (wcs.low_level_wcs.world_to_array_index_values,
+                        wcs.low_level_wcs.array_index_to_world_values)
+        return wcs.world_to_array_index, wcs.array_index_to_world
+
+    def _cube_world_intervals(self, array_index_to_world):
+        # Calculate real world coords for first and last index for all axes.
+        array_intervals = [[0, np.round(d.value - 1).astype(int)] for d in self.dimensions]
+        return array_index_to_world(*array_intervals)
+
+    def _crop_item(self, lower_indices, upper_indices):
+        # Construct item which which to slice NDCube.
+        item = []
+        for i, (lower, upper) in enumerate(zip(lower_indices, upper_indices)):
+            # If upper limit index less than zero,
+            # then interval does not overlap with cube range. Raise error.
+            if upper < 0:
+                raise IndexError("Input real world interval beyond range of NDCube. "
+                                 f"Axis: {i}; Axis length: {self.dimensions[i]}; "
+                                 f"Derived array indices: {(lower, upper)}; ")
+            # Construct slice for this axis and append to item.
+            # Increment upper idex by 1 to ensure the upper world coord
+            # is included in sliced cube.
+            item.append(slice(max(0, lower), upper + 1))
+        return tuple(item)
 
     def _crop(self, lower_corner, upper_corner, wcs, crop_by_values):
         lower_corner = list(lower_corner)
@@ -500,31 +1089,19 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         if (lower_nones & upper_nones).all():
             return self
 
-        # Define functions to be used in converting between array indices and world coords
-        # based in input kwarg.
+        world_to_array_index, array_index_to_world = self._crop_transforms(wcs, crop_by_values)
         if crop_by_values:
-            try:
-                world_to_array_index = wcs.world_to_array_index_values
-                array_index_to_world = wcs.array_index_to_world_values
-            except AttributeError:
-                world_to_array_index = wcs.low_level_wcs.world_to_array_index_values
-                array_index_to_world = wcs.low_level_wcs.array_index_to_world_values
             # Convert coordinates to units used by WCS as WCS.world_to_array_index
             # does not handle quantities.
             lower_corner = utils.misc.convert_quantities_to_units(lower_corner,
                                                                   self.wcs.world_axis_units)
             upper_corner = utils.misc.convert_quantities_to_units(upper_corner,
                                                                   self.wcs.world_axis_units)
-        else:
-            world_to_array_index = wcs.world_to_array_index
-            array_index_to_world = wcs.array_index_to_world
 
         # If user did not provide all intervals,
         # calculate missing intervals based on whole cube range along those axes.
         if lower_nones.any() or upper_nones.any():
-            # Calculate real world coords for first and last index for all axes.
-            array_intervals = [[0, np.round(d.value - 1).astype(int)] for d in self.dimensions]
-            intervals = array_index_to_world(*array_intervals)
+            intervals = self._cube_world_intervals(array_index_to_world)
             # Overwrite None corner values with world coords of first or last index.
             iterable = zip(lower_nones, upper_nones, intervals)
             for i, (lower_is_none, upper_is_none, interval) in enumerate(iterable):
@@ -539,20 +1116,53 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         if not isinstance(lower_indices, tuple):
             lower_indices = (lower_indices,)
             upper_indices = (upper_indices,)
-        # Construct item which which to slice NDCube.
-        item = []
-        for i, (lower, upper) in enumerate(zip(lower_indices, upper_indices)):
-            # If upper limit index less than zero,
-            # then interval does not overlap with cube range. Raise error.
-            if upper < 0:
-                raise IndexError("Input real world interval beyond range of NDCube. "
-                                 f"Axis: {i}; Axis length: {self.dimensions[i]}; "
-                                 f"Derived array indices: {(lower, upper)}; ")
-            # Construct slice for this axis and append to item.
-            # Increment upper idex by 1 to ensure the upper world coord
-            # is included in sliced cube.
-            item.append(slice(max(0, lower), upper + 1))
-        return self[tuple(item)]
+        return self[self._crop_item(lower_indices, upper_indices)]
+
+    def _crop_many(self, lower_corners, upper_corners, wcs, crop_by_values):
+        results = [self] * len(lower_corners)
+        # Regions for which no intervals are provided are not sliced.
+        regions = [j for j, (lower_corner, upper_corner) in enumerate(zip(lower_corners, upper_corners))
+                   if not all(lower is None and upper is None
+                              for lower, upper in zip(lower_corner, upper_corner))]
+        if not regions:
+            return results
+
+        world_to_array_index, array_index_to_world = self._crop_transforms(wcs, crop_by_values)
+        # Gather the lower then upper corners of all regions for each world coordinate.
+        corners = [lower_corners[j] for j in regions] + [upper_corners[j] for j in regions]
+        coords = [list(coord) for coord in zip(*corners)]
+        if crop_by_values:
+            # Convert coordinates to values in the units used by the WCS as
+            # WCS.world_to_array_index_values does not handle quantities.
+            coords = [[value.to_value(unit) if isinstance(value, u.Quantity) else value
+                       for value in coord]
+                      for coord, unit in zip(coords, self.wcs.world_axis_units)]
+
+        # Replace None corner values with the world coords of the first or last index,
+        # calculating the cube's world coord range only once.
+        if any(value is None for coord in coords for value in coord):
+            intervals = self._cube_world_intervals(array_index_to_world)
+            if len(coords) == 1:
+                intervals = [intervals]
+            n_regions = len(regions)
+            for coord, interval in zip(coords, intervals):
+                for k, value in enumerate(coord):
+                    if value is None:
+                        coord[k] = interval[0] if k < n_regions else interval[-1]
+
+        # Stack the corners of all regions into one object per world coordinate.
+        coords = [utils.misc.stack_world_objects(coord) for coord in coords]
+
+        # Convert the corners of all regions to array indices in one go.
+        indices = world_to_array_index(*coords)
+        # Ensure return type is tuple of arrays, even if only one axis returned.
+        if not isinstance(indices, tuple):
+            indices = (indices,)
+        indices = np.stack([np.asarray(index).reshape(-1) for index in indices])
+        lower_indices, upper_indices = np.split(indices, 2, axis=1)
+        for k, j in enumerate(regions):
+            results[j] = self[self._crop_item(lower_indices[:, k], upper_indices[:, k])]
+        return results
 
     def __str__(self):
         return textwrap.dedent(f"""\
@@ -564,7 +1174,65 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
     def __repr__(self):
         return f"{object.__repr__(self)}\n{str(self)}"
 
-    def explode_along_axis(self, axis):
+    @property
+    def is_lazy(self):
+        """
+        True if the data, mask or uncertainty of the cube is a dask array.
+        """
+        return any(utils.misc.is_dask_array(array) for array in self._lazy_arrays())
+
+    def _lazy_arrays(self):
+        uncertainty = getattr(self.uncertainty, "array", None)
+        return (self.data, self.mask, uncertainty)
+
+    def _new_from_dask(self, method):
+        # Apply a dask function, e.g. dask.compute, to the data, mask and uncertainty
+        # in one go so shared parts of their task graphs are only evaluated once.
+        data, mask, uncertainty = method(*self._lazy_arrays())
+        if self.uncertainty is not None:
+            uncertainty = type(self.uncertainty)(uncertainty, unit=self.uncertainty.unit,
+                                                 copy=False)
+        new_cube = type(self)(data, wcs=self.wcs, uncertainty=uncertainty, mask=mask,
+                              meta=self.meta, unit=self.unit, extra_coords=self.extra_coords,
+                              copy=False)
+        new_cube._global_coords._internal_coords = self._global_coords._internal_coords
+        return new_cube
+
+    def compute(self, **kwargs):
+        """
+        Return a new cube with any dask arrays in the data, mask and uncertainty computed.
+
+        Keyword arguments are passed to `dask.compute`.
+        If the cube holds no dask arrays, it is returned unchanged.
+
+        Returns
+        -------
+        result: `ndcube.NDCube`
+        """
+        if not self.is_lazy:
+            return self
+        import dask
+        return self._new_from_dask(lambda *arrays: dask.compute(*arrays, **kwargs))
+
+    def persist(self, **kwargs):
+        """
+        Return a new cube with any dask arrays in the data, mask and uncertainty persisted.
+
+        Persisted dask arrays are still lazy but their chunks are computed
+        and held in memory, or on a distributed cluster.
+        Keyword arguments are passed to `dask.persist`.
+        If the cube holds no dask arrays, it is returned unchanged.
+
+        Returns
+        -------
+        result: `ndcube.NDCube`
+        """
+        if not self.is_lazy:
+            return self
+        import dask
+        return self._new_from_dask(lambda *arrays: dask.persist(*arrays, **kwargs))
+
+    def explode_along_axis(self, axis, lazy=False, cache_size=16):
         """
         Separates slices of NDCubes along a given axis into an NDCubeSequence of (N-1)DCubes.
 
@@ -573,6 +1241,16 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         axis : `int`
             The array axis along which the data is to be changed.
 
+        lazy : `bool`, optional
+            If True, the (N-1)DCubes are only created when they are accessed,
+            so exploding the cube is cheap regardless of the length of the axis.
+            See `ndcube.utils.sequence.SlicedCubeList`.
+            Default=False
+
+        cache_size : `int`, optional
+            If ``lazy`` is True, the maximum number of (N-1)DCubes which are
+            kept after they have been accessed. Default=16
+
         Returns
         -------
         result : `ndcube.NDCubeSequence`
@@ -580,23 +1258,218 @@ class NDCubeBase(NDCubeSlicingMixin, NDCubeABC):
         # If axis is -ve then calculate the axis from the length of the dimensions of one cube
         if axis < 0:
             axis = len(self.dimensions) + axis
-        # To store the resultant cube
-        result_cubes = []
         # All slices are initially initialised as slice(None, None, None)
         cube_slices = [slice(None, None, None)] * self.data.ndim
-        # Slicing the cube inside result_cube
+        items = []
         for i in range(self.data.shape[axis]):
             # Setting the slice value to the index so that the slices are done correctly.
             cube_slices[axis] = i
-            # Set to None the metadata of sliced cubes.
-            item = tuple(cube_slices)
-            sliced_cube = self[item]
-            sliced_cube.meta = None
-            # Appending the sliced cubes in the result_cube list
-            result_cubes.append(sliced_cube)
+            items.append(tuple(cube_slices))
+        # Set to None the metadata of sliced cubes.
+        result_cubes = utils.sequence.SlicedCubeList(self, items, meta=None,
+                                                     cache_size=cache_size)
+        if not lazy:
+            result_cubes = list(result_cubes)
         # Creating a new NDCubeSequence with the result_cubes and common axis as axis
         return NDCubeSequence(result_cubes, meta=self.meta)
 
+    def rebin(self, factor, operation=np.mean, propagate_uncertainties=True, chunks=None):
+        """
+        Downsample the cube by combining blocks of neighbouring array elements.
+
+        The data, mask and uncertainty are reshaped so that each block spans its own
+        axes and then reduced along those axes in a single vectorised call.
+        The WCS is wrapped in a `~ndcube.wcs.wrappers.ResampledLowLevelWCS` so that
+        each new pixel is located at the centre of its block. Extra coords are
+        resampled consistently.
+
+        Parameters
+        ----------
+        factor: `int` or iterable of `int`
+            The number of array elements along each array axis to combine into one
+            element of the new cube. A single `int` applies to all axes.
+            Each factor must exactly divide the length of its axis.
+
+        operation: function, optional
+            The function used to combine each block, called as
+            ``operation(array, axis=axes)``, e.g. `numpy.sum` or `numpy.median`.
+            Masked elements are excluded from the operation, see
+            `ndcube.utils.cube.reduce_arrays`. Default=`numpy.mean`
+
+        propagate_uncertainties: `bool`, optional
+            If True, uncertainties are propagated, assuming they are uncorrelated.
+            This is only possible if ``operation`` is a sum or mean.
+            If False, the new cube has no uncertainty. Default=True
+
+        chunks: `int` or iterable of `int`, optional
+            If given, the new cube is computed in chunks of this many elements
+            along each of its array axes, bounding the memory used by intermediate arrays.
+            A single `int` applies to all axes. A chunk size of None or -1 means the axis
+            is not split. The arrays of the new cube are then always numpy arrays.
+            Default=None, i.e. the new cube is computed in one go.
+
+        Returns
+        -------
+        result: `ndcube.NDCube`
+        """
+        return self._rebin(self._sanitize_rebin_factor(factor), operation,
+                           propagate_uncertainties, chunks)
+
+    def reduce(self, axes, operation=np.sum, propagate_uncertainties=True, chunks=None,
+               **kwargs):
+        """
+        Reduce the cube along one or more array axes, removing those axes.
+
+        The result is equivalent to rebinning the cube by the full length of each
+        reduced axis and then slicing those axes away. So the WCS of the new cube has the
+        reduced axes dropped, just as slicing does, and the world coordinates of the
+        reduced axes, evaluated at their centres, are available in
+        `~ndcube.NDCube.global_coords`.
+
+        Parameters
+        ----------
+        axes: `int`, `str` or iterable of `int` or `str`
+            The array axes to reduce. Strings are world axis physical types, or unique
+            substrings of them, in `~ndcube.NDCube.combined_wcs`. Such an axis is resolved
+            to all the array axes on which that physical type depends.
+
+        operation: function, optional
+            The reduction, called as ``operation(array, axis=axes, **kwargs)``,
+            e.g. `numpy.sum`, `numpy.mean`, `numpy.median` or `numpy.percentile`.
+            Masked elements are excluded from the reduction, see
+            `ndcube.utils.cube.reduce_arrays`. Default=`numpy.sum`
+
+        propagate_uncertainties: `bool`, optional
+            If True, uncertainties are propagated, assuming they are uncorrelated.
+            This is only possible if ``operation`` is a sum or mean.
+            If False, the new cube has no uncertainty. Default=True
+
+        chunks: `int` or iterable of `int`, optional
+            If given, the reduction is done in chunks of this many elements
+            along each array axis which is not reduced, bounding the memory used by
+            intermediate arrays. See `~ndcube.NDCube.rebin`. Default=None
+
+        **kwargs
+            Passed to ``operation``, e.g. ``q=90`` for `numpy.percentile`.
+
+        Returns
+        -------
+        result: `ndcube.NDCube`
+        """
+        array_axes = self._sanitize_reduce_axes(axes)
+        factor = tuple(n if i in array_axes else 1 for i, n in enumerate(self.data.shape))
+        if chunks is not None:
+            if isinstance(chunks, numbers.Integral):
+                chunks = (chunks,) * self.data.ndim
+            chunks = tuple(None if i in array_axes else chunk for i, chunk in enumerate(chunks))
+        rebinned = self._rebin(factor, operation, propagate_uncertainties, chunks, **kwargs)
+        return rebinned[tuple(0 if i in array_axes else slice(None)
+                              for i in range(self.data.ndim))]
+
+    def _sanitize_reduce_axes(self, axes):
+        if isinstance(axes, (numbers.Integral, str)):
+            axes = (axes,)
+        ndim = self.data.ndim
+        array_axes = set()
+        for axis in axes:
+            if isinstance(axis, str):
+                pixel_axes = utils.wcs.physical_type_to_pixel_axes(
+                    axis, self.combined_wcs.low_level_wcs)
+                array_axes.update(int(axis) for axis in utils.wcs.convert_between_array_and_pixel_axes(
+                    np.atleast_1d(pixel_axes), ndim))
+            elif isinstance(axis, numbers.Integral) and -ndim <= axis < ndim:
+                array_axes.add(int(axis) % ndim)
+            else:
+                raise ValueError(f"axes must be array axis indices or physical types, got {axis}.")
+        if len(array_axes) == ndim:
+            raise ValueError("Cannot reduce all the axes of a cube.")
+        return tuple(sorted(array_axes))
+
+    def _rebin(self, factor, operation, propagate_uncertainties, chunks, **kwargs):
+        data, mask, uncertainty = self._block_reduce(factor, operation, propagate_uncertainties,
+                                                     chunks, **kwargs)
+        pixel_factor = factor[::-1]
+        wcs = HighLevelWCSWrapper(normalize_wrappers(
+            ResampledLowLevelWCS(self.wcs.low_level_wcs, pixel_factor,
+                                 offset=[(f - 1) / 2 for f in pixel_factor])))
+        new_cube = type(self)(data, wcs=wcs, uncertainty=uncertainty, mask=mask, meta=self.meta,
+                              unit=self.unit, extra_coords=self.extra_coords.resample(factor))
+        new_cube._global_coords._internal_coords = self._global_coords._internal_coords
+        return new_cube
+
+    def _sanitize_rebin_factor(self, factor):
+        shape = self.data.shape
+        if isinstance(factor, numbers.Integral):
+            factor = (factor,) * len(shape)
+        factor = tuple(factor)
+        if len(factor) != len(shape):
+            raise ValueError(f"factor must have one entry per array axis ({len(shape)}), "
+                             f"got {factor}.")
+        if not all(isinstance(f, numbers.Integral) and f > 0 for f in factor):
+            raise ValueError(f"factor must be made of positive integers, got {factor}.")
+        if any(n % f for n, f in zip(shape, factor)):
+            raise ValueError(f"factor {factor} must exactly divide the array shape {shape}.")
+        return factor
+
+    def _block_reduce(self, factor, operation, propagate_uncertainties, chunks, **kwargs):
+        # Reduce the data, mask and uncertainty in blocks of the given shape,
+        # optionally one chunk of the output at a time.
+        mask = self.mask
+        if mask is not None and np.shape(mask) != self.data.shape:
+            mask = None if np.ndim(mask) == 0 and not mask else np.broadcast_to(mask,
+                                                                                 self.data.shape)
+        uncertainty = self.uncertainty
+        if uncertainty is not None and uncertainty.array is None:
+            uncertainty = None
+        if chunks is None:
+            return self._block_reduce_arrays(self.data, mask, uncertainty, factor, operation,
+                                             propagate_uncertainties, **kwargs)
+
+        if isinstance(chunks, numbers.Integral):
+            chunks = (chunks,) * self.data.ndim
+        chunks = tuple(None if chunk in (None, -1) else int(chunk) for chunk in chunks)
+        if len(chunks) != self.data.ndim or any(c is not None and c < 1 for c in chunks):
+            raise ValueError("chunks must be a positive int or have one positive entry per "
+                             f"array axis ({self.data.ndim}), got {chunks}.")
+        new_shape = tuple(n // f for n, f in zip(self.data.shape, factor))
+        new_data = new_mask = new_uncertainty = None
+        for tile in self._pixel_tiles(new_shape, chunks):
+            item = tuple(slice(t.start * f, t.stop * f) for t, f in zip(tile, factor))
+            tile_uncertainty = None
+            if uncertainty is not None:
+                tile_uncertainty = type(uncertainty)(uncertainty.array[item],
+                                                     unit=uncertainty.unit, copy=False)
+            data, tile_mask, tile_uncertainty = self._block_reduce_arrays(
+                self.data[item], None if mask is None else mask[item], tile_uncertainty,
+                factor, operation, propagate_uncertainties, **kwargs)
+            if new_data is None:
+                new_data = np.empty(new_shape, dtype=np.asarray(data).dtype)
+                if tile_mask is not None:
+                    new_mask = np.empty(new_shape, dtype=bool)
+                if tile_uncertainty is not None:
+                    new_uncertainty = type(tile_uncertainty)(
+                        np.empty(new_shape, dtype=tile_uncertainty.array.dtype),
+                        unit=tile_uncertainty.unit, copy=False)
+            new_data[tile] = data
+            if new_mask is not None:
+                new_mask[tile] = tile_mask
+            if new_uncertainty is not None:
+                new_uncertainty.array[tile] = tile_uncertainty.array
+        return new_data, new_mask, new_uncertainty
+
+    @staticmethod
+    def _block_reduce_arrays(data, mask, uncertainty, factor, operation, propagate_uncertainties,
+                             **kwargs):
+        data, block_axes = utils.cube.block_reshape(data, factor)
+        if mask is not None:
+            mask = utils.cube.block_reshape(mask, factor)[0]
+        if uncertainty is not None:
+            uncertainty = type(uncertainty)(utils.cube.block_reshape(uncertainty.array, factor)[0],
+                                            unit=uncertainty.unit, copy=False)
+        return utils.cube.reduce_arrays(data, mask, uncertainty, block_axes, operation,
+                                        propagate_uncertainties=propagate_uncertainties,
+                                        **kwargs)
+
 
 class NDCube(NDCubeBase, NDCubePlotMixin, astropy.nddata.NDArithmeticMixin):
     """
@@ -644,3 +1517,80 @@ class NDCube(NDCubeBase, NDCubePlotMixin, astropy.nddata.NDArithmeticMixin):
         Default is False.
 
     """
+
+    def _arithmetic(self, operation, operand, *args, **kwargs):
+        # astropy's NDArithmeticMixin combines data and units into a Quantity
+        # which would load dask arrays into memory. So for dask arrays, the
+        # data are combined without units and the unit of the result is passed
+        # to the new cube separately.
+        if not (utils.misc.is_dask_array(self.data) or utils.misc.is_dask_array(operand.data)):
+            return super()._arithmetic(operation, operand, *args, **kwargs)
+        result, init_kwargs = super()._arithmetic(operation, operand, *args, **kwargs)
+        init_kwargs["unit"] = self._arithmetic_unit(operation, operand)
+        return result, init_kwargs
+
+    def _arithmetic_data(self, operation, operand, **kwargs):
+        if not (utils.misc.is_dask_array(self.data) or utils.misc.is_dask_array(operand.data)):
+            return super()._arithmetic_data(operation, operand, **kwargs)
+        if self.unit is None and operand.unit is None:
+            return operation(self.data, operand.data)
+        if operation in (np.add, np.subtract):
+            # Convert the operand's data to the unit of the result, see _arithmetic_unit.
+            self_unit = self.unit or u.dimensionless_unscaled
+            operand_unit = operand.unit or u.dimensionless_unscaled
+            return operation(self.data, operand.data * operand_unit.to(self_unit))
+        return operation(self.data, operand.data)
+
+    def _arithmetic_uncertainty(self, operation, operand, result, correlation, **kwargs):
+        unit = self._arithmetic_unit(operation, operand)
+        if utils.misc.is_dask_array(result) and unit is not None:
+            # Uncertainty propagation only uses the unit of the result's data,
+            # which is not held by a dask array.
+            result = SimpleNamespace(unit=unit)
+            if operation in (np.add, np.subtract):
+                # astropy converts the uncertainties to the unit of the result
+                # via Quantities, which cannot hold dask arrays. So convert them
+                # here and propagate them through the public NDUncertainty API.
+                return self._propagate_uncertainty_in_unit(operation, operand, result,
+                                                           correlation, unit)
+        return super()._arithmetic_uncertainty(operation, operand, result, correlation, **kwargs)
+
+    def _propagate_uncertainty_in_unit(self, operation, operand, result, correlation, unit):
+        """
+        Propagate the uncertainties of both operands after converting them to suit data in ``unit``.
+        """
+        uncertainty, operand_uncertainty = self.uncertainty, operand.uncertainty
+        if uncertainty is None and operand_uncertainty is None:
+            return None
+        # Like astropy, treat a missing uncertainty as zero.
+        if uncertainty is None:
+            uncertainty = type(operand_uncertainty)(None)
+        if operand_uncertainty is None:
+            operand_uncertainty = type(uncertainty)(None)
+        nddata = astropy.nddata.NDData(
+            self.data, uncertainty=self._uncertainty_in_unit(uncertainty, unit), unit=unit)
+        operand = astropy.nddata.NDData(
+            operand.data, uncertainty=self._uncertainty_in_unit(operand_uncertainty, unit),
+            unit=unit)
+        return nddata.uncertainty.propagate(operation, operand, result, correlation)
+
+    @staticmethod
+    def _uncertainty_in_unit(uncertainty, unit):
+        """
+        Convert an uncertainty to suit data in ``unit``, going via its variance.
+        """
+        if uncertainty.array is None or uncertainty.unit is None:
+            return uncertainty
+        variance = uncertainty.represent_as(astropy.nddata.VarianceUncertainty)
+        variance = astropy.nddata.VarianceUncertainty(
+            variance.array * variance.unit.to(unit**2), unit=unit**2, copy=False)
+        return variance.represent_as(type(uncertainty))
+
+    def _arithmetic_unit(self, operation, operand):
+        if self.unit is None and operand.unit is None:
+            return None
+        self_unit = self.unit or u.dimensionless_unscaled
+        operand_unit = operand.unit or u.dimensionless_unscaled
+        if operation in (np.add, np.subtract):
+            return self_unit
+        return operation(u.Quantity(1, self_unit), u.Quantity(1, operand_unit)).unit
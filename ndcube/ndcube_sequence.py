@@ -1,11 +1,16 @@
-import copy
 import numbers
 import textwrap
+import itertools
 
 import astropy.units as u
+import astropy.wcs
 import numpy as np
+from astropy.wcs.wcsapi import HighLevelWCSWrapper
+from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
 
 from ndcube import utils
+from ndcube.extra_coords import ExtraCoords
+from ndcube.wcs.wrappers import CompoundLowLevelWCS, ReorderedLowLevelWCS
 
 __all__ = ['NDCubeSequence']
 
@@ -48,6 +53,64 @@ class NDCubeSequenceBase:
             self._common_axis = int(common_axis)
         else:
             self._common_axis = common_axis
+        self._common_axis_coords_cache = None
+        self._cumul_lengths_cache = None
+
+    @property
+    def data(self):
+        """
+        The cubes in the sequence.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data_list):
+        if not isinstance(data_list, utils.sequence.SlicedCubeList):
+            data_list = utils.sequence._CubeList(data_list)
+        self._data = data_list
+        self._shapes_cache = self._find_shapes()
+
+    def _find_shapes(self):
+        """
+        Find the array shape of each cube, along with the modification count of the list of cubes.
+
+        The shapes are None if the cubes do not all have the same number of dimensions.
+        """
+        if isinstance(self._data, utils.sequence.SlicedCubeList):
+            shapes = self._data.shapes
+        else:
+            shapes = [cube.data.shape for cube in self._data]
+        if len(set(len(shape) for shape in shapes)) > 1:
+            shapes = None
+        else:
+            shapes = np.array(shapes, dtype=int).reshape(len(shapes), -1 if shapes else 0)
+        return getattr(self._data, "_version", None), shapes
+
+    @property
+    def _shapes(self):
+        """
+        The array shape of each cube, one row per cube.
+
+        The dimensions of the sequence are derived from these. They are found
+        when the cubes are set and again only after the list of cubes has been
+        modified in place. A SlicedCubeList is read-only, so is never modified.
+        """
+        if self._shapes_cache[0] != getattr(self._data, "_version", None):
+            self._shapes_cache = self._find_shapes()
+        shapes = self._shapes_cache[1]
+        if shapes is None:
+            raise ValueError("All cubes in the sequence must have the same number of dimensions.")
+        return shapes
+
+    def _cumul_lengths(self, axis):
+        """
+        The cumulative lengths of the cubes along an axis, cached until the cubes are replaced.
+        """
+        cache = self._cumul_lengths_cache
+        if cache is None or cache[0] is not self._shapes or cache[1] != axis:
+            cache = (self._shapes, axis, np.cumsum(self._shapes[:, axis]))
+            self._cumul_lengths_cache = cache
+        return cache[2]
 
     @property
     def dimensions(self):
@@ -58,18 +121,16 @@ class NDCubeSequenceBase:
 
     @property
     def _dimensions(self):
-        dimensions = [len(self.data) * u.pix] + list(self.data[0].dimensions)
+        dimensions = [len(self.data) * u.pix] + list(u.Quantity(self._shapes[0], unit=u.pix))
         if len(dimensions) > 1:
             # If there is a common axis, length of cube's along it may not
             # be the same. Therefore if the lengths are different,
             # represent them as a tuple of all the values, else as an int.
             if self._common_axis is not None:
-                common_axis_lengths = [cube.data.shape[self._common_axis] for cube in self.data]
-                if len(np.unique(common_axis_lengths)) != 1:
-                    common_axis_dimensions = [cube.dimensions[self._common_axis]
-                                              for cube in self.data]
-                    dimensions[self._common_axis + 1] = u.Quantity(
-                        common_axis_dimensions, unit=common_axis_dimensions[0].unit)
+                common_axis_lengths = self._shapes[:, self._common_axis]
+                if (common_axis_lengths != common_axis_lengths[0]).any():
+                    dimensions[self._common_axis + 1] = u.Quantity(common_axis_lengths,
+                                                                   unit=u.pix)
         return tuple(dimensions)
 
     @property
@@ -86,16 +147,9 @@ class NDCubeSequenceBase:
         """
         if not isinstance(self._common_axis, int):
             raise TypeError("Common axis must be set.")
-        dimensions = list(self._dimensions)
-        cube_like_dimensions = list(self._dimensions[1:])
-        if dimensions[self._common_axis + 1].isscalar:
-            cube_like_dimensions[self._common_axis] = u.Quantity(
-                dimensions[0].value * dimensions[self._common_axis + 1].value, unit=u.pix)
-        else:
-            cube_like_dimensions[self._common_axis] = sum(dimensions[self._common_axis + 1])
-        # Combine into single Quantity
-        cube_like_dimensions = u.Quantity(cube_like_dimensions, unit=u.pix)
-        return cube_like_dimensions
+        cube_like_dimensions = self._shapes[0].copy()
+        cube_like_dimensions[self._common_axis] = self._shapes[:, self._common_axis].sum()
+        return u.Quantity(cube_like_dimensions, unit=u.pix)
 
     @property
     def cube_like_array_axis_physical_types(self):
@@ -157,33 +211,186 @@ class NDCubeSequenceBase:
         are returned.  Coordinates from different cubes are concatenated along the
         common axis.  They thus represent the coordinate values at each location as
         if all cubes in the sequence were concatenated along the common axis.
+        Each coordinate is returned as a list of its values at each location.
+        See `cube_like_common_axis_coords` for the coordinates as single objects.
+        """
+        # For each coordinate, break up the concatenated coordinate object into a list
+        # of coordinate objects that are length-1 and sequential along the common axis.
+        sequence_coords = []
+        coords, axes, _ = self._concatenated_common_axis_coords(self._common_axis)
+        for coord, axis in zip(coords, axes):
+            # The cached coordinates are read-only, so split up a copy the user can modify.
+            coord = coord.copy()
+            item = [slice(None)] * len(coord.shape)
+            exploded_coord = []
+            for i in range(coord.shape[axis]):
+                item[axis] = i
+                exploded_coord.append(coord[tuple(item)])
+            sequence_coords.append(exploded_coord)
+        return sequence_coords
+
+    @property
+    def cube_like_common_axis_coords(self):
+        """
+        The coordinates along the common axis as if all cubes were concatenated along it.
+
+        Each coordinate associated with the common axis is returned as a single
+        coordinate object, e.g. `~astropy.units.Quantity`, `~astropy.time.Time` or
+        `~astropy.coordinates.SkyCoord`, made by concatenating the coordinates of
+        every cube along the common axis. The result is cached until the cubes in
+        the sequence, or their WCS or extra coords, are replaced. The cached
+        coordinate objects are read-only, so copies of them are returned.
         """
-        common_axis = self._common_axis
-        # Get coordinate objects associated with the common axis in all cubes.
-        common_axis_names = set.intersection(*[set(cube.array_axis_physical_types[common_axis])
-                                               for cube in self.data])
+        return [coord.copy()
+                for coord in self._concatenated_common_axis_coords(self._common_axis)[0]]
+
+    def _concatenated_common_axis_coords(self, common_axis):
+        """
+        Return the coordinates along an axis, concatenated across the cubes.
+
+        Also returns the axis of each coordinate object which corresponds to
+        ``common_axis`` and the world axes, in the cubes' ``combined_wcs``,
+        represented by each coordinate object.
+        """
+        if common_axis is None:
+            raise ValueError("Common axis must be set.")
+        data = self.data
+        if isinstance(data, utils.sequence.SlicedCubeList):
+            # The slices are recreated once they drop out of the list's cache, so the
+            # coordinates are determined by the parent cube and the slicing items.
+            state = (common_axis, data.cube, data.cube.combined_wcs, data.items)
+        else:
+            state = (common_axis,) + tuple(data) + tuple(cube.combined_wcs for cube in data)
+        cached = self._common_axis_coords_cache
+        if (cached is not None and len(cached[0]) == len(state)
+                and all(old is new for old, new in zip(cached[0], state))):
+            return cached[1]
+
+        cube_wcses = [cube.combined_wcs for cube in data]
         common_coords = []
         mappings = []
-        for i, cube in enumerate(self.data):
-            cube_wcs = cube.combined_wcs
+        for cube, cube_wcs in zip(data, cube_wcses):
             common_coords.append(cube.axis_world_coords(common_axis, wcs=cube_wcs))
             mappings.append(utils.wcs.array_indices_for_world_objects(cube_wcs,
                                                                       axes=(common_axis,)))
-        # For each coordinate, break up and then combine the coordinate objects across
-        # the cubes into a list of coordinate objects that are length-1 and sequential
-        # along the common axis.
-        sequence_coords = []
-        for coord_idx in range(len(common_coords[0])):
-            exploded_coord = []
-            for cube_idx in range(len(common_coords)):
-                coord = common_coords[cube_idx][coord_idx]
-                axis = np.where(np.array(mappings[cube_idx][coord_idx]) == common_axis)[0][0]
-                item = [slice(None)] * len(coord.shape)
-                for i in range(coord.shape[axis]):
-                    item[axis] = i
-                    exploded_coord.append(coord[tuple(item)])
-            sequence_coords.append(exploded_coord)
-        return sequence_coords
+        # Find the axis of each coordinate object which corresponds to the common axis.
+        axes = [int(np.where(np.array(mapping) == common_axis)[0][0]) for mapping in mappings[0]]
+        coords = [utils.misc.concatenate_world_objects([cube_coords[coord_idx]
+                                                        for cube_coords in common_coords],
+                                                       axis=axis)
+                  for coord_idx, axis in enumerate(axes)]
+        # The coordinates are returned from the cache, so must not be modified in place.
+        for coord in coords:
+            utils.cache._set_read_only(coord)
+
+        # Find the world axes of each coordinate object, in the order of the objects.
+        object_names = [comp[0] for comp in cube_wcses[0].low_level_wcs.world_axis_object_components]
+        world_indices = utils.wcs.calculate_world_indices_from_axes(cube_wcses[0], (common_axis,))
+        world_axes = [tuple(i for i, name in enumerate(object_names) if name == object_name)
+                      for object_name in utils.misc.unique_sorted(object_names[i]
+                                                                  for i in world_indices)]
+
+        result = (coords, axes, world_axes)
+        self._common_axis_coords_cache = (state, result)
+        return result
+
+    def to_cube(self, common_axis=None, lazy=False):
+        """
+        Concatenate the cubes in the sequence into a single cube along the common axis.
+
+        The data, mask and uncertainty of the cubes are each copied into a single
+        array allocated for the whole cube.
+
+        The new cube has the WCS of the first cube if it reproduces the world
+        coordinates of all the other cubes, e.g. a FITS WCS whose coordinates are
+        linear along the common axis. Otherwise, in the WCS of the new cube the
+        world coordinates along the common axis are lookup tables of those
+        coordinates concatenated across the cubes. This requires that they do not
+        depend on any other axis, and that the world coordinates along the other
+        axes are the same for all cubes, otherwise a `ValueError` is raised.
+
+        Any extra coords of the cubes along the common axis are concatenated and
+        added to the extra coords of the new cube as lookup tables, if they do not
+        depend on any other axis. Other extra coords, and the global coords, of the
+        cubes are not carried over.
+
+        Parameters
+        ----------
+        common_axis: `int`, optional
+            The array axis of the cubes along which to concatenate them.
+            Default is the common axis of the sequence.
+
+        lazy: `bool`, optional
+            If True, the data, mask and uncertainty of the new cube are dask arrays
+            which read from the cubes in the sequence when they are computed,
+            rather than copies. Requires dask. Default=False
+
+        Returns
+        -------
+        result: `ndcube.NDCube`
+        """
+        if common_axis is None:
+            common_axis = self._common_axis
+        if common_axis is None:
+            raise ValueError("Common axis must be set.")
+        cubes = list(self.data)
+
+        shapes = self._shapes
+        other_shapes = np.delete(shapes, common_axis, axis=1)
+        if (other_shapes != other_shapes[0]).any():
+            raise ValueError("All cubes must have the same shape except along the common axis.")
+        if len(set(cube.unit for cube in cubes)) != 1:
+            raise ValueError("All cubes must have the same unit.")
+        uncertainties = [cube.uncertainty for cube in cubes]
+        if any(unc is None for unc in uncertainties) and not all(unc is None for unc in uncertainties):
+            raise ValueError("Either all or none of the cubes must have an uncertainty.")
+        if len(set(type(unc) for unc in uncertainties)) != 1:
+            raise TypeError("All cube uncertainties must be of the same type.")
+        offsets = np.concatenate([[0], np.cumsum(shapes[:, common_axis])])
+
+        data = _concatenate_arrays([cube.data for cube in cubes], common_axis, offsets, lazy)
+        mask = None
+        if any(cube.mask is not None for cube in cubes):
+            masks = [np.broadcast_to(False if cube.mask is None else cube.mask, cube.data.shape)
+                     for cube in cubes]
+            mask = _concatenate_arrays(masks, common_axis, offsets, lazy)
+        uncertainty = uncertainties[0]
+        if uncertainty is not None:
+            uncertainty = type(uncertainty)(
+                _concatenate_arrays([unc.array for unc in uncertainties], common_axis, offsets,
+                                    lazy),
+                unit=uncertainty.unit, copy=False)
+
+        wcs = cubes[0].wcs
+        world_n_dim = wcs.low_level_wcs.world_n_dim
+        combined_wcs = cubes[0].combined_wcs.low_level_wcs
+        coords, axes, world_axes = self._concatenated_common_axis_coords(common_axis)
+        if _wcs_describes_cubes(wcs.low_level_wcs, cubes, common_axis, offsets):
+            if isinstance(wcs, astropy.wcs.WCS) and wcs.pixel_shape is not None:
+                wcs = wcs.deepcopy()
+                wcs.pixel_shape = data.shape[::-1]
+        else:
+            wcs_coords = [(coord, waxes) for coord, waxes in zip(coords, world_axes)
+                          if max(waxes) < world_n_dim]
+            wcs = _common_axis_table_wcs(wcs, combined_wcs, wcs_coords, common_axis)
+            other_world_axes = sorted(set(range(world_n_dim)).difference(
+                *[waxes for _, waxes in wcs_coords]))
+            if not _wcs_describes_cubes(cubes[0].wcs.low_level_wcs, cubes, common_axis, offsets,
+                                        world_axes=other_world_axes):
+                raise ValueError("The cubes can not be described by a single WCS as their world "
+                                 "coordinates differ along axes other than the common axis.")
+
+        extra_coords = ExtraCoords()
+        for coord, waxes in zip(coords, world_axes):
+            # Coordinates from the WCS of the cubes are described by the new WCS.
+            if coord.ndim != 1 or max(waxes) < world_n_dim:
+                continue
+            extra_coords.add(_table_names(combined_wcs, waxes), common_axis, coord,
+                             physical_types=[combined_wcs.world_axis_physical_types[i]
+                                             for i in waxes])
+
+        return type(cubes[0])(data, wcs=wcs, uncertainty=uncertainty, mask=mask, meta=self.meta,
+                              unit=cubes[0].unit, extra_coords=extra_coords)
 
     @property
     def sequence_axis_coords(self):
@@ -292,6 +499,109 @@ Cube Sequence Helpers
 """
 
 
+def _concatenate_arrays(arrays, axis, offsets, lazy):
+    """
+    Concatenate arrays along an axis into a single preallocated array.
+
+    ``offsets`` are the positions of the arrays in the result along ``axis``,
+    followed by the length of the result. If ``lazy`` is True, a dask array
+    which reads from the arrays is returned instead.
+    """
+    if lazy:
+        import dask.array as da
+        return da.concatenate([array if utils.misc.is_dask_array(array)
+                               else da.from_array(array, chunks=array.shape)
+                               for array in arrays], axis=axis)
+
+    shape = list(arrays[0].shape)
+    shape[axis] = offsets[-1]
+    result = np.empty(shape, dtype=np.result_type(*set(array.dtype for array in arrays)))
+    item = [slice(None)] * len(shape)
+    for array, start, stop in zip(arrays, offsets[:-1], offsets[1:]):
+        item[axis] = slice(start, stop)
+        result[tuple(item)] = array
+    return result
+
+
+def _wcs_describes_cubes(low_level_wcs, cubes, common_axis, offsets, world_axes=None):
+    """
+    Whether a WCS gives the world coordinates of the cubes concatenated along an axis.
+
+    The world coordinates of each cube are compared with those of the WCS at
+    the corners and centre of the cube, offset along the common axis by the
+    position of the cube in the concatenation. If ``world_axes`` is given,
+    only those world axes are compared.
+    """
+    if world_axes is None:
+        world_axes = range(low_level_wcs.world_n_dim)
+    pixel_axis = low_level_wcs.pixel_n_dim - 1 - common_axis
+    for cube, offset in zip(cubes, offsets):
+        cube_wcs = cube.wcs.low_level_wcs
+        if (cube_wcs.world_axis_physical_types != low_level_wcs.world_axis_physical_types or
+                cube_wcs.world_axis_units != low_level_wcs.world_axis_units):
+            return False
+        pixels = np.array(list(itertools.product(*[(0, (n - 1) / 2, n - 1)
+                                                   for n in cube.data.shape[::-1]]))).T
+        expected = cube_wcs.pixel_to_world_values(*pixels)
+        pixels[pixel_axis] += offset
+        actual = low_level_wcs.pixel_to_world_values(*pixels)
+        if low_level_wcs.world_n_dim == 1:
+            expected, actual = (expected,), (actual,)
+        if not all(_values_close(actual[i], expected[i]) for i in world_axes):
+            return False
+    return True
+
+
+def _values_close(actual, expected):
+    # World values may be far smaller than the default absolute tolerance, e.g. wavelengths in m.
+    atol = 1e-8 * np.nanmax(np.abs(expected), initial=0)
+    return np.allclose(actual, expected, atol=atol, equal_nan=True)
+
+
+def _table_names(low_level_wcs, world_axes):
+    """
+    The names with which to add the world axes of a WCS to an ExtraCoords as a lookup table.
+    """
+    return [low_level_wcs.world_axis_names[i] or low_level_wcs.world_axis_physical_types[i]
+            for i in world_axes]
+
+
+def _common_axis_table_wcs(wcs, combined_wcs, wcs_coords, common_axis):
+    """
+    Replace the world axes of a WCS along an array axis with lookup tables.
+
+    ``wcs_coords`` are the coordinate objects along ``common_axis``, concatenated
+    across the cubes, and the world axes of ``wcs`` which each one represents.
+    The other world axes are taken from ``wcs``, and the world axes of the new
+    WCS are in the same order as those of ``wcs``.
+    """
+    if any(coord.ndim != 1 for coord, _ in wcs_coords):
+        raise ValueError("The cubes can not be described by a single WCS as their world "
+                         "coordinates along the common axis also depend on other axes.")
+    low_level_wcs = wcs.low_level_wcs
+    pixel_n_dim = low_level_wcs.pixel_n_dim
+    tables = ExtraCoords()
+    table_world_axes = []
+    for coord, waxes in wcs_coords:
+        tables.add(_table_names(combined_wcs, waxes), common_axis, coord,
+                   physical_types=[combined_wcs.world_axis_physical_types[i] for i in waxes])
+        table_world_axes.extend(waxes)
+
+    # Dropping the common axis drops the world axes which only depend on it.
+    item = [slice(None)] * pixel_n_dim
+    item[common_axis] = 0
+    sliced_wcs = SlicedLowLevelWCS(low_level_wcs, tuple(item))
+    pixel_axis = pixel_n_dim - 1 - common_axis
+    mapping = ([i for i in range(pixel_n_dim) if i != pixel_axis] +
+               [pixel_axis] * tables.wcs.pixel_n_dim)
+    compound_wcs = CompoundLowLevelWCS(sliced_wcs, tables.wcs.low_level_wcs, mapping=mapping)
+
+    world_order = [i for i in range(low_level_wcs.world_n_dim) if i not in table_world_axes]
+    world_order = np.argsort(world_order + table_world_axes).tolist()
+    return HighLevelWCSWrapper(ReorderedLowLevelWCS(compound_wcs, list(range(pixel_n_dim)),
+                                                    world_order))
+
+
 class _IndexAsCubeSlicer:
     """
     Helper class to make slicing in index_as_cube sliceable/indexable like a
@@ -308,32 +618,34 @@ class _IndexAsCubeSlicer:
 
     def __getitem__(self, item):
         common_axis = self.seq._common_axis
-        common_axis_lengths = [int(cube.dimensions[common_axis].value) for cube in self.seq.data]
-        n_cube_dims = len(self.seq.cube_like_dimensions)
+        common_axis_lengths = self.seq._shapes[:, common_axis]
+        cumul_lengths = self.seq._cumul_lengths(common_axis)
+        n_cube_dims = self.seq._shapes.shape[1]
         n_uncommon_cube_dims = n_cube_dims - 1
-        # If item is iint or slice, turn into a tuple, filling in items
+        # If item is int, slice or array, turn into a tuple, filling in items
         # for unincluded axes with slice(None). This ensures it is
         # treated the same as tuple items.
-        if isinstance(item, (numbers.Integral, slice)):
+        if isinstance(item, (numbers.Integral, slice, list, np.ndarray)):
             item = [item] + [slice(None)] * n_uncommon_cube_dims
         else:
             # Item must therefore be tuple. Ensure it has an entry for each axis.
             item = list(item) + [slice(None)] * (n_cube_dims - len(item))
         # If common axis item is slice(None), result is trivial as common_axis is not changed.
-        if item[common_axis] == slice(None):
+        if isinstance(item[common_axis], slice) and item[common_axis] == slice(None):
             # Create item for slicing through the default API and slice.
             return self.seq[tuple([slice(None)] + item)]
         if isinstance(item[common_axis], numbers.Integral):
             # If common_axis item is an int or return an NDCube with dimensionality of N-1
             sequence_index, common_axis_index = \
                 utils.sequence.cube_like_index_to_sequence_and_common_axis_indices(
-                    item[common_axis], common_axis, common_axis_lengths)
+                    item[common_axis], common_axis, common_axis_lengths, cumul_lengths)
             # Insert index for common axis in item for slicing the NDCube.
-            cube_item = copy.deepcopy(item)
+            cube_item = list(item)
             cube_item[common_axis] = common_axis_index
             return self.seq.data[sequence_index][tuple(cube_item)]
         else:
-            # item can now only be a tuple whose common axis item is a non-None slice object.
+            # item can now only be a tuple whose common axis item is a non-None slice object
+            # or an array of indices.
             # Convert item into iterable of SequenceItems and slice each cube appropriately.
             # item for common_axis must always be a slice for every cube,
             # even if it is only a length-1 slice.
@@ -345,7 +657,7 @@ class _IndexAsCubeSlicer:
             # common_axis of returned sequence must be altered if axes in front of it
             # are sliced away.
             sequence_items = utils.sequence.cube_like_tuple_item_to_sequence_items(
-                item, common_axis, common_axis_lengths, n_cube_dims)
+                item, common_axis, common_axis_lengths, n_cube_dims, cumul_lengths)
             # Work out new common axis value if axes in front of it are sliced away.
             new_common_axis = common_axis - sum([isinstance(i, numbers.Integral)
                                                  for i in item[:common_axis]])
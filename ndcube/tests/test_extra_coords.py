@@ -244,6 +244,17 @@ def test_add_coord_after_create(time_lut):
     assert ndc.extra_coords["time"]._lookup_tables == ndc.extra_coords._lookup_tables
 
 
+def test_wcs_cached(time_lut, wave_lut):
+    ec = ExtraCoords()
+    ec.add("time", 0, time_lut)
+    wcs = ec.wcs
+    assert ec.wcs is wcs
+
+    ec.add("wave", 1, wave_lut)
+    assert ec.wcs is not wcs
+    assert ec.wcs.world_n_dim == 2
+
+
 def test_combined_wcs(time_lut):
     ndc = NDCube(np.random.random((10, 10)), wcs=WCS(naxis=2))
     assert isinstance(ndc.extra_coords, ExtraCoords)
@@ -331,6 +342,26 @@ def test_slice_extra_twice(time_lut, wave_lut):
                       ec['time'].wcs.pixel_to_world_values(list(range(2, 4))))
 
 
+def test_slice_extra_lazy(time_lut, wave_lut):
+    ec = ExtraCoords()
+    ec.add("time", 0, time_lut)
+    ec.add("wavey", 1, wave_lut)
+
+    sec = ec[1:, 2:]
+    assert sec._pending_slice is not None
+
+    # Consecutive slices are combined into one slice of the original tables.
+    sec = sec[1:, ::2][:, 1]
+    assert sec._pending_slice[0] == ec._lookup_tables
+    assert sec._pending_slice[1] == (slice(2, 4, 1), 4)
+
+    assert len(sec._lookup_tables) == 1
+    assert sec._pending_slice is None
+    assert u.allclose(sec['time'].wcs.pixel_to_world_values(list(range(2))),
+                      ec['time'].wcs.pixel_to_world_values(list(range(2, 4))))
+    assert sec.dropped_world_dimensions["world_axis_units"] == ["nm"]
+
+
 def test_slice_extra_1d_drop(time_lut, wave_lut):
     ec = ExtraCoords()
     ec.add("time", 0, time_lut)
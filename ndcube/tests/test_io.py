@@ -0,0 +1,237 @@
+import sys
+
+import astropy.units as u
+import astropy.wcs
+import numpy as np
+import pytest
+from astropy.io import fits
+from astropy.nddata import StdDevUncertainty
+
+from ndcube import NDCollection, NDCube, NDCubeSequence
+from ndcube.io import ChunkedArray, load, save, store
+from ndcube.io.store import _save_array
+from ndcube.tests import helpers
+
+
+def assert_cubes_identical(loaded, cube):
+    assert type(loaded) is type(cube)
+    np.testing.assert_array_equal(np.asarray(loaded.data), np.asarray(cube.data))
+    np.testing.assert_array_equal(np.asarray(loaded.mask), np.asarray(cube.mask))
+    if cube.uncertainty is None:
+        assert loaded.uncertainty is None
+    else:
+        assert type(loaded.uncertainty) is type(cube.uncertainty)
+        np.testing.assert_array_equal(np.asarray(loaded.uncertainty.array), cube.uncertainty.array)
+    assert loaded.unit == cube.unit
+    helpers.assert_metas_equal(loaded.meta, cube.meta)
+    helpers.assert_wcs_are_equal(loaded.wcs, cube.wcs)
+    assert loaded.extra_coords.keys() == cube.extra_coords.keys()
+    assert dict(loaded.global_coords) == dict(cube.global_coords)
+    assert loaded.array_axis_physical_types == cube.array_axis_physical_types
+    for loaded_coord, coord in zip(loaded.axis_world_coords(wcs=loaded.combined_wcs),
+                                   cube.axis_world_coords(wcs=cube.combined_wcs)):
+        if isinstance(coord, u.Quantity):
+            np.testing.assert_array_equal(loaded_coord, coord)
+        else:
+            assert np.all(loaded_coord == coord)
+
+
+@pytest.fixture
+def chunked_array(tmp_path):
+    data = np.arange(7 * 5 * 6).reshape((7, 5, 6)).astype(float)
+    description = _save_array(data, tmp_path / "data", (3, 2, 4))
+    return data, ChunkedArray(tmp_path / "data", **description)
+
+
+@pytest.mark.parametrize("item", (
+    (slice(None),),
+    (1,),
+    (slice(2, 6), 3),
+    (Ellipsis, slice(1, 5)),
+    (slice(None, None, -2), slice(1, None, 3), -1),
+    (slice(1, 6, 2), Ellipsis, 2),
+    ([0, 4], slice(1, 3)),
+    (6, 4, 5),
+))
+def test_chunked_array_getitem(chunked_array, item):
+    data, array = chunked_array
+    expected = data[item]
+    result = array[item]
+    assert result.shape == expected.shape
+    np.testing.assert_array_equal(np.asarray(result), expected)
+
+
+def test_chunked_array_reads_only_needed_chunks(chunked_array, monkeypatch):
+    _, array = chunked_array
+    loaded = []
+    original_load = np.load
+
+    def counting_load(path, *args, **kwargs):
+        loaded.append(path.name)
+        return original_load(path, *args, **kwargs)
+
+    monkeypatch.setattr(np, "load", counting_load)
+    view = array[4:6, 0, 5:]
+    assert loaded == []
+    np.asarray(view)
+    assert sorted(loaded) == ["1.0.1.npy"]
+
+
+@pytest.mark.parametrize("cube", ("ndcube_3d_ln_lt_l", "ndcube_4d_uncertainty", "ndcube_4d_mask",
+                                  "ndcube_4d_unit_uncertainty", "ndcube_3d_l_ln_lt_ectime"))
+@pytest.mark.parametrize("lazy", (True, False))
+def test_save_load_cube(tmp_path, request, cube, lazy):
+    cube = request.getfixturevalue(cube)
+    cube.global_coords.add("distance", "pos.distance", 1 * u.AU)
+    save(cube, tmp_path / "cube", chunks=2)
+    loaded = load(tmp_path / "cube", lazy=lazy)
+    assert isinstance(loaded.data, ChunkedArray) is lazy
+    assert_cubes_identical(loaded, cube)
+
+
+def test_load_lazy_slice_crop(tmp_path, ndcube_4d_ln_lt_l_t, monkeypatch):
+    cube = ndcube_4d_ln_lt_l_t
+    save(cube, tmp_path / "cube", chunks=1)
+    loaded = load(tmp_path / "cube")
+    intervals = cube.wcs.array_index_to_world([1, 2], [0, 1], [0, 1], [0, 2])
+    lower_corner = [coord[0] for coord in intervals]
+    upper_corner = [coord[-1] for coord in intervals]
+
+    loaded_files = []
+    original_load = np.load
+
+    def counting_load(path, *args, **kwargs):
+        loaded_files.append(path)
+        return original_load(path, *args, **kwargs)
+
+    monkeypatch.setattr(np, "load", counting_load)
+    sliced = loaded[0, 1:]
+    cropped = loaded.crop(lower_corner, upper_corner)
+    assert loaded_files == []
+    assert_cubes_identical(sliced, cube[0, 1:])
+    assert_cubes_identical(cropped, cube.crop(lower_corner, upper_corner))
+    assert len(loaded_files) == sliced.data.size + cropped.data.size
+
+
+@pytest.mark.parametrize("chunks", (None, 2))
+def test_load_lazy_rebin(tmp_path, ndcube_4d_uncertainty, chunks):
+    cube = ndcube_4d_uncertainty
+    cube.mask = cube.data > 10
+    cube.uncertainty = StdDevUncertainty(cube.uncertainty.array)
+    save(cube, tmp_path / "cube", chunks=3)
+    loaded = load(tmp_path / "cube")
+    rebinned = loaded.rebin((1, 2, 2, 3), chunks=chunks)
+    expected = cube.rebin((1, 2, 2, 3))
+    np.testing.assert_allclose(rebinned.data, expected.data)
+    np.testing.assert_array_equal(rebinned.mask, expected.mask)
+    np.testing.assert_allclose(rebinned.uncertainty.array, expected.uncertainty.array)
+
+
+def test_save_load_sequence(tmp_path, ndcubesequence_4c_ln_lt_l_cax1):
+    sequence = ndcubesequence_4c_ln_lt_l_cax1
+    save(sequence, tmp_path / "seq")
+    loaded = load(tmp_path / "seq")
+    assert isinstance(loaded, NDCubeSequence)
+    assert loaded._common_axis == sequence._common_axis
+    helpers.assert_metas_equal(loaded.meta, sequence.meta)
+    for loaded_cube, cube in zip(loaded.data, sequence.data):
+        assert_cubes_identical(loaded_cube, cube)
+
+
+def test_save_load_collection(tmp_path, ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    sequence = NDCubeSequence([cube[0], cube[1]])
+    collection = NDCollection([("b", cube[:2]), ("a", sequence)], aligned_axes=((0,), (0,)),
+                              meta={"name": "test"})
+    save(collection, tmp_path / "collection")
+    loaded = load(tmp_path / "collection")
+    assert list(loaded.keys()) == ["b", "a"]
+    assert loaded.aligned_axes == collection.aligned_axes
+    assert loaded.meta == collection.meta
+    helpers.assert_collections_equal(loaded, collection)
+
+
+def test_save_overwrite(tmp_path, ndcube_2d_ln_lt):
+    path = tmp_path / "cube"
+    save(ndcube_2d_ln_lt, path)
+    with pytest.raises(FileExistsError, match="overwrite=True"):
+        save(ndcube_2d_ln_lt, path)
+    save(ndcube_2d_ln_lt[1:], path, overwrite=True)
+    assert load(path).data.shape == ndcube_2d_ln_lt[1:].data.shape
+    other = tmp_path / "other"
+    other.mkdir()
+    with pytest.raises(FileExistsError, match="not an ndcube store"):
+        save(ndcube_2d_ln_lt, other, overwrite=True)
+
+
+def test_load_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load(tmp_path)
+    with pytest.raises(TypeError, match="Only NDCube"):
+        save(np.zeros(3), tmp_path / "array")
+    assert not (tmp_path / "array").exists()
+
+
+def test_save_load_wrapped_wcs(tmp_path, ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t[:, 0, 2:].rebin((1, 2, 3))
+    save(cube, tmp_path / "cube")
+    assert_cubes_identical(load(tmp_path / "cube"), cube)
+
+
+def test_save_load_fits_header_meta(tmp_path, ndcube_2d_ln_lt):
+    cube = ndcube_2d_ln_lt
+    cube.meta = fits.Header({"TELESCOP": "test", "EXPTIME": 1.5})
+    save(cube, tmp_path / "cube")
+    loaded = load(tmp_path / "cube")
+    assert isinstance(loaded.meta, fits.Header)
+    assert dict(loaded.meta) == dict(cube.meta)
+
+
+class Unserialisable:
+    def __eq__(self, other):
+        return type(other) is type(self)
+
+
+def test_save_load_pickle_fallback(tmp_path, ndcube_2d_ln_lt):
+    cube = ndcube_2d_ln_lt
+    cube.meta = {"obj": Unserialisable()}
+    path = tmp_path / "cube"
+    with pytest.raises(TypeError, match="allow_pickle=True"):
+        save(cube, path)
+    assert not path.exists()
+    save(cube, path, allow_pickle=True)
+    with pytest.raises(ValueError, match="allow_pickle=True"):
+        load(path)
+    assert load(path, allow_pickle=True).meta == cube.meta
+
+
+def test_save_load_sip_wcs(tmp_path):
+    wcs = astropy.wcs.WCS(naxis=2)
+    wcs.wcs.ctype = ["RA---TAN-SIP", "DEC--TAN-SIP"]
+    wcs.wcs.crpix = [5, 4]
+    wcs.wcs.cdelt = [-0.1, 0.1]
+    wcs.wcs.crval = [10, 20]
+    a = np.zeros((3, 3))
+    b = np.zeros((3, 3))
+    a[0, 2] = 1e-3
+    b[2, 0] = -2e-3
+    wcs.sip = astropy.wcs.Sip(a, b, None, None, wcs.wcs.crpix)
+    cube = NDCube(np.arange(80.).reshape(8, 10), wcs=wcs)
+    save(cube, tmp_path / "cube")
+    loaded = load(tmp_path / "cube")
+    assert loaded.wcs.sip is not None
+    np.testing.assert_array_equal(loaded.wcs.sip.a, wcs.sip.a)
+    np.testing.assert_array_equal(loaded.wcs.sip.b, wcs.sip.b)
+    pixel = np.array([[0, 0], [9, 7], [3.5, 2.25]])
+    np.testing.assert_allclose(loaded.wcs.all_pix2world(pixel, 0), wcs.all_pix2world(pixel, 0))
+
+
+def test_load_unknown_class(tmp_path, ndcube_2d_ln_lt, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(store, "_class_path", lambda cls: "ndcube_untrusted_module.Cube")
+        save(ndcube_2d_ln_lt, tmp_path / "cube")
+    with pytest.raises(ValueError, match="not a known subclass"):
+        load(tmp_path / "cube")
+    assert "ndcube_untrusted_module" not in sys.modules
+    with pytest.raises(ModuleNotFoundError):
+        load(tmp_path / "cube", allow_pickle=True)
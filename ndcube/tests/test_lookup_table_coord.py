@@ -1,12 +1,17 @@
+import pickle
+
 import astropy.units as u
 import gwcs.coordinate_frames as cf
 import numpy as np
 import pytest
-from astropy.coordinates import SkyCoord
+from astropy.coordinates import EarthLocation, SkyCoord
+from astropy.modeling.tabular import tabular_model
+from astropy.modeling.models import Scale
 from astropy.time import Time
 
 from ndcube.extra_coords.lookup_table_coord import (MultipleTableCoordinate, QuantityTableCoordinate,
-                                                    SkyCoordTableCoordinate, TimeTableCoordinate)
+                                                    SkyCoordTableCoordinate, TimeTableCoordinate,
+                                                    _generate_tabular)
 
 
 @pytest.fixture
@@ -175,6 +180,33 @@ def test_2d_skycoord_mesh(lut_2d_skycoord_mesh):
     assert ltc.model.n_outputs == 2
 
 
+
+def test_2d_skycoord_mesh_matches_meshgrid():
+    lon, lat = np.arange(10) * u.deg, np.arange(10, 20) * u.deg
+    ltc = SkyCoordTableCoordinate(SkyCoord(lon, lat), mesh=True)
+    assert ltc._table is None
+
+    grid = SkyCoordTableCoordinate(SkyCoord(*np.meshgrid(lon, lat)), mesh=False)
+    for item in (slice(None), (slice(2, 6), slice(1, 9, 2)), (3, slice(1, 5)), (slice(1, 5), 3)):
+        sliced, sliced_grid = ltc[item], grid[item]
+        pixel = np.meshgrid(*[np.arange(n) for n in sliced_grid.table.shape], indexing='ij') * u.pix
+        assert u.allclose(sliced.model(*pixel), sliced_grid.model(*pixel))
+    assert ltc._table is None
+
+    assert u.allclose(ltc.model.inverse(*ltc.model(2 * u.pix, 3 * u.pix)), (2, 3) * u.pix)
+    _assert_skycoord_equal(ltc.table, grid.table)
+
+
+def test_2d_skycoord_mesh_outside_table():
+    lon, lat = np.arange(10) * u.deg, np.arange(10, 20) * u.deg
+    ltc = SkyCoordTableCoordinate(SkyCoord(lon, lat), mesh=True)[slice(1, 2)]
+
+    # Only the pixel along the sliced axis is outside the table.
+    world = ltc.model(1 * u.pix, 1 * u.pix)
+    assert np.isnan(world[0]) and np.isnan(world[1])
+    assert u.allclose(ltc.model(0 * u.pix, 1 * u.pix), (1, 11) * u.deg)
+
+
 def test_3d_skycoord_mesh(lut_3d_skycoord_mesh):
     ltc = lut_3d_skycoord_mesh
 
@@ -207,6 +239,107 @@ def test_1d_time(lut_1d_time):
     assert lut_1d_time.wcs.world_to_pixel(Time("2011-01-01T00:00:00")) == 0
 
 
+def test_1d_time_slice_keeps_time(lut_1d_time):
+    lut_1d_time._delta_seconds
+    sliced = lut_1d_time[1:3]
+    # The seconds since the reference time are carried over rather than recomputed.
+    assert sliced._deltas[0] is sliced.table
+    assert u.allclose(sliced.model.lookup_table, u.Quantity((10, 20), u.s))
+    assert sliced.wcs.world_to_pixel(Time("2011-01-01T00:00:20")) == 1
+    assert (sliced.table == lut_1d_time.table[1:3]).all()
+    assert lut_1d_time[2].is_scalar()
+
+    # The precision, scale, format and location of the table are kept.
+    location = EarthLocation(0 * u.m, 0 * u.m, 6400 * u.km)
+    table = Time(58000, np.array([0, 1e-12, 2e-12, 3e-12]), format="mjd", scale="tai",
+                 location=location)
+    lut = TimeTableCoordinate(table, names="time", physical_types="time")
+    for sliced in (lut[1:3], lut.resample((2,))):
+        assert sliced.table.scale == "tai"
+        assert sliced.table.format == "mjd"
+        assert sliced.table.location == location
+    assert (lut[1:3].table.jd2 == table[1:3].jd2).all()
+
+    # The seconds since the reference time follow a new reference time.
+    lut.reference_time = table[1]
+    assert u.allclose(lut._delta_seconds[1], 0 * u.s)
+
+
+@pytest.mark.parametrize("shape", ((10,), (4, 5), (3, 4, 5)))
+def test_fast_tabular(shape):
+    rng = np.random.default_rng(0)
+    table = np.cumsum(rng.random(shape), axis=-1) * u.nm
+    model = _generate_tabular(table)
+    reference = tabular_model(len(shape))(tuple(np.arange(n) * u.pix for n in shape), table,
+                                          bounds_error=False, fill_value=np.nan)
+
+    # Pixels at grid points, between grid points and outside the grid.
+    grid = np.meshgrid(*[np.arange(n) for n in shape], indexing='ij')
+    between = [rng.uniform(-1, n, 50) for n in shape]
+    for pixel in (grid, between, [np.full(3, np.nan)] * len(shape)):
+        pixel = [p * u.pix for p in pixel]
+        assert u.allclose(model(*pixel), reference(*pixel), equal_nan=True)
+
+    if len(shape) == 1:
+        world = rng.uniform(table[0].value - 1, table[-1].value + 1, 50) * u.nm
+        assert u.allclose(model.inverse(world), reference.inverse(world), equal_nan=True)
+        pixel = rng.uniform(0, shape[0] - 1, 50) * u.pix
+        assert u.allclose(model.inverse(model(pixel)), pixel)
+
+
+@pytest.mark.parametrize("shape", ((10,), (4, 5), (3, 4, 5)))
+def test_tabular_pickle(shape):
+    model = _generate_tabular(np.arange(np.prod(shape)).reshape(shape) * u.nm)
+    unpickled = pickle.loads(pickle.dumps(model))
+    assert type(unpickled) is type(model)
+    pixel = [p * u.pix for p in np.meshgrid(*[np.arange(n) for n in shape], indexing='ij')]
+    assert u.allclose(unpickled(*pixel), model(*pixel))
+
+
+@pytest.mark.parametrize("table", (np.arange(10) ** 2 * u.nm, np.arange(10)[::-1] ** 2 * u.nm))
+def test_tabular_inverse_index(table):
+    ltc = QuantityTableCoordinate(table)
+    pixel = np.array([0, 2.5, 9]) * u.pix
+    world = ltc.model(pixel)
+    assert u.allclose(ltc.model.inverse(world), pixel)
+    assert np.isnan(ltc.model.inverse(table.max() + 1 * u.nm))
+    assert u.allclose(ltc.wcs.world_to_pixel(world), pixel.value)
+
+
+def test_tabular_inverse_non_monotonic():
+    ltc = QuantityTableCoordinate([0, 2, 1, 3] * u.nm)
+    with pytest.raises(NotImplementedError, match="cannot be inverted"):
+        ltc.model.inverse
+
+
+def test_tabular_user_inverse():
+    model = QuantityTableCoordinate(np.arange(10) * u.nm).model
+    custom = Scale(2)
+    model.inverse = custom
+    assert model.inverse is custom
+    del model.inverse
+    assert u.allclose(model.inverse(3 * u.nm), 3 * u.pix)
+
+
+def test_model_frame_wcs_cached(lut_1d_time, lut_1d_wave):
+    for ltc in (lut_1d_wave, lut_1d_time & lut_1d_wave):
+        assert ltc.model is ltc.model
+        assert ltc.frame is ltc.frame
+        assert ltc.wcs is ltc.wcs
+
+    model = lut_1d_wave.model
+    lut_1d_wave.table = (lut_1d_wave.table[0] * 2,)
+    assert lut_1d_wave.model is not model
+    assert u.allclose(lut_1d_wave.model(1 * u.pix), 2 * model(1 * u.pix))
+
+
+def test_join_does_not_modify_frames(lut_1d_time, lut_1d_wave):
+    frame = lut_1d_wave.frame
+    (lut_1d_time & lut_1d_wave).frame
+    assert lut_1d_wave.frame is frame
+    assert frame.axes_order == (0,)
+
+
 def test_join(lut_1d_time, lut_1d_wave):
     ltc = lut_1d_time & lut_1d_wave
 
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import astropy.nddata
 import astropy.units as u
 import astropy.wcs
 import numpy as np
@@ -7,8 +10,9 @@ from astropy.time import Time
 from astropy.wcs.wcsapi import BaseHighLevelWCS, BaseLowLevelWCS
 from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
 
-from ndcube import ExtraCoords, NDCube
+from ndcube import ExtraCoords, NDCube, utils
 from ndcube.tests import helpers
+from ndcube.wcs.wrappers import ResampledLowLevelWCS
 
 
 def generate_data(shape):
@@ -366,6 +370,20 @@ def test_axis_world_coords_values_lat(ndcube_3d_ln_lt_l):
                                   [-0.00555556, -0.00416667, -0.00277778]] * u.deg)
 
 
+@pytest.mark.parametrize("edges", (False, True))
+def test_axis_world_coords_values_fast_linear(ndcube_4d_ln_lt_l_t, edges):
+    for cube in (ndcube_4d_ln_lt_l_t, ndcube_4d_ln_lt_l_t[1:, 0, 2:],
+                 ndcube_4d_ln_lt_l_t.rebin((1, 1, 2, 3))):
+        fast = cube.axis_world_coords_values(edges=edges)
+        slow = cube.axis_world_coords_values(edges=edges, fast_linear=False)
+        assert fast._fields == slow._fields
+        for fast_coord, slow_coord in zip(fast, slow):
+            assert not np.shares_memory(fast_coord, slow_coord)
+            assert fast_coord.shape == slow_coord.shape
+            assert fast_coord.unit == slow_coord.unit
+            assert u.allclose(fast_coord, slow_coord, rtol=1e-12, atol=0 * slow_coord.unit)
+
+
 def test_array_axis_physical_types(ndcube_3d_ln_lt_l):
     expected = [
         ('custom:pos.helioprojective.lon', 'custom:pos.helioprojective.lat', 'custom:PIXEL'),
@@ -376,6 +394,36 @@ def test_array_axis_physical_types(ndcube_3d_ln_lt_l):
         assert all([physical_type in expected[i] for physical_type in output[i]])
 
 
+def test_combined_wcs_cached(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    combined_wcs = cube.combined_wcs
+    physical_types = cube.array_axis_physical_types
+    assert cube.combined_wcs is combined_wcs
+    assert cube.array_axis_physical_types == physical_types
+
+    # Adding an extra coord invalidates the cached values.
+    cube.extra_coords.add('velocity', 1, np.arange(cube.data.shape[1]) * u.m / u.s)
+    new_combined_wcs = cube.combined_wcs
+    assert new_combined_wcs is not combined_wcs
+    assert new_combined_wcs.world_n_dim == combined_wcs.world_n_dim + 1
+    assert cube.combined_wcs is new_combined_wcs
+    assert (sum(len(types) for types in cube.array_axis_physical_types) ==
+            sum(len(types) for types in physical_types) + 1)
+
+
+@pytest.mark.parametrize("item", ((slice(1, 3),), (0,), (slice(None), slice(None), 1)))
+def test_array_axis_physical_types_slice_pending(ndcube_3d_ln_lt_l, item):
+    sliced = ndcube_3d_ln_lt_l[item]
+    physical_types = sliced.array_axis_physical_types
+    assert sliced.extra_coords._pending_slice is not None
+
+    # The same as the physical types once the lookup tables have been sliced.
+    expected = ndcube_3d_ln_lt_l[item]
+    expected.extra_coords._lookup_tables
+    assert expected.extra_coords._pending_slice is None
+    assert physical_types == expected.array_axis_physical_types
+
+
 def test_crop(ndcube_4d_ln_lt_l_t):
     intervals = ndcube_4d_ln_lt_l_t.wcs.array_index_to_world([1, 2], [0, 1], [0, 1], [0, 2])
     lower_corner = [coord[0] for coord in intervals]
@@ -501,6 +549,67 @@ def test_crop_by_values_1d_dependent(ndcube_4d_ln_lt_l_t):
     helpers.assert_cubes_equal(output, expected)
 
 
+def test_crop_many(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    items = [np.s_[1:3, 0:2, 0:2, 0:3], np.s_[0:1, 1:3, 2:4, 1:2], np.s_[2:3, 0:1, 0:4, 0:5]]
+    lower_corners, upper_corners = [], []
+    for item in items:
+        intervals = cube.wcs.array_index_to_world(*[[i.start, i.stop - 1] for i in item])
+        lower_corners.append([coord[0] for coord in intervals])
+        upper_corners.append([coord[-1] for coord in intervals])
+    # Include a region with some None corners and one with all None corners.
+    lower_corners.append([None, None, lower_corners[0][2]])
+    upper_corners.append([None, None, upper_corners[0][2]])
+    lower_corners.append([None] * 3)
+    upper_corners.append([None] * 3)
+
+    outputs = cube.crop_many(lower_corners, upper_corners)
+    assert len(outputs) == len(lower_corners)
+    for output, lower_corner, upper_corner in zip(outputs, lower_corners, upper_corners):
+        helpers.assert_cubes_equal(output, cube.crop(lower_corner, upper_corner))
+    helpers.assert_cubes_equal(outputs[0], cube[items[0]])
+
+
+def test_crop_many_1d_dependent(ndcube_4d_ln_lt_l_t):
+    cube_1d = ndcube_4d_ln_lt_l_t[0, :, 0, 0]
+    sky_range = cube_1d.wcs.array_index_to_world([0, 1, 2])
+    outputs = cube_1d.crop_many([sky_range[0], sky_range[1]], [sky_range[1], sky_range[2]])
+    helpers.assert_cubes_equal(outputs[0], cube_1d[0:2])
+    helpers.assert_cubes_equal(outputs[1], cube_1d[1:3])
+
+
+def test_crop_by_values_many(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    intervals = cube.wcs.array_index_to_world_values([1, 2], [0, 1], [0, 1], [0, 2])
+    units = [u.min, u.m, u.deg, u.deg]
+    lower_corner = [coord[0] * unit for coord, unit in zip(intervals, units)]
+    upper_corner = [coord[-1] * unit for coord, unit in zip(intervals, units)]
+    lower_corner[-1] = lower_corner[-1].to(u.arcsec)
+    lower_corners = [lower_corner, [0.5 * u.min, None, None, None], [0.5, None, None, None]]
+    upper_corners = [upper_corner, [1.1 * u.min, None, None, None], [1.1, None, None, None]]
+
+    outputs = cube.crop_by_values_many(lower_corners, upper_corners, units=[u.min, None, None, None])
+    helpers.assert_cubes_equal(outputs[0], cube[1:3, 0:2, 0:2, 0:3])
+    helpers.assert_cubes_equal(outputs[1], cube[:, :, :, 0:3])
+    helpers.assert_cubes_equal(outputs[2], cube[:, :, :, 0:3])
+
+
+def test_crop_many_errors(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    with pytest.raises(ValueError):
+        cube.crop_by_values_many([[None] * 4], [])
+    with pytest.raises(ValueError):
+        cube.crop_by_values_many([[None] * 4, [None] * 3], [[None] * 4, [None] * 3])
+    intervals = cube.wcs.array_index_to_world_values([1, 2], [0, 1], [0, 1], [0, 2])
+    units = [u.min, u.m, u.deg, u.deg]
+    lower_corner = [coord[0] * unit for coord, unit in zip(intervals, units)]
+    upper_corner = [coord[-1] * unit for coord, unit in zip(intervals, units)]
+    lower_corner[1] *= -1
+    upper_corner[1] *= -1
+    with pytest.raises(IndexError):
+        cube.crop_by_values_many([lower_corner], [upper_corner])
+
+
 def test_initialize_from_ndcube(ndcube_3d_l_ln_lt_ectime):
     cube = ndcube_3d_l_ln_lt_ectime
     cube.global_coords.add('distance', 'pos.distance', 1 * u.m)
@@ -519,3 +628,441 @@ def test_initialize_from_ndcube(ndcube_3d_l_ln_lt_ectime):
     assert ec.mapping == ec3.mapping
     assert np.allclose(ec.wcs.pixel_to_world_values(1), ec3.wcs.pixel_to_world_values(1))
     assert ec is not ec3
+
+
+def test_axis_world_coords_cached(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    coords = cube.axis_world_coords()
+    assert cube.coordinate_cache.info()["entries"] == 1
+    assert cube.coordinate_cache.info()["misses"] == 1
+    coords2 = cube.axis_world_coords('em.wl')
+    assert cube.coordinate_cache.info()["hits"] == 1
+    assert u.allclose(coords2[0], coords[0])
+
+    cube.axis_world_coords_values()
+    cube.axis_world_coords(edges=True)
+    assert len(cube.coordinate_cache) == 3
+
+    cube.coordinate_cache.clear()
+    assert len(cube.coordinate_cache) == 0
+    assert cube.coordinate_cache.nbytes == 0
+
+
+def test_axis_world_coords_cached_read_only(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    values = cube.axis_world_coords_values()
+    expected_values = values[0].copy()
+    coords = cube.axis_world_coords('lon')
+    expected_lon = coords[0].spherical.lon.copy()
+    # The returned coordinates are copies which can be modified without changing the cache.
+    values[0][...] = 0
+    cube[:, 1:].axis_world_coords_values()[0][...] = 0
+    coords[0][0, 0] = coords[0][1, 1]
+    assert u.allclose(cube.axis_world_coords_values()[0], expected_values)
+    assert u.allclose(cube.axis_world_coords('lon')[0].spherical.lon, expected_lon)
+    # The cached grids themselves are read-only.
+    for entry in cube.coordinate_cache._entries.values():
+        for coord in entry.coords:
+            if isinstance(coord, u.Quantity):
+                with pytest.raises(ValueError, match="read-only"):
+                    coord[...] = 0 * coord.unit
+
+
+def test_axis_world_coords_cache_eviction(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    cube.coordinate_cache.max_entries = 2
+    cube.axis_world_coords()
+    cube.axis_world_coords(edges=True)
+    cube.axis_world_coords_values()
+    assert len(cube.coordinate_cache) == 2
+    cube.coordinate_cache.max_bytes = 0
+    cube.axis_world_coords_values(edges=True)
+    assert len(cube.coordinate_cache) == 2
+
+
+def test_axis_world_coords_cache_shared_budget(ndcube_3d_ln_lt_l, monkeypatch):
+    cube = ndcube_3d_ln_lt_l
+    other = cube[:, :]
+    cube.axis_world_coords_values()
+    nbytes = cube.coordinate_cache.nbytes
+    monkeypatch.setattr(utils.cache.WorldCoordinateCache, "max_total_bytes", nbytes)
+    # The least recently used grid is evicted, even though it is held by another cube.
+    other.axis_world_coords_values()
+    assert len(other.coordinate_cache) == 1
+    assert len(cube.coordinate_cache) == 0
+
+
+@pytest.mark.parametrize("item", (np.s_[0], np.s_[:, 1:3], np.s_[1, :, 2], np.s_[..., 1:]))
+def test_axis_world_coords_derived_from_parent(ndcube_3d_ln_lt_l, item):
+    cube = ndcube_3d_ln_lt_l
+    cube.axis_world_coords()
+    cube.axis_world_coords_values()
+    sliced = cube[item]
+    coords = sliced.axis_world_coords()
+    values = sliced.axis_world_coords_values()
+    assert sliced.coordinate_cache.info()["misses"] == 0
+
+    sliced.coordinate_cache.clear()
+    sliced.coordinate_cache._parent = None
+    expected_coords = sliced.axis_world_coords()
+    expected_values = sliced.axis_world_coords_values()
+    assert len(coords) == len(expected_coords)
+    for coord, expected in zip(coords, expected_coords):
+        assert type(coord) is type(expected)
+        assert coord.shape == expected.shape
+    for value, expected in zip(values, expected_values):
+        assert u.allclose(value, expected)
+
+
+def test_axis_world_coords_separable_grids(ndcube_3d_l_ln_lt_ectime, monkeypatch):
+    cube = ndcube_3d_l_ln_lt_ectime
+    wcs = cube.combined_wcs
+    grid_sizes = []
+    evaluate = NDCube._evaluate_world_coords
+
+    def recording_evaluate(wcs, pixel_inputs, high_level):
+        grid_sizes.append(np.broadcast(*pixel_inputs).size)
+        return evaluate(wcs, pixel_inputs, high_level)
+
+    monkeypatch.setattr(NDCube, "_evaluate_world_coords", staticmethod(recording_evaluate))
+    entry = cube._world_coords(wcs, False, False)
+
+    # No coordinate depends on all pixel axes so the full grid is never created.
+    assert len(grid_sizes) > 1
+    assert max(grid_sizes) < np.prod(cube.data.shape)
+
+    full_grid = np.meshgrid(*[np.arange(i) for i in cube.data.shape[::-1]], indexing='ij')
+    expected = wcs.low_level_wcs.pixel_to_world_values(*full_grid)
+    for coord, (world_axis,), pixel_axes in zip(entry.coords, entry.world_axes, entry.pixel_axes):
+        item = tuple(slice(None) if i in pixel_axes else 0 for i in range(len(full_grid)))
+        assert np.allclose(coord.value, expected[world_axis][item])
+
+
+@pytest.mark.parametrize("chunks", (1, 2, (2, None, 3), (-1, 1, -1)))
+@pytest.mark.parametrize("wcs", ("wcs", "extra_coords", "combined_wcs"))
+def test_axis_world_coords_chunked(ndcube_3d_l_ln_lt_ectime, chunks, wcs):
+    cube = ndcube_3d_l_ln_lt_ectime
+    wcs = getattr(cube, wcs)
+    # Edges are not supported by the lookup table extra coords.
+    for edges in ((False, True) if wcs is cube.wcs else (False,)):
+        values = cube.axis_world_coords_values(wcs=wcs, edges=edges, chunks=chunks)
+        coords = cube.axis_world_coords(wcs=wcs, edges=edges, chunks=chunks)
+        cube.coordinate_cache.clear()
+        expected_values = cube.axis_world_coords_values(wcs=wcs, edges=edges)
+        expected_coords = cube.axis_world_coords(wcs=wcs, edges=edges)
+        cube.coordinate_cache.clear()
+
+        for value, expected in zip(values, expected_values):
+            assert u.allclose(value, expected)
+        assert len(coords) == len(expected_coords)
+        for coord, expected in zip(coords, expected_coords):
+            assert type(coord) is type(expected)
+            assert coord.shape == expected.shape
+
+
+def test_axis_world_coords_bad_chunks(ndcube_3d_ln_lt_l):
+    with pytest.raises(ValueError):
+        ndcube_3d_ln_lt_l.axis_world_coords(chunks=(1, 2))
+    with pytest.raises(ValueError):
+        ndcube_3d_ln_lt_l.axis_world_coords(chunks=0)
+
+
+@pytest.mark.parametrize("axes", ((), ("lon",), ("em.wl",)))
+def test_iter_axis_world_coords(ndcube_3d_ln_lt_l, axes):
+    cube = ndcube_3d_ln_lt_l
+    full_grid = np.meshgrid(*[np.arange(i) for i in cube.data.shape[::-1]], indexing='ij')
+    expected = cube.wcs.pixel_to_world(*full_grid)
+    if axes == ("lon",):
+        expected = expected[1:]
+    elif axes == ("em.wl",):
+        expected = expected[:1]
+    expected = [coord.T for coord in expected]
+
+    covered = np.zeros(cube.data.shape, dtype=int)
+    for item, coords in cube.iter_axis_world_coords(*axes, chunks=(1, 2, 3)):
+        covered[item] += 1
+        assert len(coords) == len(expected)
+        for coord, exp in zip(coords, expected):
+            assert coord.shape == covered[item].shape
+            if isinstance(coord, SkyCoord):
+                assert u.allclose(coord.Tx, exp[item].Tx)
+                assert u.allclose(coord.Ty, exp[item].Ty)
+            else:
+                assert u.allclose(coord, exp[item])
+    assert (covered == 1).all()
+
+
+@pytest.mark.parametrize("chunks", (None, 2))
+@pytest.mark.parametrize("wcs", ("wcs", "combined_wcs"))
+def test_axis_world_coords_workers(ndcube_3d_l_ln_lt_ectime, chunks, wcs):
+    cube = ndcube_3d_l_ln_lt_ectime
+    wcs = getattr(cube, wcs)
+    expected_values = cube.axis_world_coords_values(wcs=wcs)
+    expected_coords = cube.axis_world_coords(wcs=wcs)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for workers in (3, executor):
+            cube.coordinate_cache.clear()
+            values = cube.axis_world_coords_values(wcs=wcs, chunks=chunks, workers=workers)
+            coords = cube.axis_world_coords(wcs=wcs, chunks=chunks, workers=workers)
+            assert values._fields == expected_values._fields
+            for value, expected in zip(values, expected_values):
+                assert u.allclose(value, expected)
+            for coord, expected in zip(coords, expected_coords):
+                assert type(coord) is type(expected)
+                assert coord.shape == expected.shape
+
+
+def test_axis_world_coords_bad_workers(ndcube_3d_ln_lt_l):
+    with pytest.raises(ValueError):
+        ndcube_3d_ln_lt_l.axis_world_coords(workers=0)
+
+
+@pytest.mark.parametrize("axis", (0, -1))
+def test_explode_along_axis_lazy(ndcube_4d_ln_lt_l_t, axis):
+    cube = ndcube_4d_ln_lt_l_t
+    expected = cube.explode_along_axis(axis)
+    output = cube.explode_along_axis(axis, lazy=True, cache_size=2)
+    assert isinstance(output.data, utils.sequence.SlicedCubeList)
+    assert output.data._cache == {}
+    helpers.assert_cubesequences_equal(output, expected)
+    assert len(output.data._cache) == 2
+    assert output.data[-1] is output.data[-1]
+    helpers.assert_cubes_equal(output[1:].data[0], expected.data[1])
+    helpers.assert_cubes_equal(output[1, 0], expected[1, 0])
+
+
+def test_dask_cube_stays_lazy(ndcube_4d_dask):
+    da = pytest.importorskip("dask.array")
+    cube = ndcube_4d_dask
+    assert cube.is_lazy
+    sliced = cube[1:3, 2]
+    for array in (sliced.data, sliced.mask, sliced.uncertainty.array):
+        assert isinstance(array, da.Array)
+
+    intervals = cube.wcs.array_index_to_world([1, 2], [0, 1], [0, 1], [0, 2])
+    cropped = cube.crop([coord[0] for coord in intervals], [coord[-1] for coord in intervals])
+    assert isinstance(cropped.data, da.Array)
+    helpers.assert_cubes_equal(cropped.compute(), cube.compute()[1:3, 0:2, 0:2, 0:3])
+
+
+@pytest.mark.parametrize("uncertainty_type", ("std", "var", "operand_none"))
+@pytest.mark.parametrize("operand_unit", (None, u.kct))
+@pytest.mark.parametrize("operation", ("add", "subtract", "multiply", "divide"))
+def test_dask_cube_arithmetic(ndcube_4d_dask, operation, operand_unit, uncertainty_type):
+    da = pytest.importorskip("dask.array")
+    cube = ndcube_4d_dask
+    if uncertainty_type == "var":
+        cube = NDCube(cube.data, wcs=cube.wcs, mask=cube.mask, unit=cube.unit,
+                      uncertainty=astropy.nddata.VarianceUncertainty(cube.uncertainty.array**2))
+    operand = cube
+    if operand_unit is not None:
+        uncertainty = None if uncertainty_type == "operand_none" else cube.uncertainty.array
+        if uncertainty is not None:
+            uncertainty = type(cube.uncertainty)(uncertainty)
+        operand = NDCube(cube.data, wcs=cube.wcs, mask=cube.mask, unit=operand_unit,
+                         uncertainty=uncertainty)
+    elif uncertainty_type == "operand_none":
+        pytest.skip("The cube is only combined with itself.")
+    result = getattr(cube, operation)(operand)
+    for array in (result.data, result.mask, result.uncertainty.array):
+        assert isinstance(array, da.Array)
+
+    computed_cube = cube.compute()
+    expected = getattr(computed_cube, operation)(operand.compute())
+    result = result.compute()
+    assert result.unit == expected.unit
+    np.testing.assert_allclose(result.data, expected.data)
+    np.testing.assert_array_equal(result.mask, expected.mask)
+    np.testing.assert_allclose(result.uncertainty.array, expected.uncertainty.array)
+
+
+def test_dask_cube_compute_persist(ndcube_4d_dask):
+    da = pytest.importorskip("dask.array")
+    cube = ndcube_4d_dask
+    cube.global_coords.add('distance', 'pos.distance', 1 * u.m)
+
+    computed = cube.compute()
+    assert not computed.is_lazy
+    for array in (computed.data, computed.mask, computed.uncertainty.array):
+        assert isinstance(array, np.ndarray)
+    assert computed.unit == cube.unit
+    assert computed.wcs is cube.wcs
+    assert computed.global_coords.keys() == cube.global_coords.keys()
+    assert computed.compute() is computed
+
+    persisted = cube.persist()
+    assert isinstance(persisted.data, da.Array)
+    np.testing.assert_array_equal(persisted.data.compute(), computed.data)
+
+
+def test_from_memmap(tmp_path, wcs_4d_t_l_lt_ln):
+    shape = (5, 8, 10, 12)
+    data = generate_data(shape).astype(np.float32)
+    data_path = tmp_path / "data.raw"
+    data.tofile(data_path)
+    mask_path = tmp_path / "mask.npy"
+    np.save(mask_path, data % 2 == 0)
+    uncertainty_path = tmp_path / "uncertainty.npy"
+    np.save(uncertainty_path, np.sqrt(data))
+
+    mask = np.load(mask_path, mmap_mode='r')
+    uncertainty = astropy.nddata.StdDevUncertainty(np.load(uncertainty_path, mmap_mode='r'))
+    cube = NDCube.from_memmap(data_path, np.float32, shape, wcs_4d_t_l_lt_ln,
+                              mask=mask, uncertainty=uncertainty)
+    assert isinstance(cube.data, np.memmap)
+    np.testing.assert_array_equal(cube.data, data)
+
+    intervals = cube.wcs.array_index_to_world([1, 2], [0, 1], [0, 1], [0, 2])
+    cropped = cube.crop([coord[0] for coord in intervals], [coord[-1] for coord in intervals])
+    exploded = cube.explode_along_axis(0)
+    for derived in (cube[1:3, 2], cube[..., 0], cropped, exploded[1], exploded[2]):
+        assert np.shares_memory(derived.data, cube.data)
+        assert np.shares_memory(derived.mask, cube.mask)
+        assert np.shares_memory(derived.uncertainty.array, cube.uncertainty.array)
+
+
+def test_from_npy(tmp_path, wcs_4d_t_l_lt_ln):
+    data = generate_data((5, 8, 10, 12))
+    path = tmp_path / "data.npy"
+    np.save(path, data)
+
+    cube = NDCube.from_npy(path, wcs_4d_t_l_lt_ln, unit=u.ct)
+    assert isinstance(cube.data, np.memmap)
+    assert cube.unit == u.ct
+    np.testing.assert_array_equal(cube.data, data)
+    assert np.shares_memory(cube[1:3, 2].data, cube.data)
+
+    cube = NDCube.from_npy(path, wcs_4d_t_l_lt_ln, mmap_mode=None)
+    assert not isinstance(cube.data, np.memmap)
+
+
+@pytest.mark.parametrize("factor", (1, (5, 2, 2, 3), (1, 4, 1, 6)))
+def test_rebin(ndcube_4d_ln_lt_l_t, factor):
+    cube = ndcube_4d_ln_lt_l_t
+    output = cube.rebin(factor, operation=np.sum)
+    factor = (factor,) * 4 if isinstance(factor, int) else factor
+    new_shape = tuple(n // f for n, f in zip(cube.data.shape, factor))
+    assert output.data.shape == new_shape
+    expected_data = cube.data.reshape(
+        [x for n, f in zip(new_shape, factor) for x in (n, f)]).sum(axis=(1, 3, 5, 7))
+    np.testing.assert_array_equal(output.data, expected_data)
+
+    # Each new pixel is at the centre of its block of old pixels.
+    new_pixels = np.meshgrid(*[np.arange(n) for n in new_shape[::-1]], indexing="ij")
+    old_pixels = [p * f + (f - 1) / 2 for p, f in zip(new_pixels, factor[::-1])]
+    np.testing.assert_allclose(output.wcs.low_level_wcs.pixel_to_world_values(*new_pixels),
+                               cube.wcs.low_level_wcs.pixel_to_world_values(*old_pixels))
+
+
+def test_rebin_mask_uncertainty(ndcube_4d_ln_lt_l_t):
+    shape = ndcube_4d_ln_lt_l_t.data.shape
+    data = np.ones(shape)
+    mask = np.zeros(shape, dtype=bool)
+    mask[0, 0:2, 0:2, 0] = True
+    mask[0, 2, 2, 0] = True
+    data[mask] = 100
+    cube = NDCube(data, wcs=ndcube_4d_ln_lt_l_t.wcs, mask=mask,
+                  uncertainty=astropy.nddata.StdDevUncertainty(np.full(shape, 2.)), unit=u.ct)
+    output = cube.rebin((1, 2, 2, 1))
+    assert output.unit == u.ct
+    np.testing.assert_array_equal(output.data, np.where(output.mask, np.nan, 1))
+    assert output.mask.sum() == 1 and output.mask[0, 0, 0, 0]
+    assert isinstance(output.uncertainty, astropy.nddata.StdDevUncertainty)
+    assert np.isnan(output.uncertainty.array[0, 0, 0, 0])
+    expected_uncertainty = np.full(output.data.shape, 1.)
+    expected_uncertainty[0, 0, 0, 0] = np.nan
+    expected_uncertainty[0, 1, 1, 0] = np.sqrt(3 * 2**2) / 3
+    np.testing.assert_allclose(output.uncertainty.array, expected_uncertainty)
+    summed = cube.rebin((1, 2, 2, 1), operation=np.sum)
+    np.testing.assert_allclose(summed.uncertainty.array[0, 0, 1:], 4)
+    np.testing.assert_allclose(summed.uncertainty.array[0, 1, 1, 0], np.sqrt(12))
+    with pytest.warns(UserWarning, match="median"):
+        assert cube.rebin((1, 2, 2, 1), operation=np.median).uncertainty is None
+    assert cube.rebin((1, 2, 2, 1), propagate_uncertainties=False).uncertainty is None
+
+
+def test_rebin_extra_coords(ndcube_3d_l_ln_lt_ectime):
+    cube = ndcube_3d_l_ln_lt_ectime
+    cube.global_coords.add("distance", "pos.distance", 1 * u.AU)
+    output = cube.rebin((2, 5, 4), propagate_uncertainties=False)
+    assert output.data.shape == (5, 1, 2)
+    assert dict(output.global_coords) == dict(cube.global_coords)
+    time, = output.axis_world_coords(wcs=output.extra_coords)
+    expected_time, = cube.axis_world_coords(wcs=cube.extra_coords)
+    assert time.shape == (1,)
+    assert time[0] == expected_time[2]
+
+
+def test_rebin_errors(ndcube_4d_ln_lt_l_t):
+    with pytest.raises(ValueError, match="one entry per array axis"):
+        ndcube_4d_ln_lt_l_t.rebin((1, 2))
+    with pytest.raises(ValueError, match="positive integers"):
+        ndcube_4d_ln_lt_l_t.rebin((1, 2, 0.5, 1))
+    with pytest.raises(ValueError, match="exactly divide"):
+        ndcube_4d_ln_lt_l_t.rebin((1, 3, 1, 1))
+
+
+@pytest.mark.parametrize("axes", (2, (-2,), "em.wl", ("wl",)))
+@pytest.mark.parametrize("chunks", (None, 2))
+def test_reduce(ndcube_4d_ln_lt_l_t, axes, chunks):
+    cube = ndcube_4d_ln_lt_l_t
+    output = cube.reduce(axes, np.mean, chunks=chunks)
+    np.testing.assert_allclose(output.data, cube.data.mean(axis=2))
+    assert output.array_axis_physical_types == [cube.array_axis_physical_types[i] for i in (0, 1, 3)]
+    wavelength = output.global_coords["em.wl"]
+    assert u.allclose(wavelength, cube.axis_world_coords("em.wl")[0].mean())
+
+
+def test_reduce_coupled_axes(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    output = cube.reduce("lon", np.median)
+    np.testing.assert_allclose(output.data, np.median(cube.data, axis=(0, 1)))
+    assert output.data.shape == cube.data.shape[2:]
+    assert isinstance(output.global_coords["helioprojective"], SkyCoord)
+
+
+def test_reduce_mask_uncertainty(ndcube_3d_l_ln_lt_ectime):
+    cube = ndcube_3d_l_ln_lt_ectime
+    shape = cube.data.shape
+    mask = np.zeros(shape, dtype=bool)
+    mask[:, 0, 0] = True
+    mask[0, 1, 1] = True
+    cube = NDCube(cube.data, wcs=cube.wcs, mask=mask, extra_coords=cube.extra_coords,
+                  uncertainty=astropy.nddata.VarianceUncertainty(np.ones(shape)))
+    output = cube.reduce(0, np.sum)
+    expected = np.ma.masked_array(cube.data, mask).sum(axis=0)
+    np.testing.assert_array_equal(output.mask, expected.mask)
+    np.testing.assert_allclose(output.data[~output.mask], expected.compressed())
+    assert output.uncertainty.array[1, 1] == shape[0] - 1
+    percentile = cube.reduce(0, np.percentile, q=90, propagate_uncertainties=False,
+                             chunks=(None, 2, 3))
+    expected = np.nanpercentile(np.where(mask, np.nan, cube.data), 90, axis=0)
+    np.testing.assert_allclose(percentile.data, expected)
+    assert percentile.uncertainty is None
+    # The extra coord along the reduced axis is kept, its reduced axis is not.
+    time = cube.reduce(1).global_coords["time"]
+    assert time == cube.axis_world_coords(wcs=cube.extra_coords)[0][2]
+
+
+def test_reduce_errors(ndcube_4d_ln_lt_l_t):
+    with pytest.raises(ValueError, match="Cannot reduce all"):
+        ndcube_4d_ln_lt_l_t.reduce((0, 1, 2, 3))
+    with pytest.raises(ValueError, match="array axis indices or physical types"):
+        ndcube_4d_ln_lt_l_t.reduce(4)
+
+
+def test_rebin_slice_wcs_stays_shallow(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    cube.wcs.pixel_shape = cube.data.shape[::-1]
+    expected = cube.axis_world_coords_values("em.wl")[0]
+    for stop in (9, 3):
+        cube = cube[:, :, 1:][:, :, :stop - 1].rebin((1, 1, 2, 1))
+    assert cube.data.shape == (5, 8, 1, 12)
+    low_level_wcs = cube.wcs.low_level_wcs
+    assert isinstance(low_level_wcs, SlicedLowLevelWCS)
+    assert isinstance(low_level_wcs._wcs, ResampledLowLevelWCS)
+    assert low_level_wcs._wcs._wcs is ndcube_4d_ln_lt_l_t.wcs
+    wavelength = cube.axis_world_coords_values("em.wl")[0]
+    # Each cycle keeps the central pixels and then halves their number.
+    assert u.allclose(wavelength, expected[4:6].mean())
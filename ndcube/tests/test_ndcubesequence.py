@@ -183,8 +183,184 @@ def test_common_axis_coords(ndc):
         assert u.allclose(td.to(u.s), 0*u.s, atol=1e-10*u.s)
 
 
+@pytest.mark.parametrize("ndc", (("ndcubesequence_3c_l_ln_lt_cax1",)), indirect=("ndc",))
+def test_cube_like_common_axis_coords(ndc):
+    output_skycoords, output_times = ndc.cube_like_common_axis_coords
+    expected_skycoords, expected_times = ndc.common_axis_coords
+    assert output_skycoords.shape[0] == 15
+    for output_coord, expected_coord in zip(output_skycoords, expected_skycoords):
+        assert all(output_coord == expected_coord)
+    assert isinstance(output_times, Time)
+    assert output_times.shape == (15,)
+    assert u.allclose((output_times - Time(expected_times)).to(u.s), 0 * u.s, atol=1e-10 * u.s)
+
+    # The coordinates are cached until the cubes are replaced.
+    cached = ndc._concatenated_common_axis_coords(1)[0]
+    assert ndc._concatenated_common_axis_coords(1)[0] is cached
+    ndc.data = ndc.data[:2]
+    assert ndc.cube_like_common_axis_coords[1].shape == (10,)
+
+
+def test_cube_like_common_axis_coords_lazy(ndcube_4d_ln_lt_l_t):
+    exploded = ndcube_4d_ln_lt_l_t.explode_along_axis(0, lazy=True, cache_size=2)
+    seq = NDCubeSequence(exploded.data, common_axis=1)
+    coords = seq.cube_like_common_axis_coords
+    # The sequence holds more cubes than the list caches, so they are recreated.
+    cached = seq._concatenated_common_axis_coords(1)[0]
+    assert all(new is old for new, old in zip(seq._concatenated_common_axis_coords(1)[0], cached))
+    expected = NDCubeSequence(list(exploded.data), common_axis=1).cube_like_common_axis_coords
+    assert u.allclose(coords[0], expected[0])
+
+    # The returned coordinates are copies which can be modified without changing the cache.
+    coords[0][0] = 0 * coords[0].unit
+    assert u.allclose(seq.cube_like_common_axis_coords[0], expected[0])
+    with pytest.raises(ValueError, match="read-only"):
+        cached[0][0] = 0 * cached[0].unit
+
+
 @pytest.mark.parametrize("ndc", (("ndcubesequence_3c_l_ln_lt_cax1",)), indirect=("ndc",))
 def test_sequence_axis_coords(ndc):
     expected = {'distance': [1*u.m, 2*u.m, 3*u.m]}
     output = ndc.sequence_axis_coords
     assert output == expected
+
+
+def _contiguous_wcs_sequence(ndc):
+    # The cubes of the fixture share one WCS, so give each its own, offset along the common axis.
+    cubes = []
+    for i, cube in enumerate(ndc):
+        wcs = cube.wcs.deepcopy()
+        wcs.wcs.crpix[1] -= 5 * i
+        cubes.append(NDCube(cube.data, wcs, mask=cube.mask, uncertainty=cube.uncertainty,
+                            extra_coords=cube.extra_coords))
+    return NDCubeSequence(cubes, common_axis=ndc._common_axis)
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_3c_l_ln_lt_cax1",)), indirect=("ndc",))
+def test_to_cube(ndc):
+    ndc = _contiguous_wcs_sequence(ndc)
+    output = ndc.to_cube()
+    assert isinstance(output, NDCube)
+    assert output.data.shape == (10, 15, 8)
+    np.testing.assert_array_equal(output.data, np.concatenate([cube.data for cube in ndc], axis=1))
+    np.testing.assert_array_equal(output.mask, np.concatenate([cube.mask for cube in ndc], axis=1))
+    np.testing.assert_array_equal(output.uncertainty.array,
+                                  np.concatenate([cube.uncertainty.array for cube in ndc], axis=1))
+    # The times along the common axis are extra coords of the cubes, so become a lookup table.
+    assert output.extra_coords.keys() == ('time',)
+    expected_times = ndc.cube_like_common_axis_coords[1]
+    output_times = output.axis_world_coords('time', wcs=output.extra_coords)[0]
+    assert u.allclose((output_times - expected_times).to(u.s), 0 * u.s, atol=1e-6 * u.s)
+
+
+def test_to_cube_stacked_wcs(wcs_3d_l_lt_ln):
+    cubes = []
+    for i in range(3):
+        wcs = wcs_3d_l_lt_ln.deepcopy()
+        wcs.array_shape = (2, 3, 4)
+        wcs.wcs.crpix[1] -= 3 * i
+        cubes.append(NDCube(np.full((2, 3, 4), i), wcs))
+    sequence = NDCubeSequence(cubes, common_axis=1)
+    output = sequence.to_cube()
+    assert output.data.shape == (2, 9, 4)
+    assert output.mask is None and output.uncertainty is None
+    assert output.wcs.array_shape == (2, 9, 4)
+    assert not output.extra_coords.keys()
+    np.testing.assert_allclose(output.wcs.pixel_to_world_values(0, 7, 0),
+                               cubes[2].wcs.pixel_to_world_values(0, 1, 0))
+
+
+def test_to_cube_table_wcs(wcs_3d_l_lt_ln):
+    cubes = []
+    for i in range(2):
+        wcs = wcs_3d_l_lt_ln.deepcopy()
+        wcs.array_shape = (2, 3, 4)
+        # The wavelengths of the second cube do not follow on from those of the first.
+        wcs.wcs.crpix[0] -= 14 * i
+        cubes.append(NDCube(np.full((2, 3, 4), i), wcs))
+    output = NDCubeSequence(cubes, common_axis=2).to_cube()
+    assert output.data.shape == (2, 3, 8)
+    assert output.wcs.world_axis_physical_types == cubes[0].wcs.world_axis_physical_types
+    for pixel, cube, cube_pixel in ((1, cubes[0], 1), (5, cubes[1], 1), (7, cubes[1], 3)):
+        expected = cube.wcs.array_index_to_world(1, 2, cube_pixel)
+        actual = output.wcs.array_index_to_world(1, 2, pixel)
+        assert u.allclose(actual[0], expected[0])
+        assert u.allclose(actual[1].Tx, expected[1].Tx)
+        assert u.allclose(actual[1].Ty, expected[1].Ty)
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_3c_l_ln_lt_cax1",)), indirect=("ndc",))
+def test_to_cube_not_describable(ndc):
+    # Latitude along the common axis also depends on longitude, so can not be a 1D table.
+    with pytest.raises(ValueError, match="also depend on other axes"):
+        ndc.to_cube()
+
+    # The wavelengths can be a table, but the cubes point in different directions.
+    cubes = [NDCube(cube.data, cube.wcs.deepcopy()) for cube in ndc]
+    cubes[1].wcs.wcs.crval[0] += 10
+    with pytest.raises(ValueError, match="other than the common axis"):
+        NDCubeSequence(cubes, common_axis=0).to_cube()
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_3c_l_ln_lt_cax1",)), indirect=("ndc",))
+def test_to_cube_lazy(ndc):
+    pytest.importorskip("dask")
+    output = _contiguous_wcs_sequence(ndc).to_cube(lazy=True)
+    assert output.is_lazy
+    np.testing.assert_array_equal(output.data.compute(),
+                                  np.concatenate([cube.data for cube in ndc], axis=1))
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_3c_l_ln_lt_cax1",)), indirect=("ndc",))
+def test_to_cube_errors(ndc):
+    with pytest.raises(ValueError, match="same shape"):
+        NDCubeSequence([ndc[0], ndc[1, :, :3]]).to_cube(common_axis=0)
+    ndc._common_axis = None
+    with pytest.raises(ValueError, match="Common axis must be set"):
+        ndc.to_cube()
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+def test_shape_table_follows_data(ndc):
+    np.testing.assert_array_equal(ndc._shapes, [(2, 3, 4)] * 4)
+    ndc.data = [ndc.data[0], ndc.data[1][:, :2]]
+    np.testing.assert_array_equal(ndc._shapes, [(2, 3, 4), (2, 2, 4)])
+    assert u.allclose(ndc.dimensions[2], [3, 2] * u.pix)
+    assert u.allclose(ndc.cube_like_dimensions, [2, 5, 4] * u.pix)
+    # Cubes with different numbers of dimensions can be held, but have no shape table.
+    ndc.data = [ndc.data[0], ndc.data[1][0]]
+    assert ndc[1].data.ndim == 2
+    with pytest.raises(ValueError, match="same number of dimensions"):
+        ndc.dimensions
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+def test_shape_table_follows_data_in_place(ndc):
+    shapes = ndc._shapes
+    assert ndc._shapes is shapes
+    ndc.data.append(ndc.data[0][:, :2])
+    assert ndc.dimensions[0] == 5 * u.pix
+    assert u.allclose(ndc.cube_like_dimensions, [2, 14, 4] * u.pix)
+    ndc.data[0] = ndc.data[0][:, :1]
+    assert u.allclose(ndc.dimensions[2], [1, 3, 3, 3, 2] * u.pix)
+    # Both cube-like indices are now in the second cube.
+    sliced = ndc.index_as_cube[:, 1:3]
+    assert sliced.dimensions[0] == 1 * u.pix
+    assert sliced.dimensions[2] == 2 * u.pix
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+def test_index_as_cube_indices(ndc):
+    assert ndc.index_as_cube[:, -1].data.shape == (2, 4)
+    np.testing.assert_array_equal(ndc.index_as_cube[:, -1].data, ndc.data[3][:, 2].data)
+    output = ndc.index_as_cube[:, [1, 2, 3, 11]]
+    assert isinstance(output, NDCubeSequence)
+    assert [cube.data.shape for cube in output.data] == [(2, 2, 4), (2, 1, 4), (2, 1, 4)]
+    np.testing.assert_array_equal(output.data[2].data, ndc.data[3][:, 2:3].data)
+    # Each cube is sliced once with the step, like slicing a single cube with a step.
+    with pytest.raises(IndexError, match="step"):
+        ndc.index_as_cube[:, ::4]
+    with pytest.raises(IndexError, match="step"):
+        ndc.data[0][:, ::4]
+    with pytest.raises(IndexError):
+        ndc.index_as_cube[:, 12]
@@ -0,0 +1,48 @@
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import EarthLocation, SkyCoord
+from astropy.time import Time
+from sunpy.coordinates import frames
+
+from ndcube import utils
+
+
+def test_concatenate_world_objects_skycoord():
+    observer = SkyCoord(0 * u.deg, 0 * u.deg, 1 * u.AU, frame=frames.HeliographicStonyhurst,
+                        obstime="2020-01-01")
+    lon = np.arange(6).reshape(2, 3) * u.arcsec
+    coords = [SkyCoord(lon + i * u.arcsec, lon, frame=frames.Helioprojective,
+                       obstime="2020-01-01", observer=observer) for i in range(2)]
+    output = utils.misc.concatenate_world_objects(coords, axis=1)
+    assert output.shape == (2, 6)
+    assert output.obstime == coords[0].obstime
+    assert output.observer == coords[0].observer
+    assert u.allclose(output.Tx, np.concatenate([c.Tx for c in coords], axis=1))
+    assert u.allclose(output.Ty, np.concatenate([c.Ty for c in coords], axis=1))
+
+
+def test_concatenate_world_objects_skycoord_attributes():
+    # obstime is not an attribute of the ICRS frame, so is only held by the SkyCoord.
+    coords = [SkyCoord([1, 2] * u.deg, [3, 4] * u.deg, pm_ra_cosdec=[1, 2] * u.mas / u.yr,
+                       pm_dec=[3, 4] * u.mas / u.yr, obstime="2000-01-01") for _ in range(2)]
+    output = utils.misc.concatenate_world_objects(coords)
+    assert output.obstime == coords[0].obstime
+    assert u.allclose(output.pm_ra_cosdec, [1, 2, 1, 2] * u.mas / u.yr)
+    assert u.allclose(output.pm_dec, [3, 4, 3, 4] * u.mas / u.yr)
+
+
+def test_concatenate_world_objects_time():
+    location = EarthLocation(0 * u.m, 0 * u.m, 6400 * u.km)
+    times = [Time(58000, np.array([0, 1e-12, 2e-12]) + i, format="mjd", scale="tai",
+                  location=location, precision=6) for i in range(2)]
+    output = utils.misc.concatenate_world_objects(times)
+    assert output.scale == "tai"
+    assert output.format == "mjd"
+    assert output.precision == 6
+    assert output.location == location
+    assert (output.jd2 == np.concatenate([t.jd2 for t in times])).all()
+
+    other = Time(times[1], location=EarthLocation(0 * u.m, 0 * u.m, 6500 * u.km))
+    output = utils.misc.concatenate_world_objects([times[0], other])
+    assert (output.location[:3] == location).all()
+    assert (output.location[3:] == other.location).all()
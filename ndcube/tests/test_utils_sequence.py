@@ -1,4 +1,5 @@
 
+import numpy as np
 import pytest
 
 from ndcube import utils
@@ -16,15 +17,22 @@ n_cubes = 4
 @pytest.mark.parametrize(
     "cube_like_index, common_axis, common_axis_lengths, expected_seq_idx, expected_common_idx",
     [(3, 1, [4, 4], 0, 3),
-     (3, 1, [2, 2], 1, 1)]
+     (3, 1, [2, 2], 1, 1),
+     (-1, 1, [2, 3], 1, 2),
+     ([0, 2, 4], 1, [2, 3], [0, 1, 1], [0, 0, 2])]
 )
 def test_cube_like_index_to_sequence_and_common_axis_indices(
         cube_like_index, common_axis, common_axis_lengths, expected_seq_idx, expected_common_idx):
     sequence_index, common_axis_index = \
         utils.sequence.cube_like_index_to_sequence_and_common_axis_indices(
             cube_like_index, common_axis, common_axis_lengths)
-    assert sequence_index == expected_seq_idx
-    assert common_axis_index == expected_common_idx
+    np.testing.assert_array_equal(sequence_index, expected_seq_idx)
+    np.testing.assert_array_equal(common_axis_index, expected_common_idx)
+
+
+def test_cube_like_index_to_sequence_and_common_axis_indices_error():
+    with pytest.raises(IndexError):
+        utils.sequence.cube_like_index_to_sequence_and_common_axis_indices(5, 1, [2, 3])
 
 
 @pytest.mark.parametrize(
@@ -42,6 +50,25 @@ def test_cube_like_tuple_item_to_sequence_items(
     pass
 
 
+@pytest.mark.parametrize(
+    "common_axis_item, expected_sequence_items", [
+        (slice(2, 7), [SequenceItem(0, (slice(None), slice(2, None))),
+                       SequenceItem(1, (slice(None), slice(0, 2)))]),
+        (slice(None, None, 2), [SequenceItem(0, (slice(None), slice(0, 6, 2))),
+                                SequenceItem(1, (slice(None), slice(1, 3, 2)))]),
+        (slice(None, None, -3), [SequenceItem(1, (slice(None), slice(2, None, -3))),
+                                 SequenceItem(0, (slice(None), slice(4, None, -3)))]),
+        (np.array([3, 4, 5, 1]), [SequenceItem(0, (slice(None), slice(3, 5))),
+                                  SequenceItem(1, (slice(None), slice(0, 1))),
+                                  SequenceItem(0, (slice(None), slice(1, 2)))]),
+        (slice(5, 5), [])]
+)
+def test_cube_like_tuple_item_to_sequence_items_indices(common_axis_item, expected_sequence_items):
+    output = utils.sequence.cube_like_tuple_item_to_sequence_items(
+        (slice(None), common_axis_item), 1, [5, 3], 2)
+    assert output == expected_sequence_items
+
+
 def test_cube_like_tuple_item_to_sequence_items_error1():
     with pytest.raises(TypeError):
         utils.sequence.cube_like_tuple_item_to_sequence_items(1, 1, [2, 2], 3)
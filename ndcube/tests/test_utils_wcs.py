@@ -2,8 +2,10 @@
 import numpy as np
 import pytest
 from astropy.wcs import WCS
+from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
 
 from ndcube import utils
+from ndcube.wcs.wrappers import ResampledLowLevelWCS
 
 ht_with_celestial = {
     'CTYPE4': 'HPLN-TAN', 'CUNIT4': 'deg', 'CDELT4': 1, 'CRPIX4': 0, 'CRVAL4': 0, 'NAXIS4': 1,
@@ -157,3 +159,30 @@ def test_array_indices_for_world_objects_2(wcs_4d_lt_t_l_ln):
     array_indices = utils.wcs.array_indices_for_world_objects(wcs_4d_lt_t_l_ln, ('lon', 'time'))
     assert len(array_indices) == 2
     assert array_indices == ((0, 3), (2,))
+
+
+def test_linear_world_axes():
+    linear_axes = utils.wcs.linear_world_axes(wm)
+    # The celestial axes are projected so only the wavelength axis is linear.
+    assert list(linear_axes) == [0]
+    pixel_axis, crval, scale, reference = linear_axes[0]
+    assert pixel_axis == 0
+    pixel = np.arange(4)
+    np.testing.assert_allclose(crval + scale * (pixel - reference),
+                               wm.pixel_to_world_values(pixel, 0, 0)[0])
+
+
+def test_linear_world_axes_sliced_resampled():
+    wcs = SlicedLowLevelWCS(ResampledLowLevelWCS(wm, 2, offset=0.5), (0, 1, slice(1, None)))
+    linear_axes = utils.wcs.linear_world_axes(wcs)
+    assert list(linear_axes) == [0]
+    pixel_axis, crval, scale, reference = linear_axes[0]
+    assert pixel_axis == 0
+    pixel = np.arange(3)
+    np.testing.assert_allclose(crval + scale * (pixel - reference),
+                               wcs.pixel_to_world_values(pixel))
+
+
+def test_linear_world_axes_nonlinear():
+    header = {'CTYPE1': 'WAVE-LOG', 'CUNIT1': 'm', 'CDELT1': 1e-10, 'CRPIX1': 1, 'CRVAL1': 1e-9}
+    assert utils.wcs.linear_world_axes(WCS(header)) == {}
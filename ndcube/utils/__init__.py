@@ -1 +1 @@
-from . import collection, misc, sequence, wcs
+from . import cache, collection, cube, misc, sequence, wcs
@@ -0,0 +1,306 @@
+"""
+Utilities for caching world coordinate grids computed from NDCube WCSes.
+"""
+
+import weakref
+import numbers
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from astropy.coordinates import BaseCoordinateFrame, SkyCoord
+from astropy.time import Time
+
+__all__ = ['WorldCoordinateCache']
+
+
+CacheEntry = namedtuple("CacheEntry", "wcs coords world_axes pixel_axes axis_correlation_matrix nbytes")
+"""
+Define CacheEntry named tuple of length 6. Its attributes are:
+wcs: the WCS object from which the coordinates were computed.
+coords: tuple of coordinate objects, each with its array dimensions in pixel order.
+world_axes: tuple giving, for each coordinate, the world axes it represents.
+pixel_axes: tuple giving, for each coordinate, the pixel axes spanned by its dimensions.
+axis_correlation_matrix: the axis correlation matrix of the WCS.
+nbytes: the number of bytes held by the coordinate objects.
+"""
+
+
+def _nbytes(coord):
+    """
+    Estimate the number of bytes held by a coordinate object.
+    """
+    if isinstance(coord, Time):
+        return coord.jd1.nbytes + coord.jd2.nbytes
+    if isinstance(coord, (SkyCoord, BaseCoordinateFrame)):
+        data = coord.data
+        return sum(getattr(data, component).nbytes for component in data.components)
+    return getattr(coord, "nbytes", 0)
+
+
+def _set_read_only(coord):
+    """
+    Prevent a cached coordinate object from being modified in place.
+
+    Views of the coordinate, e.g. its transpose or slices of it, are then read-only too.
+    """
+    if isinstance(coord, Time):
+        arrays = [coord.jd1, coord.jd2]
+    elif isinstance(coord, (SkyCoord, BaseCoordinateFrame)):
+        data = coord.data
+        arrays = [getattr(data, component) for component in data.components]
+    else:
+        arrays = [coord]
+    for array in arrays:
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+
+
+class _SharedBudget:
+    """
+    Track the bytes held by all world coordinate caches in the process.
+
+    The grids of every cache are ordered by when they were last used, so the least
+    recently used grids, whichever cache holds them, are evicted first
+    once the caches together exceed `WorldCoordinateCache.max_total_bytes`.
+    """
+    def __init__(self):
+        self._entries = OrderedDict()
+        self.nbytes = 0
+
+    def add(self, cache, key, nbytes):
+        self.discard(id(cache), key)
+        self._entries[(id(cache), key)] = (weakref.ref(cache), nbytes)
+        self.nbytes += nbytes
+
+    def touch(self, cache, key):
+        if (id(cache), key) in self._entries:
+            self._entries.move_to_end((id(cache), key))
+
+    def discard(self, cache_id, key):
+        entry = self._entries.pop((cache_id, key), None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def discard_cache(self, cache_id):
+        for cache_key in [cache_key for cache_key in self._entries if cache_key[0] == cache_id]:
+            self.discard(*cache_key)
+
+    def trim(self, max_bytes):
+        while self.nbytes > max_bytes and self._entries:
+            (cache_id, key), (cache_ref, _) = next(iter(self._entries.items()))
+            cache = cache_ref()
+            if cache is None:
+                self.discard(cache_id, key)
+            else:
+                cache._evict(key)
+
+
+_shared_budget = _SharedBudget()
+
+
+class WorldCoordinateCache:
+    """
+    A size-bounded, least-recently-used cache of world coordinate grids.
+
+    Each `~ndcube.NDCube` holds one of these to avoid recomputing the world
+    coordinates of its pixel grid on every call to
+    `~ndcube.NDCube.axis_world_coords` or `~ndcube.NDCube.axis_world_coords_values`.
+    Entries are keyed on the identity of the WCS object used to compute them
+    as well as the options which change the pixel grid, e.g. ``edges``.
+    If a WCS object is modified in place, the cache must be cleared with `clear`.
+    Cached grids are read-only; `~ndcube.NDCube` returns copies of them to the user.
+
+    Besides the limits of each cache, the caches of all cubes together hold
+    at most ``WorldCoordinateCache.max_total_bytes`` bytes, 256 MiB by default.
+    Beyond this, the least recently used grids of any cache are evicted.
+
+    A cache can also be linked to the cache of the cube from which its own cube
+    was sliced. In this case, grids which are not cached locally are derived by
+    slicing the parent's cached grids rather than by recomputing them.
+
+    Parameters
+    ----------
+    max_entries: `int`, optional
+        The maximum number of grids to hold. Default=8
+
+    max_bytes: `int`, optional
+        The maximum number of bytes the cached grids may occupy.
+        Grids larger than this are never cached. Default=64 MiB
+    """
+    max_total_bytes = 256 * 1024**2
+
+    def __init__(self, max_entries=8, max_bytes=64 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._parent = None
+        self.hits = 0
+        self.misses = 0
+        weakref.finalize(self, _shared_budget.discard_cache, id(self))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # Cached grids and the weak link to the parent cache are not preserved
+        # when the owning cube is copied or pickled.
+        return {"max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes held by the cached grids.
+        """
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def info(self):
+        """
+        Summarise the current state of the cache.
+
+        Returns
+        -------
+        info: `dict`
+            The number of entries, bytes held, hits and misses, and the cache limits.
+        """
+        return {"entries": len(self),
+                "nbytes": self.nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes}
+
+    def clear(self):
+        """
+        Remove all cached grids.
+        """
+        for key in list(self._entries):
+            self._evict(key)
+
+    def get(self, key, wcs, derivable=False):
+        """
+        Retrieve the grid cached for a key and WCS object.
+
+        If the grid is not cached, ``derivable`` is True and the grid
+        can be derived from the parent cache, it is derived, cached and returned.
+        Only grids of pixel centres computed from a cube's own WCS are derivable.
+
+        Returns
+        -------
+        entry: `CacheEntry` or `None`
+        """
+        entry = self._entries.get((id(wcs),) + key)
+        if entry is not None and entry.wcs is wcs:
+            self._entries.move_to_end((id(wcs),) + key)
+            _shared_budget.touch(self, (id(wcs),) + key)
+            self.hits += 1
+            return entry
+        entry = self._derive_from_parent(key, wcs) if derivable else None
+        if entry is not None:
+            self.hits += 1
+            self._store(key, entry)
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, key, wcs, coords, world_axes, pixel_axes, axis_correlation_matrix):
+        """
+        Cache a grid, evicting the least recently used grids if the cache is full.
+
+        The coordinate objects are made read-only.
+
+        Returns
+        -------
+        entry: `CacheEntry`
+        """
+        for coord in coords:
+            _set_read_only(coord)
+        nbytes = sum(_nbytes(coord) for coord in coords)
+        entry = CacheEntry(wcs, tuple(coords), tuple(world_axes), tuple(pixel_axes),
+                           axis_correlation_matrix, nbytes)
+        self._store(key, entry)
+        return entry
+
+    def _store(self, key, entry):
+        if (entry.nbytes > min(self.max_bytes, self.max_total_bytes)
+                or self.max_entries < 1):
+            return
+        key = (id(entry.wcs),) + key
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        _shared_budget.add(self, key, entry.nbytes)
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            self._evict(next(iter(self._entries)))
+        _shared_budget.trim(self.max_total_bytes)
+
+    def _evict(self, key):
+        del self._entries[key]
+        _shared_budget.discard(id(self), key)
+
+    def link_to_parent(self, parent, parent_wcs, wcs, item):
+        """
+        Link this cache to the cache of the cube from which its cube was sliced.
+
+        Parameters
+        ----------
+        parent: `WorldCoordinateCache`
+            The cache of the parent cube. Only a weak reference to it is kept.
+
+        parent_wcs:
+            The WCS of the parent cube.
+
+        wcs:
+            The WCS of the sliced cube.
+
+        item: `tuple` of `int` or `slice`
+            The sanitized item, in array order, with which the parent was sliced.
+        """
+        # Only simple items can be used to derive grids.
+        for i in item:
+            if isinstance(i, numbers.Integral):
+                if i < 0:
+                    return
+            elif ((i.start is not None and i.start < 0) or (i.stop is not None and i.stop < 0)):
+                return
+        self._parent = (weakref.ref(parent), parent_wcs, wcs, tuple(item))
+
+    def _derive_from_parent(self, key, wcs):
+        """
+        Derive a grid by slicing the grid cached by the parent.
+        """
+        if self._parent is None:
+            return None
+        parent_ref, parent_wcs, child_wcs, item = self._parent
+        parent = parent_ref()
+        if parent is None or wcs is not child_wcs:
+            return None
+        parent_entry = parent.get(key, parent_wcs, derivable=True)
+        if parent_entry is None:
+            return None
+
+        pixel_item = item[::-1]
+        pixel_keep = np.array([not isinstance(i, numbers.Integral) for i in pixel_item])
+        if not pixel_keep.any():
+            return None
+        new_pixel_index = np.cumsum(pixel_keep) - 1
+        matrix = parent_entry.axis_correlation_matrix
+        world_keep = matrix[:, pixel_keep].any(axis=1)
+        new_world_index = np.cumsum(world_keep) - 1
+
+        coords, world_axes, pixel_axes = [], [], []
+        for coord, waxes, paxes in zip(parent_entry.coords, parent_entry.world_axes,
+                                       parent_entry.pixel_axes):
+            kept = world_keep[list(waxes)]
+            if not kept.any():
+                continue
+            if not kept.all():
+                # Coordinate objects cannot be partially dropped.
+                return None
+            coords.append(coord[tuple(pixel_item[p] for p in paxes)] if paxes else coord)
+            world_axes.append(tuple(new_world_index[w] for w in waxes))
+            pixel_axes.append(tuple(new_pixel_index[p] for p in paxes if pixel_keep[p]))
+        nbytes = sum(_nbytes(coord) for coord in coords)
+        return CacheEntry(wcs, tuple(coords), tuple(world_axes), tuple(pixel_axes),
+                          matrix[world_keep][:, pixel_keep], nbytes)
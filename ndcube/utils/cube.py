@@ -0,0 +1,142 @@
+"""
+Utilities for reducing the data, mask and uncertainty arrays of NDCube objects.
+"""
+import warnings
+
+import numpy as np
+from astropy.nddata import InverseVariance, StdDevUncertainty, VarianceUncertainty
+
+__all__ = ['block_reshape', 'reduce_arrays']
+
+# nan-ignoring versions of common reductions, used to exclude masked elements.
+NAN_OPERATIONS = {np.sum: np.nansum,
+                  np.mean: np.nanmean,
+                  np.median: np.nanmedian,
+                  np.min: np.nanmin,
+                  np.max: np.nanmax,
+                  np.std: np.nanstd,
+                  np.var: np.nanvar,
+                  np.prod: np.nanprod,
+                  np.percentile: np.nanpercentile,
+                  np.quantile: np.nanquantile}
+SUM_OPERATIONS = (np.sum, np.nansum)
+MEAN_OPERATIONS = (np.mean, np.nanmean)
+
+
+def block_reshape(array, factor):
+    """
+    Reshape an array so that each block of elements to be combined spans its own axes.
+
+    Parameters
+    ----------
+    array: array-like
+        The array to reshape. Each element of ``factor`` must exactly divide the
+        length of the corresponding axis.
+
+    factor: `tuple` of `int`
+        The length of a block along each axis.
+
+    Returns
+    -------
+    reshaped: array-like
+        The array with each axis ``i`` split into two axes of lengths
+        ``array.shape[i] // factor[i]`` and ``factor[i]``.
+        Array-likes which cannot be reshaped, e.g. `ndcube.io.ChunkedArray`,
+        are read into a `numpy.ndarray` first.
+
+    block_axes: `tuple` of `int`
+        The axes of ``reshaped`` spanning each block.
+    """
+    if not hasattr(array, "reshape"):
+        array = np.asarray(array)
+    shape = []
+    for n, f in zip(array.shape, factor):
+        shape += [n // f, f]
+    return array.reshape(shape), tuple(range(1, 2 * len(factor), 2))
+
+
+def reduce_arrays(data, mask, uncertainty, axis, operation, propagate_uncertainties=True,
+                  **kwargs):
+    """
+    Reduce the data, mask and uncertainty of a cube along one or more axes.
+
+    Masked elements are excluded from the reduction. For common numpy reductions,
+    e.g. `numpy.mean` and `numpy.median`, this is done by replacing masked
+    elements with NaN and calling the nan-ignoring version of the function,
+    e.g. `numpy.nanmean`. Other operations are passed a `numpy.ma.MaskedArray`.
+    An element of the reduced mask is True only if all the elements reduced into it are masked.
+
+    Parameters
+    ----------
+    data: array-like
+        The data array.
+
+    mask: array-like or `None`
+        A boolean array of the same shape as ``data``.
+
+    uncertainty: `astropy.nddata.NDUncertainty` or `None`
+        The uncertainty of ``data``.
+
+    axis: `tuple` of `int`
+        The axes along which to reduce.
+
+    operation: function
+        The reduction, called as ``operation(data, axis=axis, **kwargs)``.
+
+    propagate_uncertainties: `bool`, optional
+        If True, the uncertainty is propagated. This is only possible for sums and means.
+        For other operations a warning is raised and no uncertainty is returned.
+        If False, no uncertainty is returned. Default=True
+
+    Returns
+    -------
+    data: array-like
+    mask: array-like or `None`
+    uncertainty: `astropy.nddata.NDUncertainty` or `None`
+    """
+    with warnings.catch_warnings():
+        # Reductions of blocks which are entirely masked give NaN.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if mask is None:
+            new_data = operation(data, axis=axis, **kwargs)
+            new_mask = None
+        else:
+            nan_operation = (operation if operation in NAN_OPERATIONS.values()
+                             else NAN_OPERATIONS.get(operation))
+            if nan_operation is None:
+                new_data = np.ma.getdata(operation(np.ma.masked_array(data, mask), axis=axis,
+                                                   **kwargs))
+            else:
+                new_data = nan_operation(np.where(mask, np.nan, data), axis=axis, **kwargs)
+            new_mask = np.all(mask, axis=axis)
+
+        new_uncertainty = None
+        if propagate_uncertainties and uncertainty is not None and uncertainty.array is not None:
+            new_uncertainty = _reduce_uncertainty(uncertainty, mask, axis, operation)
+    return new_data, new_mask, new_uncertainty
+
+
+def _reduce_uncertainty(uncertainty, mask, axis, operation):
+    """
+    Propagate uncertainties through a sum or mean, assuming they are uncorrelated.
+    """
+    if operation not in SUM_OPERATIONS + MEAN_OPERATIONS:
+        warnings.warn(f"Uncertainties cannot be propagated through {operation.__name__}. "
+                      "The result will have no uncertainty.", UserWarning)
+        return None
+    if not isinstance(uncertainty, (StdDevUncertainty, VarianceUncertainty, InverseVariance)):
+        warnings.warn(f"Uncertainties of type {type(uncertainty).__name__} cannot be propagated. "
+                      "The result will have no uncertainty.", UserWarning)
+        return None
+    variance = uncertainty.represent_as(VarianceUncertainty)
+    variance_array = variance.array
+    if mask is not None:
+        variance_array = np.where(mask, 0, variance_array)
+    new_variance = np.sum(variance_array, axis=axis)
+    if operation in MEAN_OPERATIONS:
+        if mask is None:
+            n_elements = np.prod([variance_array.shape[i] for i in axis])
+        else:
+            n_elements = np.sum(~mask, axis=axis)
+        new_variance = new_variance / n_elements**2
+    return VarianceUncertainty(new_variance, unit=variance.unit).represent_as(type(uncertainty))
@@ -1,7 +1,12 @@
+import sys
 import inspect
 from functools import wraps
 
 import astropy.units as u
+import numpy as np
+from astropy.coordinates import (BaseCoordinateFrame, SkyCoord, concatenate,
+                                 concatenate_representations, frame_transform_graph)
+from astropy.time import Time
 from astropy.wcs.wcsapi import BaseHighLevelWCS
 
 from ndcube.extra_coords import ExtraCoords
@@ -88,3 +93,85 @@ def convert_quantities_to_units(coords, units):
     """
     return [coord.to(unit) if isinstance(coord, u.Quantity) else coord
             for coord, unit in zip(coords, units)]
+
+
+def stack_world_objects(objects):
+    """Stacks a sequence of size-1 world coordinate objects into a single 1-D object.
+
+    Parameters
+    ----------
+    objects: iterable of high level coordinate objects, `astropy.units.Quantity` or `float`
+        The objects to be stacked, e.g. the corners of several regions of interest.
+        All objects must be of the same type and each must hold a single coordinate.
+
+    Returns
+    -------
+    stacked: high level coordinate object, `astropy.units.Quantity` or `numpy.ndarray`
+        A 1-D object of the same type as the inputs, with one entry per input object.
+    """
+    objects = [obj.reshape((1,)) if hasattr(obj, "reshape") else np.array([obj])
+               for obj in objects]
+    first = objects[0]
+    if isinstance(first, (SkyCoord, BaseCoordinateFrame)):
+        return concatenate(objects)
+    if isinstance(first, Time):
+        return concatenate_world_objects(objects)
+    return np.concatenate(objects)
+
+
+def concatenate_world_objects(objects, axis=0):
+    """Concatenates a sequence of world coordinate objects along an axis.
+
+    Parameters
+    ----------
+    objects: iterable of high level coordinate objects, `astropy.units.Quantity` or `numpy.ndarray`
+        The objects to be concatenated. All objects must be of the same type
+        and have the same shape except along ``axis``.
+
+    axis: `int`, optional
+        The axis along which to concatenate the objects. Default=0
+
+    Returns
+    -------
+    concatenated: high level coordinate object, `astropy.units.Quantity` or `numpy.ndarray`
+        A single object of the same type as the inputs.
+    """
+    first = objects[0]
+    if isinstance(first, (SkyCoord, BaseCoordinateFrame)):
+        # astropy's concatenate only joins along the first axis,
+        # so move the axis to the front and back again.
+        representation = concatenate_representations([obj.swapaxes(0, axis).data
+                                                      for obj in objects])
+        frame = getattr(first, "frame", first).realize_frame(representation).swapaxes(0, axis)
+        if not isinstance(first, SkyCoord):
+            return frame
+        # Keep the frame attributes which the SkyCoord holds outside of its frame, e.g. obstime.
+        extra_attributes = {name: getattr(first, name)
+                            for name in frame_transform_graph.frame_attributes
+                            if name not in first.frame.frame_attributes
+                            and getattr(first, name) is not None}
+        return SkyCoord(frame, **extra_attributes)
+    if isinstance(first, Time):
+        objects = [getattr(obj, first.scale) for obj in objects]
+        location = first.location
+        if location is not None and (location.shape or
+                                     any(obj.location is not location for obj in objects[1:])):
+            location = np.concatenate([np.broadcast_to(obj.location, obj.shape, subok=True)
+                                       for obj in objects], axis=axis)
+        concatenated = Time(np.concatenate([obj.jd1 for obj in objects], axis=axis),
+                            np.concatenate([obj.jd2 for obj in objects], axis=axis),
+                            format="jd", scale=first.scale, precision=first.precision,
+                            location=location)
+        concatenated.format = first.format
+        return concatenated
+    return np.concatenate(objects, axis=axis)
+
+
+def is_dask_array(obj):
+    """Returns True if the object is a dask array.
+
+    dask is an optional dependency so it is not imported by this function.
+    If dask has not already been imported, the object cannot be a dask array.
+    """
+    dask_array = sys.modules.get("dask.array")
+    return dask_array is not None and isinstance(obj, dask_array.Array)
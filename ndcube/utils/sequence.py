@@ -3,12 +3,14 @@
 Utilities for ndcube sequence.
 """
 
-from copy import deepcopy
-from collections import namedtuple
+import numbers
+from collections import OrderedDict, namedtuple
+from collections.abc import Sequence
 
 import numpy as np
 
 __all__ = ['SequenceItem',
+           'SlicedCubeList',
            'cube_like_index_to_sequence_and_common_axis_indices',
            'cube_like_tuple_item_to_sequence_items']
 
@@ -22,8 +24,101 @@ by sequence_index attribute.
 """
 
 
+class _CubeList(list):
+    """
+    A list of cubes which counts the number of times it is modified in place.
+
+    `~ndcube.NDCubeSequence` stores its cubes in one of these so that the shapes
+    of the cubes only need to be found again after the list has been modified.
+    """
+    _version = 0
+
+
+def _counts_modifications(name):
+    def method(self, *args, **kwargs):
+        result = getattr(list, name)(self, *args, **kwargs)
+        self._version += 1
+        return result
+    method.__name__ = name
+    method.__doc__ = getattr(list, name).__doc__
+    return method
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_CubeList, _name, _counts_modifications(_name))
+del _name
+
+
+class SlicedCubeList(Sequence):
+    """
+    A read-only list of cubes, each of which is a slice of the same parent cube.
+
+    The slices are only made when they are accessed, so creating the list is
+    cheap regardless of its length. The most recently accessed slices are cached.
+    Slicing the list returns another `SlicedCubeList` of the same parent cube.
+
+    Parameters
+    ----------
+    cube: `ndcube.NDCube`
+        The parent cube.
+
+    items: iterable
+        The item with which to slice the parent cube to produce each element of the list.
+
+    meta: `dict` or None, optional
+        The meta assigned to each slice. Default=None
+
+    cache_size: `int`, optional
+        The maximum number of slices to cache. Default=16
+    """
+    def __init__(self, cube, items, meta=None, cache_size=16):
+        self.cube = cube
+        self.items = list(items)
+        self.meta = meta
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return type(self)(self.cube, self.items[index], meta=self.meta,
+                              cache_size=self.cache_size)
+        if not isinstance(index, numbers.Integral):
+            raise TypeError(f"{type(self).__name__} indices must be integers or slices, "
+                            f"not {type(index).__name__}")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        sliced_cube = self.cube[self.items[index]]
+        sliced_cube.meta = self.meta
+        if self.cache_size > 0:
+            self._cache[index] = sliced_cube
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return sliced_cube
+
+    @property
+    def shapes(self):
+        """
+        The array shape of each slice, found without slicing the parent cube.
+        """
+        template = np.broadcast_to(0, self.cube.data.shape)
+        return [template[item].shape for item in self.items]
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self)} slices of {type(self.cube).__name__}>"
+
+
 def cube_like_index_to_sequence_and_common_axis_indices(cube_like_index, common_axis,
-                                                        common_axis_lengths):
+                                                        common_axis_lengths, cumul_lengths=None):
     """
     Converts a cube-like index for an NDCubeSequence to a sequence index and a common axis index.
 
@@ -33,39 +128,58 @@ def cube_like_index_to_sequence_and_common_axis_indices(cube_like_index, common_
 
     Parameters
     ----------
-    cube_like_index: `int`
+    cube_like_index: `int` or array of `int`
+        Negative indices count back from the end of the cube-like common axis.
 
     common_axis_lengths: iterable of `int`
         The lengths of each cube in the sequence along the common axis.
 
+    cumul_lengths: `numpy.ndarray`, optional
+        The cumulative sum of ``common_axis_lengths``. If given, it is not recomputed.
+
     Returns
     -------
-    sequence_index: `int`
+    sequence_index: `int` or array of `int`
         Index of the cube in the sequence in which the cube-like index can be found.
 
-    common_axis_index: `int`
+    common_axis_index: `int` or array of `int`
         The index along the cube's common axis to which the input cube-like index corresponds.
     """
-    cumul_lengths = np.cumsum(common_axis_lengths)
-    sequence_index = np.arange(len(cumul_lengths))[cumul_lengths > cube_like_index][0]
-    if sequence_index == 0:
-        common_axis_index = cube_like_index
-    else:
-        common_axis_index = cube_like_index - cumul_lengths[sequence_index - 1]
+    if cumul_lengths is None:
+        cumul_lengths = np.cumsum(common_axis_lengths)
+    cube_like_index = np.asarray(cube_like_index)
+    n_cube_like = cumul_lengths[-1] if len(cumul_lengths) else 0
+    cube_like_index = np.where(cube_like_index < 0, cube_like_index + n_cube_like,
+                               cube_like_index)
+    if ((cube_like_index < 0) | (cube_like_index >= n_cube_like)).any():
+        raise IndexError("Cube-like index out of range along the common axis.")
+    # Binary search for the first cube whose cumulative length exceeds the index.
+    sequence_index = np.searchsorted(cumul_lengths, cube_like_index, side="right")
+    cube_start = np.where(sequence_index > 0, cumul_lengths[sequence_index - 1], 0)
+    common_axis_index = cube_like_index - cube_start
+    if sequence_index.ndim == 0:
+        return int(sequence_index), int(common_axis_index)
     return sequence_index, common_axis_index
 
 
-def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_lengths, n_cube_dims):
+def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_lengths, n_cube_dims,
+                                           cumul_lengths=None):
     """
     Convert a tuple for slicing an NDCubeSequence in the cube-like API to a list of SequenceItems.
 
-    This requires the common_axis item to be a slice item.
+    This requires the common_axis item to be a slice or an array of indices.
     If it is an int, this function should not be used.
 
+    A slice becomes one SequenceItem for each cube it includes, slicing that cube
+    with the same step. For an array of indices, each run of consecutive indices
+    which falls within one cube becomes one SequenceItem, so indices that skip
+    or revisit elements produce several SequenceItems.
+
     Parameters
     ----------
-    item: iterable of `int` or `slice`
-        The slicing item.  The common axis entry must be a `slice`
+    item: iterable of `int`, `slice` or array of `int`
+        The slicing item.  The common axis entry must be a `slice` or an array
+        of integer or boolean indices.
 
     common_axis: `int`
         The index of the item corresponding to the common axis.
@@ -76,6 +190,9 @@ def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_length
     n_cube_dims: `int`
         The number of dimensions in the cubes in the sequence.
 
+    cumul_lengths: `numpy.ndarray`, optional
+        The cumulative sum of ``common_axis_lengths``. If given, it is not recomputed.
+
     Returns
     -------
     sequence_items: `list` of `SequenceItem`
@@ -88,55 +205,65 @@ def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_length
     if len(item) <= common_axis:
         raise ValueError("item must be include an entry for the common axis, "
                          "i.e. length of item must be > common_axis.")
-    if not isinstance(item[common_axis], slice):
+    common_axis_item = item[common_axis]
+    if not isinstance(common_axis_item, slice) and np.ndim(common_axis_item) != 1:
         raise TypeError("This function should only be used when the common axis entry "
-                        "of item is a slice object.")
-    # Define default item for slicing the cubes
-    default_cube_item = list(item)
-    default_cube_item[common_axis] = slice(None)
-
-    # Convert start and stop cube-like indices to sequence and cube indices.
-    if item[common_axis].start is None:
-        common_axis_start = 0
-    else:
-        common_axis_start = item[common_axis].start
-    if item[common_axis].stop is None:
-        common_axis_stop = sum(common_axis_lengths)
-    else:
-        common_axis_stop = item[common_axis].stop
-    item[common_axis] = slice(common_axis_start, common_axis_stop)
-    start_sequence_index, start_common_axis_index = \
-        cube_like_index_to_sequence_and_common_axis_indices(
-            item[common_axis].start, common_axis, common_axis_lengths)
-    stop_sequence_index, stop_common_axis_index = \
-        cube_like_index_to_sequence_and_common_axis_indices(
-            item[common_axis].stop - 1, common_axis, common_axis_lengths)
-    stop_common_axis_index += 1
-    # In the two lines above, the stop index was decremented by one in the
-    # calculation of the stop sequence axis to avoid ticking over to new NDCube if not needed.
-    # Once the correct sequence index was found,
-    # 1 was added back onto the corresponding common axis index.
-
-    # Create iterable of SequenceItems to tell us how to slice each cube.
-    n_cubes_after_first = stop_sequence_index - start_sequence_index
-    # If only one cube included in slicing item, return iterable of single SequenceItem
-    if n_cubes_after_first == 0:
-        cube_item = deepcopy(default_cube_item)
-        cube_item[common_axis] = slice(start_common_axis_index, stop_common_axis_index)
-        sequence_items = [SequenceItem(start_sequence_index, tuple(cube_item))]
-    else:
-        if n_cubes_after_first > 1:  # Condition > 1 to exclude final cube. We'll add it later.
-            sequence_items = [SequenceItem(i, tuple(default_cube_item))
-                              for i in range(start_sequence_index + 1, stop_sequence_index)]
-        else:
+                        "of item is a slice object or a 1-D array of indices.")
+    if cumul_lengths is None:
+        cumul_lengths = np.cumsum(common_axis_lengths)
+    n_cube_like = int(cumul_lengths[-1]) if len(cumul_lengths) else 0
+    cube_item = list(item)
+
+    if isinstance(common_axis_item, slice):
+        start, stop, step = common_axis_item.indices(n_cube_like)
+        if step == 1:
+            if stop <= start:
+                return []
+            # Only the first and last cubes are partially included.
+            (start_sequence_index, stop_sequence_index), (start_index, stop_index) = \
+                cube_like_index_to_sequence_and_common_axis_indices(
+                    [start, stop - 1], common_axis, common_axis_lengths, cumul_lengths)
             sequence_items = []
-        # Insert final cube if there is one after the first.
-        if n_cubes_after_first > 0:
-            final_cube_item = deepcopy(default_cube_item)
-            final_cube_item[common_axis] = slice(0, stop_common_axis_index)
-            sequence_items.append(SequenceItem(stop_sequence_index, final_cube_item))
-        # Finally, add Sequence index for first cube.
-        first_cube_item = deepcopy(default_cube_item)
-        first_cube_item[common_axis] = slice(start_common_axis_index, None)
-        sequence_items.insert(0, SequenceItem(start_sequence_index, first_cube_item))
+            for sequence_index in range(start_sequence_index, stop_sequence_index + 1):
+                cube_item[common_axis] = slice(
+                    start_index if sequence_index == start_sequence_index else 0,
+                    stop_index + 1 if sequence_index == stop_sequence_index else None)
+                sequence_items.append(SequenceItem(int(sequence_index), tuple(cube_item)))
+            return sequence_items
+        indices = np.arange(start, stop, step)
+        if len(indices) == 0:
+            return []
+        sequence_indices, common_axis_indices = \
+            cube_like_index_to_sequence_and_common_axis_indices(
+                indices, common_axis, common_axis_lengths, cumul_lengths)
+        # The cubes are visited in order, so each one is entered only once.
+        breaks = np.flatnonzero(np.diff(sequence_indices)) + 1
+        sequence_items = []
+        for run_start, run_stop in zip(np.concatenate([[0], breaks]),
+                                       np.concatenate([breaks, [len(indices)]])):
+            local_stop = int(common_axis_indices[run_stop - 1]) + step
+            cube_item[common_axis] = slice(int(common_axis_indices[run_start]),
+                                           local_stop if local_stop >= 0 else None, step)
+            sequence_items.append(SequenceItem(int(sequence_indices[run_start]),
+                                               tuple(cube_item)))
+        return sequence_items
+
+    indices = np.asarray(common_axis_item)
+    if indices.dtype == bool:
+        if len(indices) != n_cube_like:
+            raise IndexError("Boolean index must be the same length as the common axis.")
+        indices = np.flatnonzero(indices)
+    if len(indices) == 0:
+        return []
+    sequence_indices, common_axis_indices = cube_like_index_to_sequence_and_common_axis_indices(
+        indices, common_axis, common_axis_lengths, cumul_lengths)
+    # Split the indices wherever they move to another cube or are not consecutive.
+    breaks = np.flatnonzero((np.diff(sequence_indices) != 0) |
+                            (np.diff(common_axis_indices) != 1)) + 1
+    sequence_items = []
+    for run_start, run_stop in zip(np.concatenate([[0], breaks]),
+                                   np.concatenate([breaks, [len(indices)]])):
+        cube_item[common_axis] = slice(int(common_axis_indices[run_start]),
+                                       int(common_axis_indices[run_stop - 1]) + 1)
+        sequence_items.append(SequenceItem(int(sequence_indices[run_start]), tuple(cube_item)))
     return sequence_items
@@ -8,7 +8,11 @@ import numbers
 from collections import UserDict
 
 import numpy as np
+from astropy.wcs import WCS
 from astropy.wcs.wcsapi import low_level_api
+from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
+
+from ndcube.wcs.wrappers import ResampledLowLevelWCS
 
 __all__ = ['array_indices_for_world_objects', 'convert_between_array_and_pixel_axes',
            'calculate_world_indices_from_axes', 'wcs_ivoa_mapping',
@@ -17,7 +21,7 @@ __all__ = ['array_indices_for_world_objects', 'convert_between_array_and_pixel_a
            'physical_type_to_world_axis', 'get_dependent_pixel_axes',
            'get_dependent_array_axes', 'get_dependent_world_axes',
            'get_dependent_physical_types', 'array_indices_for_world_objects',
-           'validate_physical_types']
+           'validate_physical_types', 'linear_world_axes']
 
 
 class TwoWayDict(UserDict):
@@ -429,3 +433,77 @@ def array_indices_for_world_objects(wcs, axes=None):
         array_index = convert_between_array_and_pixel_axes(pixel_index, wcs.pixel_n_dim)
         array_indices[oinds] = tuple(array_index[::-1])  # Invert from pixel order to array order
     return tuple(ai for ai in array_indices if ai)
+
+
+def linear_world_axes(wcs):
+    """
+    Find the world axes of a WCS which are a linear function of a single pixel axis.
+
+    Such world axes can be computed directly from the pixel indices without
+    evaluating the WCS transformation. Linear axes are found by inspecting
+    FITS WCS objects, i.e. `astropy.wcs.WCS`, which have no distortions, including
+    when they are sliced by `~astropy.wcs.wcsapi.wrappers.SlicedLowLevelWCS` or
+    resampled by `~ndcube.wcs.wrappers.ResampledLowLevelWCS`.
+    No axes of other WCS types are identified as linear.
+
+    Parameters
+    ----------
+    wcs: `astropy.wcs.wcsapi.BaseLowLevelWCS`
+        The WCS to inspect.
+
+    Returns
+    -------
+    linear_axes: `dict`
+        Maps the index of each linear world axis to a tuple of
+        ``(pixel_axis, crval, scale, reference_pixel)``, such that the world
+        value at pixel ``p`` along ``pixel_axis`` is ``crval + scale * (p - reference_pixel)``.
+    """
+    if isinstance(wcs, WCS):
+        return _fits_linear_world_axes(wcs)
+
+    if isinstance(wcs, SlicedLowLevelWCS):
+        inner = linear_world_axes(wcs._wcs)
+        pixel_keep = list(wcs._pixel_keep)
+        linear_axes = {}
+        for world_axis, inner_world_axis in enumerate(wcs._world_keep):
+            if inner_world_axis not in inner:
+                continue
+            pixel_axis, crval, scale, reference = inner[inner_world_axis]
+            pixel_slice = wcs._slices_pixel[pixel_axis]
+            if pixel_axis not in pixel_keep or pixel_slice.step not in (None, 1):
+                continue
+            linear_axes[world_axis] = (pixel_keep.index(pixel_axis), crval, scale,
+                                       reference - (pixel_slice.start or 0))
+        return linear_axes
+
+    if isinstance(wcs, ResampledLowLevelWCS):
+        # Pixel p of the resampled WCS is at pixel p * factor + offset of the inner WCS.
+        return {world_axis: (pixel_axis, crval, scale * wcs._factor[pixel_axis],
+                             (reference - wcs._offset[pixel_axis]) / wcs._factor[pixel_axis])
+                for world_axis, (pixel_axis, crval, scale, reference)
+                in linear_world_axes(wcs._wcs).items()}
+
+    return {}
+
+
+def _fits_linear_world_axes(wcs):
+    if any(distortion is not None for distortion in (wcs.sip, wcs.cpdis1, wcs.cpdis2,
+                                                     wcs.det2im1, wcs.det2im2)):
+        return {}
+    pc = wcs.wcs.get_pc()
+    cdelt = wcs.wcs.get_cdelt()
+    linear_axes = {}
+    for world_axis, ctype in enumerate(wcs.wcs.ctype):
+        # Celestial axes are always projected and non-empty algorithm codes,
+        # e.g. WAVE-LOG, denote non-linear transformations.
+        if world_axis in (wcs.wcs.lng, wcs.wcs.lat) or (ctype[4:5] == "-" and ctype[5:].strip()):
+            continue
+        pixel_axes = np.nonzero(pc[world_axis])[0]
+        if len(pixel_axes) != 1:
+            continue
+        pixel_axis = pixel_axes[0]
+        # FITS pixel coordinates are 1-based.
+        linear_axes[world_axis] = (int(pixel_axis), wcs.wcs.crval[world_axis],
+                                   cdelt[world_axis] * pc[world_axis, pixel_axis],
+                                   wcs.wcs.crpix[pixel_axis] - 1)
+    return linear_axes
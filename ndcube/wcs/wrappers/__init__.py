@@ -1,3 +1,4 @@
 from .compound_wcs import *  # noqa
 from .reordered_wcs import *  # noqa
 from .resampled_wcs import *  # noqa
+from .normalize import *  # noqa
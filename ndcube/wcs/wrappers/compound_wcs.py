@@ -65,8 +65,18 @@ class CompoundLowLevelWCS(BaseWCSWrapper):
     pixel_atol : `float`
         A tolerance used to check that the resulting pixel coordinates from
         ``world_to_pixel`` are the same from all WCSes.
+    validation : `str`
+        How the pixel coordinates of shared pixel dimensions returned by
+        ``world_to_pixel`` are checked for consistency. ``'full'`` checks every
+        coordinate, ``'sampled'`` checks an evenly strided sample of at most
+        ``validation_samples`` coordinates and ``'off'`` does no checking.
+        Default='sampled'
     """
-    def __init__(self, *wcs, mapping=None, pixel_atol=1e-8):
+    validation_samples = 1000
+
+    def __init__(self, *wcs, mapping=None, pixel_atol=1e-8, validation='sampled'):
+        if validation not in ('full', 'sampled', 'off'):
+            raise ValueError(f"validation must be 'full', 'sampled' or 'off', not {validation!r}.")
         self._wcs = wcs
 
         if not mapping:
@@ -78,6 +88,14 @@ class CompoundLowLevelWCS(BaseWCSWrapper):
 
         self.mapping = Mapping(mapping)
         self.atol = pixel_atol
+        self.validation = validation
+        self._inverse_mapping = self.mapping.inverse
+        # The pixel dimensions of the underlying WCSes which duplicate the first
+        # pixel dimension mapped to the same input, as (duplicate, first) pairs.
+        first = {ix: i for i, ix in reversed(list(enumerate(self.mapping.mapping)))}
+        self._shared_pixel_dims = tuple((i, first[ix])
+                                        for i, ix in enumerate(self.mapping.mapping)
+                                        if first[ix] != i)
 
         # Validate the pixel bounds and shape are consistent
         self.pixel_bounds
@@ -117,24 +135,34 @@ class CompoundLowLevelWCS(BaseWCSWrapper):
         return tuple(world_arrays)
 
     def world_to_pixel_values(self, *world_arrays):
-        pixel_arrays = []
+        pixel_arrays = [None] * self._all_pixel_n_dim
+        iw = ip = 0
         for w in self._wcs:
-            world_arrays_sub = world_arrays[:w.world_n_dim]
-            world_arrays = world_arrays[w.world_n_dim:]
-            pixel_arrays_sub = w.world_to_pixel_values(*world_arrays_sub)
-            if w.pixel_n_dim > 1:
-                pixel_arrays.extend(pixel_arrays_sub)
-            else:
-                pixel_arrays.append(pixel_arrays_sub)
+            pixel_arrays_sub = w.world_to_pixel_values(*world_arrays[iw:iw + w.world_n_dim])
+            if w.pixel_n_dim == 1:
+                pixel_arrays_sub = (pixel_arrays_sub,)
+            pixel_arrays[ip:ip + w.pixel_n_dim] = pixel_arrays_sub
+            iw += w.world_n_dim
+            ip += w.pixel_n_dim
 
-        pixel_arrays = tuple(pixel_arrays)
-        for i, ix in enumerate(self.mapping.mapping):
-            if not np.allclose(pixel_arrays[ix], pixel_arrays[i], atol=self.atol, equal_nan=True):
-                raise ValueError(
-                    "The world inputs for shared pixel axes did not result in a pixel "
-                    f"coordinate to within {self.atol} relative accuracy."
-                )
-        return self.mapping.inverse(*pixel_arrays)
+        if self.validation != 'off':
+            for i, first in self._shared_pixel_dims:
+                if not np.allclose(self._validation_sample(pixel_arrays[first]),
+                                   self._validation_sample(pixel_arrays[i]),
+                                   atol=self.atol, equal_nan=True):
+                    raise ValueError(
+                        "The world inputs for shared pixel axes did not result in a pixel "
+                        f"coordinate to within {self.atol} relative accuracy."
+                    )
+        return self._inverse_mapping(*pixel_arrays)
+
+    def _validation_sample(self, array):
+        array = np.asarray(array)
+        if self.validation == 'full' or array.size <= self.validation_samples:
+            return array
+        # Read an evenly strided sample of the flattened array without copying it.
+        step = -(-array.size // self.validation_samples)
+        return array.flat[np.arange(0, array.size, step)]
 
     @property
     def world_axis_object_components(self):
@@ -0,0 +1,143 @@
+"""
+Collapse chains of nested WCS wrappers into equivalent, shallower chains.
+"""
+import numbers
+
+from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
+
+from .compound_wcs import CompoundLowLevelWCS
+from .reordered_wcs import ReorderedLowLevelWCS
+from .resampled_wcs import ResampledLowLevelWCS
+
+__all__ = ['normalize_wrappers']
+
+
+def normalize_wrappers(wcs):
+    """
+    Collapse nested WCS wrappers into an equivalent, shallower chain of wrappers.
+
+    Repeatedly slicing and resampling a WCS wraps it in a new layer each time, and
+    every layer is walked on every transformation. This function fuses consecutive
+    wrappers of the same kind into one wrapper and moves slicing outside of
+    resampling so that such towers are reduced to at most
+    ``SlicedLowLevelWCS(ResampledLowLevelWCS(wcs))``, however many times the
+    WCS was sliced or resampled. Specifically:
+
+    * a `~astropy.wcs.wcsapi.wrappers.SlicedLowLevelWCS` of a ``SlicedLowLevelWCS``
+      becomes a single ``SlicedLowLevelWCS``;
+    * a `~ndcube.wcs.wrappers.ResampledLowLevelWCS` of a ``ResampledLowLevelWCS``
+      becomes a single ``ResampledLowLevelWCS``;
+    * a ``ResampledLowLevelWCS`` of a ``SlicedLowLevelWCS`` becomes a
+      ``SlicedLowLevelWCS`` of a ``ResampledLowLevelWCS``, provided the sliced lengths
+      are whole multiples of the resampling factors;
+    * a `~ndcube.wcs.wrappers.ReorderedLowLevelWCS` of a ``ReorderedLowLevelWCS``
+      becomes a single ``ReorderedLowLevelWCS``;
+    * a `~ndcube.wcs.wrappers.CompoundLowLevelWCS` containing another
+      ``CompoundLowLevelWCS`` is flattened into one ``CompoundLowLevelWCS``.
+
+    The WCSes within a ``CompoundLowLevelWCS`` are normalized but slices are
+    never moved inside one, so that the dropped world dimensions of a sliced
+    compound WCS are preserved.
+
+    Parameters
+    ----------
+    wcs: `~astropy.wcs.wcsapi.BaseLowLevelWCS`
+        The WCS to normalize.
+
+    Returns
+    -------
+    `~astropy.wcs.wcsapi.BaseLowLevelWCS`
+        An equivalent WCS. If nothing can be collapsed, ``wcs`` itself is returned.
+    """
+    if isinstance(wcs, SlicedLowLevelWCS):
+        inner = normalize_wrappers(wcs._wcs)
+        if inner is wcs._wcs:
+            return wcs
+        # SlicedLowLevelWCS combines its slices with those of a SlicedLowLevelWCS it wraps.
+        return SlicedLowLevelWCS(inner, wcs._slices_array)
+
+    if isinstance(wcs, ResampledLowLevelWCS):
+        inner = normalize_wrappers(wcs._wcs)
+        if isinstance(inner, ResampledLowLevelWCS):
+            # Outer pixel p is at inner pixel p * f + o, which is at
+            # underlying pixel (p * f + o) * f_inner + o_inner.
+            factor = [f * f_inner for f, f_inner in zip(wcs._factor, inner._factor)]
+            offset = [o * f_inner + o_inner
+                      for o, f_inner, o_inner in zip(wcs._offset, inner._factor, inner._offset)]
+            return ResampledLowLevelWCS(inner._wcs, factor, offset=offset)
+        if isinstance(inner, SlicedLowLevelWCS):
+            swapped = _resample_before_slice(inner, wcs._factor, wcs._offset)
+            if swapped is not None:
+                return swapped
+        if inner is wcs._wcs:
+            return wcs
+        return ResampledLowLevelWCS(inner, wcs._factor, offset=wcs._offset)
+
+    if isinstance(wcs, ReorderedLowLevelWCS):
+        inner = normalize_wrappers(wcs._wcs)
+        if isinstance(inner, ReorderedLowLevelWCS):
+            return ReorderedLowLevelWCS(inner._wcs,
+                                        [inner._pixel_order[i] for i in wcs._pixel_order],
+                                        [inner._world_order[i] for i in wcs._world_order])
+        if inner is wcs._wcs:
+            return wcs
+        return ReorderedLowLevelWCS(inner, wcs._pixel_order, wcs._world_order)
+
+    if isinstance(wcs, CompoundLowLevelWCS):
+        sub_wcses = [normalize_wrappers(w) for w in wcs._wcs]
+        if (all(new is old for new, old in zip(sub_wcses, wcs._wcs))
+                and not any(isinstance(w, CompoundLowLevelWCS) for w in sub_wcses)):
+            return wcs
+        new_wcses, new_mapping = [], []
+        i = 0
+        for sub_wcs in sub_wcses:
+            # The entries of the outer mapping which apply to the pixel axes of this WCS.
+            sub_mapping = wcs.mapping.mapping[i:i + sub_wcs.pixel_n_dim]
+            i += sub_wcs.pixel_n_dim
+            if isinstance(sub_wcs, CompoundLowLevelWCS):
+                new_wcses += list(sub_wcs._wcs)
+                new_mapping += [sub_mapping[j] for j in sub_wcs.mapping.mapping]
+            else:
+                new_wcses.append(sub_wcs)
+                new_mapping += list(sub_mapping)
+        return CompoundLowLevelWCS(*new_wcses, mapping=tuple(new_mapping), pixel_atol=wcs.atol,
+                                   validation=wcs.validation)
+
+    return wcs
+
+
+def _resample_before_slice(sliced_wcs, factor, offset):
+    """
+    Express a resampled, sliced WCS as a sliced, resampled WCS.
+
+    Returns `None` if this is not possible.
+    """
+    underlying = sliced_wcs._wcs
+    pixel_shape = underlying.pixel_shape
+    kept = list(sliced_wcs._pixel_keep)
+    new_factor = [1] * underlying.pixel_n_dim
+    new_offset = [0] * underlying.pixel_n_dim
+    new_slices = []
+    for ipixel, pixel_slice in enumerate(sliced_wcs._slices_pixel):
+        if isinstance(pixel_slice, numbers.Integral):
+            new_slices.append(pixel_slice)
+            continue
+        if pixel_slice.step not in (None, 1):
+            return None
+        i = kept.index(ipixel)
+        start = pixel_slice.start or 0
+        new_factor[ipixel] = factor[i]
+        new_offset[ipixel] = offset[i] + start
+        stop = pixel_slice.stop
+        if pixel_shape is not None:
+            stop = pixel_shape[ipixel] if stop is None else min(stop, pixel_shape[ipixel])
+        if stop is None:
+            new_slices.append(slice(0, None))
+            continue
+        # The sliced length must map to a whole number of resampled pixels.
+        length = (stop - start) / factor[i]
+        if length != int(length):
+            return None
+        new_slices.append(slice(0, int(length)))
+    resampled = normalize_wrappers(ResampledLowLevelWCS(underlying, new_factor, offset=new_offset))
+    return SlicedLowLevelWCS(resampled, new_slices[::-1])
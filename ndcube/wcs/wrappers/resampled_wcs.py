@@ -16,31 +16,46 @@ class ResampledLowLevelWCS(BaseWCSWrapper):
     factor : int or float or iterable
         The factor by which to increase the pixel size for each pixel
         axis. If a scalar, the same factor is used for all axes.
+    offset : int or float or iterable, optional
+        The location on the original pixel grid of pixel 0 of the resampled
+        pixel grid, for each pixel axis. If a scalar, the same offset is used
+        for all axes. For example, when combining blocks of ``n`` pixels the
+        centre of the first block is at ``(n - 1) / 2``. Default=0
     """
-    def __init__(self, wcs, factor):
+    def __init__(self, wcs, factor, offset=0):
         self._wcs = wcs
         if np.isscalar(factor):
             factor = [factor] * self.pixel_n_dim
         self._factor = factor
+        if np.isscalar(offset):
+            offset = [offset] * self.pixel_n_dim
+        self._offset = offset
 
     def pixel_to_world_values(self, *pixel_arrays):
-        pixel_arrays = [np.asarray(pixel_arrays[i]) * self._factor[i]
+        pixel_arrays = [np.asarray(pixel_arrays[i]) * self._factor[i] + self._offset[i]
                         for i in range(self.pixel_n_dim)]
         return self._wcs.pixel_to_world_values(*pixel_arrays)
 
     def world_to_pixel_values(self, *world_arrays):
         pixel_arrays = self._wcs.world_to_pixel_values(*world_arrays)
-        pixel_arrays = [np.asarray(pixel_arrays[i]) / self._factor[i]
+        if self.pixel_n_dim == 1:
+            pixel_arrays = (pixel_arrays,)
+        pixel_arrays = [(np.asarray(pixel_arrays[i]) - self._offset[i]) / self._factor[i]
                         for i in range(self.pixel_n_dim)]
-        return pixel_arrays
+        return pixel_arrays[0] if self.pixel_n_dim == 1 else pixel_arrays
 
     @property
     def pixel_shape(self):
-        return tuple(self._wcs.pixel_shape[i] / self._factor[i]
-                     for i in range(self.pixel_n_dim))
+        if self._wcs.pixel_shape is None:
+            return None
+        pixel_shape = [self._wcs.pixel_shape[i] / self._factor[i] for i in range(self.pixel_n_dim)]
+        # Keep whole numbers of pixels as ints so that the shape can be sliced.
+        return tuple(int(n) if float(n).is_integer() else n for n in pixel_shape)
 
     @property
     def pixel_bounds(self):
-        return tuple((self._wcs.pixel_bounds[i][0] / self._factor[i],
-                      self._wcs.pixel_bounds[i][1] / self._factor[i])
+        if self._wcs.pixel_bounds is None:
+            return None
+        return tuple(((self._wcs.pixel_bounds[i][0] - self._offset[i]) / self._factor[i],
+                      (self._wcs.pixel_bounds[i][1] - self._offset[i]) / self._factor[i])
                      for i in range(self.pixel_n_dim))
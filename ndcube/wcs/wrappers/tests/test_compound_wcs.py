@@ -173,3 +173,43 @@ def test_shared_pixel_axis_compound_3d(spectral_cube_3d_fitswcs, time_1d_fitswcs
 
     with pytest.raises(ValueError):
         wcs.world_to_pixel_values((14, -10, -2.6e+10, -7.0))
+
+
+@pytest.mark.parametrize("validation", ("full", "sampled", "off"))
+def test_shared_pixel_axis_validation(spectral_1d_fitswcs, time_1d_fitswcs, validation):
+    wcs = CompoundLowLevelWCS(spectral_1d_fitswcs, time_1d_fitswcs, mapping=(0, 0),
+                              validation=validation)
+    pixel = np.arange(5000.)
+    frequency, time = wcs.pixel_to_world_values(pixel)
+    np.testing.assert_allclose(wcs.world_to_pixel_values(frequency, time), [pixel])
+
+    # An inconsistent coordinate between the sampled ones is only caught by a full check.
+    time[1] += 1
+    if validation == "full":
+        with pytest.raises(ValueError, match="shared pixel axes"):
+            wcs.world_to_pixel_values(frequency, time)
+    else:
+        wcs.world_to_pixel_values(frequency, time)
+
+    # An inconsistent coordinate within the sample is caught by both checks.
+    time[0] += 1
+    if validation == "off":
+        wcs.world_to_pixel_values(frequency, time)
+    else:
+        with pytest.raises(ValueError, match="shared pixel axes"):
+            wcs.world_to_pixel_values(frequency, time)
+
+
+def test_bad_validation(spectral_1d_fitswcs, time_1d_fitswcs):
+    with pytest.raises(ValueError, match="validation must be"):
+        CompoundLowLevelWCS(spectral_1d_fitswcs, time_1d_fitswcs, validation="some")
+
+
+def test_permuted_mapping(spectral_1d_fitswcs, celestial_2d_fitswcs):
+    wcs = CompoundLowLevelWCS(celestial_2d_fitswcs, spectral_1d_fitswcs, mapping=(2, 0, 1))
+    pixel = (np.array([1., 2.]), np.array([3., 4.]), np.array([5., 6.]))
+    world = wcs.pixel_to_world_values(*pixel)
+    np.testing.assert_allclose(world[:2], celestial_2d_fitswcs.pixel_to_world_values(pixel[2],
+                                                                                     pixel[0]))
+    np.testing.assert_allclose(world[2], spectral_1d_fitswcs.pixel_to_world_values(pixel[1]))
+    np.testing.assert_allclose(wcs.world_to_pixel_values(*world), pixel)
@@ -0,0 +1,90 @@
+import numpy as np
+from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
+from numpy.testing import assert_allclose, assert_equal
+
+from ndcube.wcs.wrappers import (CompoundLowLevelWCS, ReorderedLowLevelWCS, ResampledLowLevelWCS,
+                                 normalize_wrappers)
+
+
+def assert_equivalent(wcs1, wcs2):
+    assert wcs1.pixel_n_dim == wcs2.pixel_n_dim
+    assert wcs1.world_n_dim == wcs2.world_n_dim
+    assert_equal(wcs1.axis_correlation_matrix, wcs2.axis_correlation_matrix)
+    assert tuple(wcs1.world_axis_physical_types) == tuple(wcs2.world_axis_physical_types)
+    if wcs2.pixel_shape is not None:
+        assert_allclose(wcs1.pixel_shape, wcs2.pixel_shape)
+    pixel = [np.linspace(0, 2, 5) + i / 3 for i in range(wcs1.pixel_n_dim)]
+    world1 = np.array(wcs1.pixel_to_world_values(*pixel))
+    world2 = np.array(wcs2.pixel_to_world_values(*pixel))
+    assert_allclose(world1, world2)
+    assert_allclose(wcs1.world_to_pixel_values(*world2), wcs2.world_to_pixel_values(*world2))
+
+
+def depth(wcs):
+    return 1 + depth(wcs._wcs) if hasattr(wcs, "_wcs") and not isinstance(wcs._wcs, tuple) else 0
+
+
+def test_resampled_of_resampled(spectral_cube_3d_fitswcs):
+    wcs = ResampledLowLevelWCS(ResampledLowLevelWCS(spectral_cube_3d_fitswcs, [2, 1, 3],
+                                                    offset=[0.5, 0, 1]),
+                               [1, 2, 2], offset=[0, 0.5, 0.5])
+    normalized = normalize_wrappers(wcs)
+    assert isinstance(normalized, ResampledLowLevelWCS)
+    assert normalized._wcs is spectral_cube_3d_fitswcs
+    assert_equivalent(normalized, wcs)
+
+
+def test_resampled_of_sliced(spectral_cube_3d_fitswcs):
+    spectral_cube_3d_fitswcs.pixel_shape = (10, 20, 30)
+    wcs = ResampledLowLevelWCS(SlicedLowLevelWCS(spectral_cube_3d_fitswcs,
+                                                 (slice(2, 12), 3, slice(None))),
+                               [2, 5], offset=[0.5, 2])
+    normalized = normalize_wrappers(wcs)
+    assert isinstance(normalized, SlicedLowLevelWCS)
+    assert isinstance(normalized._wcs, ResampledLowLevelWCS)
+    assert_equivalent(normalized, wcs)
+    assert_allclose(normalized.pixel_bounds or (), wcs.pixel_bounds or ())
+
+
+def test_resampled_of_sliced_not_whole_multiple(spectral_cube_3d_fitswcs):
+    spectral_cube_3d_fitswcs.pixel_shape = (10, 20, 30)
+    wcs = ResampledLowLevelWCS(SlicedLowLevelWCS(spectral_cube_3d_fitswcs, slice(1, 4)), 2)
+    normalized = normalize_wrappers(wcs)
+    assert isinstance(normalized, ResampledLowLevelWCS)
+    assert isinstance(normalized._wcs, SlicedLowLevelWCS)
+
+
+def test_sliced_resampled_tower(spectral_cube_3d_fitswcs):
+    spectral_cube_3d_fitswcs.pixel_shape = (64, 64, 64)
+    wcs = spectral_cube_3d_fitswcs
+    for _ in range(3):
+        wcs = SlicedLowLevelWCS(ResampledLowLevelWCS(wcs, 2, offset=0.5), slice(2, 18))
+    normalized = normalize_wrappers(wcs)
+    assert depth(wcs) == 6
+    assert depth(normalized) == 2
+    assert_equivalent(normalized, wcs)
+
+
+def test_reordered_of_reordered(spectral_cube_3d_fitswcs):
+    wcs = ReorderedLowLevelWCS(ReorderedLowLevelWCS(spectral_cube_3d_fitswcs, [1, 2, 0], [2, 0, 1]),
+                               [2, 1, 0], [0, 2, 1])
+    normalized = normalize_wrappers(wcs)
+    assert isinstance(normalized, ReorderedLowLevelWCS)
+    assert normalized._wcs is spectral_cube_3d_fitswcs
+    assert_equivalent(normalized, wcs)
+
+
+def test_compound_of_compound(spectral_1d_fitswcs, celestial_2d_fitswcs):
+    inner = CompoundLowLevelWCS(celestial_2d_fitswcs, spectral_1d_fitswcs)
+    wcs = CompoundLowLevelWCS(spectral_1d_fitswcs, inner)
+    normalized = normalize_wrappers(wcs)
+    assert isinstance(normalized, CompoundLowLevelWCS)
+    assert len(normalized._wcs) == 3
+    assert not any(isinstance(w, CompoundLowLevelWCS) for w in normalized._wcs)
+    assert_equivalent(normalized, wcs)
+
+
+def test_nothing_to_normalize(spectral_cube_3d_fitswcs):
+    assert normalize_wrappers(spectral_cube_3d_fitswcs) is spectral_cube_3d_fitswcs
+    wcs = SlicedLowLevelWCS(ResampledLowLevelWCS(spectral_cube_3d_fitswcs, 2), 0)
+    assert normalize_wrappers(wcs) is wcs
@@ -19,7 +19,7 @@ ResampledLowLevelWCS Transformation
 
 This transformation has 2 pixel and 2 world dimensions
 
-Array shape (Numpy order): (2.3333333333333335, 15.0)
+Array shape (Numpy order): (2.3333333333333335, 15)
 
 Pixel Dim  Axis Name  Data size  Bounds
         0  None              15  (-2.5, 12.5)
@@ -108,3 +108,17 @@ def test_scalar_factor(celestial_wcs):
     assert_allclose(wcs.array_index_to_world_values(*pixel_scalar[::-1]), world_scalar)
     assert_allclose(wcs.world_to_pixel_values(*world_scalar), pixel_scalar)
     assert_allclose(wcs.world_to_array_index_values(*world_scalar), [4, 2])
+
+
+@pytest.mark.parametrize('celestial_wcs',
+                         ['celestial_2d_ape14_wcs', 'celestial_2d_fitswcs'],
+                         indirect=True)
+def test_offset(celestial_wcs):
+
+    wcs = ResampledLowLevelWCS(celestial_wcs, 2, offset=[0.5, 1])
+
+    pixel_scalar = (2.3, 4.3)
+    world_scalar = celestial_wcs.pixel_to_world_values(5.1, 9.6)
+    assert_allclose(wcs.pixel_to_world_values(*pixel_scalar), world_scalar)
+    assert_allclose(wcs.world_to_pixel_values(*world_scalar), pixel_scalar)
+    assert_allclose(wcs.pixel_bounds, ((-0.75, 2.25), (0., 3.)))